@@ -0,0 +1,98 @@
+"""
+Runs the benchmarks: python -m benchmark [--filter TEXT] [--output FILE]
+[--compare BASELINE] [--tolerance 0.1]
+Exits with status 1 when a benchmark is slower than the baseline beyond the tolerance.
+
+python -m benchmark --import-time [--budget MS] measures the import time of the
+engine instead, and exits with status 1 when it's over the budget, or when the
+modules of the repo alone are over theirs.
+"""
+
+import argparse
+import os
+import sys
+
+# headless rendering
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from .import_time import (  # noqa: E402
+    IMPORT_TIME_BUDGET_MS,
+    OWN_IMPORT_TIME_BUDGET_MS,
+    format_import_time,
+    measure_import_time,
+)
+from .report import (  # noqa: E402
+    compare,
+    format_comparisons,
+    format_results,
+    get_regressions,
+    load_ops_per_second,
+    save_results,
+)
+from .suite import get_benchmarks, run_benchmark  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks of the engine hot paths.")
+    parser.add_argument(
+        "-k", "--filter", default="", help="Only run benchmarks containing this text"
+    )
+    parser.add_argument("--runs", type=int, default=50, help="Timed runs per benchmark")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed runs first")
+    parser.add_argument("-o", "--output", help="Save the results to this JSON file")
+    parser.add_argument(
+        "-c", "--compare", help="JSON file of a previous run to compare with"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed relative drop of operations per second when comparing",
+    )
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="Measure the import time of the engine instead",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=IMPORT_TIME_BUDGET_MS,
+        help="Allowed import time of the engine in milliseconds",
+    )
+    args = parser.parse_args()
+
+    if args.import_time:
+        import_time = measure_import_time()
+        print(format_import_time(import_time, args.budget))
+        is_over_budget = (
+            import_time.total_ms > args.budget
+            or import_time.own_ms > OWN_IMPORT_TIME_BUDGET_MS
+        )
+        return 1 if is_over_budget else 0
+
+    benchmarks = [
+        benchmark for benchmark in get_benchmarks() if args.filter in benchmark.name
+    ]
+    results = []
+    for benchmark in benchmarks:
+        print(f"running {benchmark.name}", file=sys.stderr)
+        results.append(run_benchmark(benchmark, args.runs, args.warmup))
+    print(format_results(results))
+
+    if args.output:
+        save_results(results, args.output)
+
+    if args.compare:
+        comparisons = compare(results, load_ops_per_second(args.compare))
+        print()
+        print(format_comparisons(comparisons))
+        regressions = get_regressions(comparisons, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the baseline")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Import time of the engine, measured with python -X importtime in fresh processes"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+ENGINE_MODULE = "src.engine.engine"
+# allowed import time of the engine, pygame and numpy included; about 250 ms here
+IMPORT_TIME_BUDGET_MS = 400.0
+# allowed import time of the modules of the repo alone, without their third party
+# dependencies, which is less dependent on the machine; about 35 ms here
+OWN_IMPORT_TIME_BUDGET_MS = 80.0
+# the modules of the repo
+OWN_PACKAGE = "src"
+# dependencies only needed by some features, which are imported on first use
+DEFERRED_MODULES = ("shapely", "numpy.typing", "csv")
+
+_root = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    module: str
+    # cumulative import time of each run
+    runs_ms: Sequence[float]
+    # import time of the modules of the repo alone in each run
+    own_runs_ms: Sequence[float]
+    # cumulative import time of the modules directly imported by the module, in the
+    # fastest run
+    dependencies_ms: dict[str, float]
+    # every module imported while importing the module
+    imported_modules: frozenset[str]
+
+    @property
+    def total_ms(self) -> float:
+        """The fastest run, the least disturbed by the rest of the machine"""
+        return min(self.runs_ms)
+
+    @property
+    def own_ms(self) -> float:
+        """The fastest run of the modules of the repo"""
+        return min(self.own_runs_ms)
+
+    def get_slowest_dependencies(self, num: int) -> list[tuple[str, float]]:
+        return sorted(self.dependencies_ms.items(), key=lambda item: -item[1])[:num]
+
+
+def measure_import_time(module: str = ENGINE_MODULE, runs: int = 5) -> ImportTime:
+    """
+    Imports the module in new interpreters, after a first untimed import that
+    compiles the bytecode.
+    """
+    _run_import(module)
+    fastest: ImportTime | None = None
+    runs_ms: list[float] = []
+    own_runs_ms: list[float] = []
+    for _ in range(runs):
+        import_time = _parse_import_times(module, _run_import(module))
+        runs_ms.append(import_time.total_ms)
+        own_runs_ms.append(import_time.own_ms)
+        if fastest is None or import_time.total_ms < fastest.total_ms:
+            fastest = import_time
+    assert fastest
+    return ImportTime(
+        module,
+        runs_ms,
+        own_runs_ms,
+        fastest.dependencies_ms,
+        fastest.imported_modules,
+    )
+
+
+def format_import_time(import_time: ImportTime, budget_ms: float) -> str:
+    lines = [
+        f"import {import_time.module}: {import_time.total_ms:.1f} ms "
+        f"(budget {budget_ms:.0f} ms)",
+        f"  modules of {OWN_PACKAGE} alone: {import_time.own_ms:.1f} ms "
+        f"(budget {OWN_IMPORT_TIME_BUDGET_MS:.0f} ms)",
+    ]
+    for name, duration_ms in import_time.get_slowest_dependencies(5):
+        lines.append(f"  {name:<30} {duration_ms:>8.1f} ms")
+    return "\n".join(lines)
+
+
+def _run_import(module: str) -> str:
+    env = {**os.environ, "SDL_VIDEODRIVER": "dummy", "PYGAME_HIDE_SUPPORT_PROMPT": "1"}
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return process.stderr
+
+
+def _parse_import_times(module: str, output: str) -> ImportTime:
+    """
+    Lines look like: import time: self [us] | cumulative | imported package, with
+    the package indented by its depth, and come after the lines of their imports.
+    """
+    # depth, name, self and cumulative milliseconds
+    entries: list[tuple[int, str, float, float]] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative, name = line.removeprefix("import time:").split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append(
+            (depth, name.strip(), int(self_time) / 1000, int(cumulative) / 1000)
+        )
+    index = next(
+        i
+        for i, (depth, name, _, _) in enumerate(entries)
+        if depth == 0 and name == module
+    )
+    start = index
+    while start > 0 and entries[start - 1][0] > 0:
+        start -= 1
+    subtree = entries[start:index]
+    own_ms = sum(
+        self_ms
+        for _, name, self_ms, _ in entries[start : index + 1]
+        if name == OWN_PACKAGE or name.startswith(OWN_PACKAGE + ".")
+    )
+    return ImportTime(
+        module,
+        [entries[index][3]],
+        [own_ms],
+        {name: ms for depth, name, _, ms in subtree if depth == 1},
+        frozenset(name for _, name, _, _ in subtree),
+    )
@@ -0,0 +1,96 @@
+"""Storage of the benchmark results as JSON and comparison between runs"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import platform
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .suite import BenchmarkResult
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_ops_per_second: float
+    ops_per_second: float
+
+    @property
+    def change(self) -> float:
+        """Relative change of the throughput, negative if slower"""
+        return self.ops_per_second / self.baseline_ops_per_second - 1
+
+
+def results_to_json(results: Sequence[BenchmarkResult]) -> dict[str, Any]:
+    return {
+        "metadata": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": {
+            result.name: {**asdict(result), "ops_per_second": result.ops_per_second}
+            for result in results
+        },
+    }
+
+
+def save_results(results: Sequence[BenchmarkResult], path: str | Path) -> None:
+    with open(path, "w") as file:
+        json.dump(results_to_json(results), file, indent=2)
+        file.write("\n")
+
+
+def load_ops_per_second(path: str | Path) -> dict[str, float]:
+    with open(path) as file:
+        data = json.load(file)
+    return {
+        name: float(result["ops_per_second"])
+        for name, result in data["results"].items()
+    }
+
+
+def compare(
+    results: Sequence[BenchmarkResult], baseline: dict[str, float]
+) -> list[Comparison]:
+    """Comparisons of the benchmarks present in both runs"""
+    return [
+        Comparison(result.name, baseline[result.name], result.ops_per_second)
+        for result in results
+        if result.name in baseline
+    ]
+
+
+def get_regressions(
+    comparisons: Sequence[Comparison], tolerance: float
+) -> list[Comparison]:
+    return [comparison for comparison in comparisons if comparison.change < -tolerance]
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    name_width = max((len(result.name) for result in results), default=0)
+    lines = [
+        f"{'benchmark':<{name_width}}  {'median ms':>10}  {'p90 ms':>10}  {'ops/s':>10}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.name:<{name_width}}  {result.median_ms:>10.3f}  "
+            f"{result.p90_ms:>10.3f}  {result.ops_per_second:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: Sequence[Comparison]) -> str:
+    name_width = max((len(comparison.name) for comparison in comparisons), default=0)
+    lines = [f"{'benchmark':<{name_width}}  {'baseline':>10}  {'ops/s':>10}  change"]
+    for comparison in comparisons:
+        lines.append(
+            f"{comparison.name:<{name_width}}  "
+            f"{comparison.baseline_ops_per_second:>10.1f}  "
+            f"{comparison.ops_per_second:>10.1f}  {comparison.change:+.1%}"
+        )
+    return "\n".join(lines)
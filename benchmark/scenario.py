@@ -0,0 +1,87 @@
+"""Reproducible game states to benchmark"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from src.config import Config
+from src.engine.engine import Engine
+from src.entity import Metro
+from src.gui.gui import get_main_surface_height
+from src.tools.strategies import split_stations
+
+
+@dataclass(frozen=True)
+class ScenarioSize:
+    name: str
+    num_stations: int
+    num_paths: int
+    metros_per_path: int
+
+
+SCENARIO_SIZES = (
+    ScenarioSize("small", num_stations=20, num_paths=3, metros_per_path=1),
+    ScenarioSize("medium", num_stations=100, num_paths=5, metros_per_path=3),
+    ScenarioSize("large", num_stations=400, num_paths=5, metros_per_path=8),
+)
+
+
+@contextmanager
+def override_config(**values: Any) -> Iterator[None]:
+    previous = {name: getattr(Config, name) for name in values}
+    for name, value in values.items():
+        setattr(Config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(Config, name, value)
+
+
+def create_engine(size: ScenarioSize, seed: int = 0) -> Engine:
+    """
+    Engine with size.num_stations stations and size.num_paths paths through all of
+    them, each one with size.metros_per_path metros and passengers at every station.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    with override_config(
+        num_stations=size.num_stations,
+        min_distance=_get_min_distance(size.num_stations),
+    ):
+        engine = Engine()
+    stations = sorted(
+        engine._components.stations,  # pyright: ignore [reportPrivateUsage]
+        key=lambda station: (station.position.left, station.position.top),
+    )
+    engine.build_network(
+        [
+            ([station.id for station in stations_of_path], False)
+            for stations_of_path in split_stations(stations, size.num_paths)
+        ]
+    )
+    _add_metros(engine, size.metros_per_path)
+    engine._passenger_spawner._spawn_passengers()  # pyright: ignore [reportPrivateUsage]
+    return engine
+
+
+def _get_min_distance(num_stations: int) -> float:
+    # keep the stations well below the densest packing of the screen
+    area = Config.screen_width * get_main_surface_height()
+    return min(Config.min_distance, 0.5 * math.sqrt(area / num_stations))
+
+
+def _add_metros(engine: Engine, metros_per_path: int) -> None:
+    components = engine._components  # pyright: ignore [reportPrivateUsage]
+    for path in components.paths:
+        while len(path.metros) < metros_per_path:
+            metro = Metro(components.passengers_mediator)
+            path.add_metro(metro)
+            components.metros.append(metro)
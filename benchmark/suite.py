@@ -0,0 +1,181 @@
+"""Benchmarks of the engine hot paths"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from itertools import cycle
+
+import numpy as np
+import pygame
+
+from src.config import Config, transfer_penalty
+from src.engine.engine import Engine
+from src.engine.game_components import GameComponents
+from src.geometry.point import Point
+from src.graph.routing import Router
+
+from .scenario import SCENARIO_SIZES, ScenarioSize, create_engine
+
+Operation = Callable[[], object]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    # builds the state and returns the operation to time
+    setup: Callable[[], Operation]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    runs: int
+    min_ms: float
+    median_ms: float
+    p90_ms: float
+
+    @property
+    def ops_per_second(self) -> float:
+        return 1000 / self.median_ms if self.median_ms else float("inf")
+
+
+def run_benchmark(benchmark: Benchmark, runs: int, warmup: int) -> BenchmarkResult:
+    operation = benchmark.setup()
+    durations_ms = np.empty(runs, dtype=np.float64)
+    for i in range(-warmup, runs):
+        start = time.perf_counter()
+        operation()
+        duration_ms = (time.perf_counter() - start) * 1000
+        if i >= 0:
+            durations_ms[i] = duration_ms
+    p50, p90 = np.percentile(durations_ms, [50, 90])
+    return BenchmarkResult(
+        benchmark.name,
+        runs,
+        float(durations_ms.min()),
+        float(p50),
+        float(p90),
+    )
+
+
+def get_benchmarks() -> list[Benchmark]:
+    benchmarks: list[Benchmark] = []
+    for size in SCENARIO_SIZES:
+        benchmarks.extend(_get_benchmarks_for_size(size))
+    return benchmarks
+
+
+def _get_benchmarks_for_size(size: ScenarioSize) -> Iterator[Benchmark]:
+    def setup_engine() -> tuple[Engine, GameComponents]:
+        engine = create_engine(size)
+        # shapes get their position when drawn, as in the game
+        engine.render(pygame.Surface((Config.screen_width, Config.screen_height)))
+        return engine, engine._components  # pyright: ignore [reportPrivateUsage]
+
+    # new routers, so the graph and the trees are built as after a network change
+    def build_routing_graph() -> Operation:
+        _, components = setup_engine()
+        return lambda: Router(transfer_penalty).update(
+            components.stations, components.paths
+        )
+
+    def find_route_between_ends() -> Operation:
+        _, components = setup_engine()
+        origin = components.paths[0].stations[0]
+        shape_type = components.paths[-1].stations[-1].shape.type
+        destinations = [
+            station
+            for station in components.stations
+            if station.shape.type == shape_type
+        ]
+
+        def find_route() -> None:
+            router = Router(transfer_penalty)
+            router.update(components.stations, components.paths)
+            router.find_route(origin, shape_type, destinations)
+
+        return find_route
+
+    def find_travel_plans() -> Operation:
+        engine, _ = setup_engine()
+        finder = engine._travel_plan_finder  # pyright: ignore [reportPrivateUsage]
+        return finder.find_travel_plan_for_passengers
+
+    def increment_time() -> Operation:
+        engine, _ = setup_engine()
+        dt_ms = round(1000 / Config.framerate)
+        return lambda: engine.increment_time(dt_ms)
+
+    def update_segments() -> Operation:
+        _, components = setup_engine()
+        path = max(components.paths, key=lambda path: len(path.stations))
+        index = len(path.stations) // 2
+        middle = path.stations[index]
+
+        def update() -> None:
+            # alternately remove and put back a middle station, as the path
+            # commands do, so every call has segments to rebuild
+            if path.stations[index] is middle:
+                del path.stations[index]
+            else:
+                path.stations.insert(index, middle)
+            path.update_segments()
+
+        return update
+
+    def build_network() -> Operation:
+        engine, components = setup_engine()
+        designs = [
+            ([station.id for station in path.stations], path.is_looped)
+            for path in components.paths
+        ]
+        return lambda: engine.build_network(designs)
+
+    def spawn_passengers() -> Operation:
+        engine, components = setup_engine()
+        spawner = engine._passenger_spawner  # pyright: ignore [reportPrivateUsage]
+
+        def spawn() -> None:
+            # make room so every tick spawns at every station (this is timed too)
+            for station in components.stations:
+                for passenger in station.passengers[:]:
+                    station._remove_passenger(  # pyright: ignore [reportPrivateUsage]
+                        passenger
+                    )
+            spawner._spawn_passengers()  # pyright: ignore [reportPrivateUsage]
+
+        return spawn
+
+    def hit_test() -> Operation:
+        engine, _ = setup_engine()
+        rng = np.random.default_rng(0)
+        positions = cycle(
+            [
+                Point(x, y)
+                for x, y in zip(
+                    rng.uniform(0, Config.screen_width, 1000).tolist(),
+                    rng.uniform(0, Config.screen_height, 1000).tolist(),
+                )
+            ]
+        )
+        return lambda: engine.get_containing_entity(next(positions))
+
+    def render() -> Operation:
+        engine, _ = setup_engine()
+        screen = pygame.Surface((Config.screen_width, Config.screen_height))
+        return lambda: engine.render(screen)
+
+    for name, setup in [
+        ("router.update", build_routing_graph),
+        ("router.find_route", find_route_between_ends),
+        ("travel_plan_finder.find_travel_plans", find_travel_plans),
+        ("engine.increment_time", increment_time),
+        ("path.update_segments", update_segments),
+        ("engine.build_network", build_network),
+        ("spawner.spawn_passengers", spawn_passengers),
+        ("engine.get_containing_entity", hit_test),
+        ("engine.render", render),
+    ]:
+        yield Benchmark(f"{name}[{size.name}]", setup)
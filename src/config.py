@@ -41,6 +41,10 @@ max_num_paths = 5
 _path_width = 10
 path_order_shift = _path_width
 
+# routing
+# distance in pixels that changing paths at a station is worth to passengers
+transfer_penalty = 200
+
 # button
 button_color = (180, 180, 180)
 button_size = 30
@@ -57,7 +61,23 @@ gui_height_proportion = 0.12
 
 # text
 score_font_size = 50
+debug_font_size = 18
 score_display_coords = (20, 20)
+text_cache_size = 256
+
+# observation
+observation_max_stations = 64
+# width and height the rendered frames are downsampled to
+pixel_observation_size = (320, 168)
+
+# profiling
+profiler_buffer_size = 600
+# the waits and journeys are counted in bins of ticks, the last bin counting
+# everything longer
+journey_histogram_bin_ticks = 10
+journey_histogram_num_bins = 720
+# the frame durations are logged once per interval
+frame_metrics_interval_ms = 5000
 
 # debug
 _unfilled_shapes = False
@@ -73,6 +93,9 @@ class Config:
     # components
     passenger_spawning = _PassengerSpawningConfig
     # stations
+    # about 20 stations fit at this distance on the default screen; with more, the
+    # distance is reduced a few times, and InfeasibleDensityError is raised if they
+    # still don't fit
     min_distance = station_size * 3
     num_stations = 10
     # path
@@ -83,4 +106,6 @@ class Config:
     unfilled_shapes = _unfilled_shapes
     padding_segments_color = _padding_segments_color
     debug_path_and_metros = False
+    # recompute the cached segment edges positions to check them
+    debug_location_cache = False
     stop = False
@@ -1,14 +1,17 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Final
 
 import pygame
 
 from src.config import Config
 from src.engine.game_components import GameComponents
+from src.engine.journey_recorder import LatencyStats
 from src.entity import Passenger
 from src.geometry.point import Point
+from src.gui.text_cache import TextCache
 
 from .passenger_spawner import TravelPlansMapping
+from .profiler import PhaseStats
 
 LINE_HEIGHT = 30
 DEFAULT_SIZE = (300, 300)
@@ -27,6 +30,7 @@ class DebugRenderer:
     def __init__(self, components: GameComponents) -> None:
         self._components = components
         self._size = DEFAULT_SIZE
+        self._debug_surf: pygame.surface.Surface | None = None
 
     @property
     def _position(self) -> Point:
@@ -44,6 +48,7 @@ class DebugRenderer:
         travel_plans: TravelPlansMapping,
         ms_until_next_spawn: float,
         speed: float,
+        phase_stats: Mapping[str, PhaseStats],
     ) -> None:
         gui = self._components.gui
         font = gui.small_font
@@ -58,21 +63,32 @@ class DebugRenderer:
             ms_until_next_spawn=ms_until_next_spawn,
             is_creating_path=is_creating_path,
             game_speed=speed,
+            phase_stats=phase_stats,
         )
         number_of_lines = len(debug_texts)
 
-        self._size = (self._size[0], (number_of_lines + 1) * LINE_HEIGHT)
-        self._debug_surf = pygame.Surface(self._size)
-        self._debug_surf.set_alpha(180)
-        self._debug_surf.fill(self.bg_color)
+        debug_surf = self._get_debug_surface(
+            (self._size[0], (number_of_lines + 1) * LINE_HEIGHT)
+        )
+        debug_surf.fill(self.bg_color)
 
-        self._draw_debug_texts(debug_texts, font, self.fg_color)
+        self._draw_debug_texts(
+            debug_surf, debug_texts, gui.text_cache, font, self.fg_color
+        )
 
         screen.blit(
-            self._debug_surf,
+            debug_surf,
             self._position.to_tuple(),
         )
 
+    def _get_debug_surface(self, size: tuple[int, int]) -> pygame.surface.Surface:
+        """Returns the debug panel surface, only creating a new one if its size changes"""
+        if self._debug_surf is None or size != self._size:
+            self._size = size
+            self._debug_surf = pygame.Surface(self._size)
+            self._debug_surf.set_alpha(180)
+        return self._debug_surf
+
     def _define_debug_texts(
         self,
         mouse_pos: Point | None,
@@ -83,6 +99,7 @@ class DebugRenderer:
         ms_until_next_spawn: float,
         is_creating_path: bool,
         game_speed: float,
+        phase_stats: Mapping[str, PhaseStats],
     ) -> list[str]:
         debug_texts: list[str] = []
         if mouse_pos:
@@ -95,14 +112,42 @@ class DebugRenderer:
         debug_texts.append(f"Number of travel plans: {len(travel_plans)}")
         debug_texts.append(f"Until next spawning: { ( ms_until_next_spawn/1000):.1f}")
         debug_texts.append(f"Is creating path: { ( is_creating_path)}")
+        for phase, stats in phase_stats.items():
+            debug_texts.append(
+                f"{phase} p50/p99: {stats.p50_ms:.2f}/{stats.p99_ms:.2f} ms"
+            )
+        journey_recorder = self._components.journey_recorder
+        for name, histogram in (
+            ("Wait", journey_recorder.wait),
+            ("Journey", journey_recorder.journey),
+        ):
+            if histogram.num_samples:
+                latency = histogram.get_stats()
+                percentiles = "/".join(
+                    _format_ticks(latency, ticks)
+                    for ticks in (
+                        latency.p50_ticks,
+                        latency.p95_ticks,
+                        latency.p99_ticks,
+                    )
+                )
+                debug_texts.append(f"{name} p50/p95/p99: {percentiles} ticks")
         return debug_texts
 
     def _draw_debug_texts(
         self,
+        debug_surf: pygame.surface.Surface,
         debug_texts: list[str],
+        text_cache: TextCache,
         font: pygame.font.Font,
         fg_color: tuple[int, int, int],
     ) -> None:
         for i, text in enumerate(debug_texts):
-            debug_label = font.render(text, True, fg_color)
-            self._debug_surf.blit(debug_label, (10, 10 + i * LINE_HEIGHT))
+            debug_label = text_cache.render(font, text, fg_color)
+            debug_surf.blit(debug_label, (10, 10 + i * LINE_HEIGHT))
+
+
+def _format_ticks(latency: LatencyStats, ticks: float) -> str:
+    if latency.is_saturated(ticks):
+        return f">={ticks:.0f}"
+    return f"{ticks:.0f}"
@@ -0,0 +1,229 @@
+"""
+Demand models decide how many passengers appear at each station on every spawn
+tick, and optionally their destination shape.
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+from src.entity import Station
+from src.geometry.type import ShapeType
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    IntArray = npt.NDArray[np.intp]
+    FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class Demand:
+    # index of the origin station of each new passenger
+    origins: IntArray
+    # destination shape of each passenger, None to draw one different from the origin
+    destinations: Sequence[ShapeType] | None = None
+
+    def __len__(self) -> int:
+        return len(self.origins)
+
+
+class DemandModel(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def get_demand(
+        self, stations: Sequence[Station], time_ms: float, elapsed_ms: float
+    ) -> Demand:
+        """
+        Passengers that arrived during the elapsed_ms previous to time_ms, the time
+        since the game started.
+        """
+        raise NotImplementedError
+
+
+class UniformDemand(DemandModel):
+    """One passenger per station and tick, with a uniformly random destination"""
+
+    __slots__ = ()
+
+    def get_demand(
+        self, stations: Sequence[Station], time_ms: float, elapsed_ms: float
+    ) -> Demand:
+        return Demand(np.arange(len(stations), dtype=np.intp))
+
+
+class PoissonDemand(DemandModel):
+    """Poisson arrivals at each station, at a rate of passengers per second"""
+
+    __slots__ = ("_rate",)
+
+    def __init__(self, rate: float) -> None:
+        assert rate >= 0
+        self._rate: Final = rate
+
+    def get_demand(
+        self, stations: Sequence[Station], time_ms: float, elapsed_ms: float
+    ) -> Demand:
+        rate = self._get_rate(time_ms, elapsed_ms)
+        return Demand(_get_poisson_origins(len(stations), rate * elapsed_ms / 1000))
+
+    def _get_rate(self, time_ms: float, elapsed_ms: float) -> float:
+        return self._rate
+
+
+class TimeOfDayDemand(PoissonDemand):
+    """
+    Poisson arrivals whose rate is scaled by a daily profile. The profile values are
+    evenly spaced over the day and linearly interpolated, wrapping around midnight.
+    """
+
+    __slots__ = ("_profile", "_profile_times", "_day_length_ms")
+
+    def __init__(
+        self, rate: float, profile: Sequence[float], day_length_ms: float
+    ) -> None:
+        super().__init__(rate)
+        assert profile and min(profile) >= 0
+        assert day_length_ms > 0
+        self._profile: Final = np.array([*profile, profile[0]], dtype=np.float64)
+        self._profile_times: Final = np.linspace(0, 1, len(self._profile))
+        self._day_length_ms: Final = day_length_ms
+
+    def _get_rate(self, time_ms: float, elapsed_ms: float) -> float:
+        # the rate in the middle of the elapsed interval
+        day_time = ((time_ms - elapsed_ms / 2) % self._day_length_ms) / (
+            self._day_length_ms
+        )
+        return self._rate * float(
+            np.interp(day_time, self._profile_times, self._profile)
+        )
+
+
+class GravityDemand(DemandModel):
+    """
+    Poisson arrivals at each station whose destination is a station of another shape,
+    chosen with a probability proportional to distance ** -distance_exponent.
+    """
+
+    __slots__ = ("_rate", "_distance_exponent", "_stations", "_cumulative_weights")
+
+    def __init__(self, rate: float, distance_exponent: float = 2) -> None:
+        assert rate >= 0
+        self._rate: Final = rate
+        self._distance_exponent: Final = distance_exponent
+        # stations the weights were computed for, to recompute them when they change
+        self._stations: list[Station] = []
+        self._cumulative_weights: FloatArray = np.zeros((0, 0))
+
+    def get_demand(
+        self, stations: Sequence[Station], time_ms: float, elapsed_ms: float
+    ) -> Demand:
+        if list(stations) != self._stations:
+            self._stations = list(stations)
+            self._cumulative_weights = self._get_cumulative_weights(stations)
+        origins = _get_poisson_origins(len(stations), self._rate * elapsed_ms / 1000)
+        if len(origins) == 0:
+            return Demand(origins, [])
+        cumulative_weights = self._cumulative_weights[origins]
+        # origins without any station of another shape can't have passengers
+        origins = origins[cumulative_weights[:, -1] > 0]
+        cumulative_weights = cumulative_weights[cumulative_weights[:, -1] > 0]
+        draws = np.random.rand(len(origins)) * cumulative_weights[:, -1]
+        destination_stations = (cumulative_weights <= draws[:, None]).sum(axis=1)
+        return Demand(
+            origins,
+            [stations[i].shape.type for i in destination_stations.tolist()],
+        )
+
+    def _get_cumulative_weights(self, stations: Sequence[Station]) -> FloatArray:
+        if not stations:
+            return np.zeros((0, 0))
+        positions = np.array(
+            [(station.position.left, station.position.top) for station in stations],
+            dtype=np.float64,
+        )
+        distances = np.hypot(
+            *np.moveaxis(positions[:, None, :] - positions[None, :, :], -1, 0)
+        )
+        types = [station.shape.type for station in stations]
+        same_type = np.array([[a == b for b in types] for a in types])
+        with np.errstate(divide="ignore"):
+            weights = np.power(distances, -self._distance_exponent)
+        weights[same_type | ~np.isfinite(weights)] = 0
+        cumulative_weights: FloatArray = np.cumsum(weights, axis=1)
+        return cumulative_weights
+
+
+class TraceDemand(DemandModel):
+    """Replays recorded passenger arrivals"""
+
+    __slots__ = ("_times", "_origins", "_destinations")
+
+    def __init__(
+        self,
+        times_ms: Sequence[float],
+        origins: Sequence[int],
+        destinations: Sequence[ShapeType],
+    ) -> None:
+        assert len(times_ms) == len(origins) == len(destinations)
+        order = np.argsort(np.asarray(times_ms, dtype=np.float64), kind="stable")
+        self._times: Final = np.asarray(times_ms, dtype=np.float64)[order]
+        self._origins: Final = np.asarray(origins, dtype=np.intp)[order]
+        self._destinations: Final = [destinations[i] for i in order.tolist()]
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> TraceDemand:
+        """
+        Loads a CSV file with the columns time_ms, station (its index) and destination
+        (a shape type name, like CIRCLE).
+        """
+        import csv
+
+        times_ms: list[float] = []
+        origins: list[int] = []
+        destinations: list[ShapeType] = []
+        with open(path, newline="") as file:
+            for row in csv.DictReader(file):
+                times_ms.append(float(row["time_ms"]))
+                origins.append(int(row["station"]))
+                destinations.append(ShapeType[row["destination"].strip().upper()])
+        return cls(times_ms, origins, destinations)
+
+    def get_demand(
+        self, stations: Sequence[Station], time_ms: float, elapsed_ms: float
+    ) -> Demand:
+        start, end = np.searchsorted(
+            self._times, [time_ms - elapsed_ms, time_ms], side="right"
+        ).tolist()
+        if time_ms - elapsed_ms <= 0:
+            # the first tick also replays the events at the start of the game
+            start = 0
+        origins = self._origins[start:end]
+        # events of stations that don't exist in this game are dropped
+        is_valid = origins < len(stations)
+        return Demand(
+            origins[is_valid],
+            [
+                destination
+                for destination, valid in zip(
+                    self._destinations[start:end], is_valid.tolist()
+                )
+                if valid
+            ],
+        )
+
+
+def _get_poisson_origins(num_stations: int, expected: float) -> IntArray:
+    if num_stations == 0 or expected <= 0 or not math.isfinite(expected):
+        return np.zeros(0, dtype=np.intp)
+    counts = np.random.poisson(expected, size=num_stations)
+    origins: IntArray = np.repeat(np.arange(num_stations, dtype=np.intp), counts)
+    return origins
@@ -1,26 +1,28 @@
-import pprint
 import sys
-from typing import Final, NoReturn
+from typing import Final, NoReturn, Sequence
 
 import pygame
 
-from src.config import Config
-from src.entity import Station, get_random_stations
+from src.config import Config, profiler_buffer_size
+from src.entity import Metro, Path, Station, get_random_stations
+from src.entity.ids import EntityId
+from src.exceptions import InvalidActionError
 from src.geometry.point import Point
 from src.gui.gui import GUI, get_gui_height, get_main_surface_height
 from src.gui.path_button import PathButton
 from src.passengers_mediator import PassengersMediator
 
+from .demand import DemandModel
 from .game_components import GameComponents
 from .game_renderer import GameRenderer
+from .journey_recorder import JourneyStats
 from .passenger_mover import PassengerMover
 from .passenger_spawner import PassengerSpawner, TravelPlansMapping
-from .path_manager import PathManager
+from .path_manager import PathEnd, PathManager
+from .profiler import PhaseProfiler, PhaseStats
 from .status import EngineStatus
 from .travel_plan_finder import TravelPlanFinder
 
-pp = pprint.PrettyPrinter(indent=4)
-
 
 class Engine:
     __slots__ = (
@@ -32,14 +34,15 @@ class Engine:
         "_passenger_mover",
         "_game_renderer",
         "_travel_plan_finder",
+        "_metro_arrivals",
         "steps_allowed",
+        "profiler",
     )
 
     _gui_height: Final = get_gui_height()
     _main_surface_height: Final = get_main_surface_height()
 
     def __init__(self) -> None:
-        pygame.font.init()
         passengers_mediator = PassengersMediator()
 
         # components
@@ -56,6 +59,7 @@ class Engine:
         self.showing_debug = False
         self.game_speed = 1
         self.steps_allowed: int | None = None
+        self.profiler: Final = PhaseProfiler(profiler_buffer_size)
 
         # UI
         self._game_renderer = GameRenderer(self._components)
@@ -71,6 +75,9 @@ class Engine:
             self._travel_plan_finder,
         )
         self._passenger_mover = PassengerMover(self._components)
+        # metros that arrived at a station since passengers last moved
+        self._metro_arrivals: Final[list[Metro]] = []
+        passengers_mediator.add_arrival_listener(self._metro_arrivals.append)
 
         self._components.gui.init(self.path_manager.max_num_paths)
 
@@ -81,6 +88,9 @@ class Engine:
     def set_clock(self, clock: pygame.time.Clock) -> None:
         self._components.gui.clock = clock
 
+    def set_demand_model(self, demand_model: DemandModel) -> None:
+        self._passenger_spawner.demand_model = demand_model
+
     def get_containing_entity(self, position: Point) -> Station | PathButton | None:
         for station in self._components.stations:
             if station.contains(position):
@@ -95,13 +105,18 @@ class Engine:
         dt_ms *= self.game_speed
         self._passenger_spawner.increment_time(dt_ms)
 
+        profiler = self.profiler
         # is this needed? or is better only to find travel plans when
         # something change (paths)
-        self._travel_plan_finder.find_travel_plan_for_passengers()
-        self._move_passengers()
-
-        self._move_metros(dt_ms)
-        self._passenger_spawner.manage_passengers_spawning()
+        with profiler.measure("travel plans"):
+            self._travel_plan_finder.find_travel_plan_for_passengers()
+        with profiler.measure("passengers"):
+            self._move_passengers()
+
+        with profiler.measure("metros"):
+            self._move_metros(dt_ms)
+        with profiler.measure("spawning"):
+            self._passenger_spawner.manage_passengers_spawning()
         if self.steps_allowed is not None:
             self.steps_allowed -= 1
             if self.steps_allowed == 0:
@@ -116,19 +131,55 @@ class Engine:
         return len(self._components.paths) < self.path_manager.max_num_paths
 
     def render(self, screen: pygame.surface.Surface) -> None:
-        self._game_renderer.render_game(
-            screen,
-            gui_height=self._gui_height,
-            main_surface_height=self._main_surface_height,
-            paths=self._components.paths,
-            travel_plans=self.travel_plans,
-            editing_intermediate_stations=self.path_manager.editing_intermediate_stations,
-            is_creating_path=bool(self.path_manager.is_creating_or_expanding),
-            ms_until_next_spawn=self._passenger_spawner.ms_until_next_spawn,
-            showing_debug=self.showing_debug,
-            game_speed=self.game_speed,
+        with self.profiler.measure("render"):
+            self._render(screen)
+
+    # commands, for agents that don't go through the mouse events; they raise
+    # InvalidActionError without changing anything when they can't be applied
+
+    def create_path(self, station_ids: Sequence[EntityId], loop: bool = False) -> Path:
+        return self.path_manager.create_path(self._get_stations(station_ids), loop)
+
+    def build_network(
+        self, designs: Sequence[tuple[Sequence[EntityId], bool]]
+    ) -> list[Path]:
+        """Replaces all the paths, given as their station ids and whether they loop"""
+        return self.path_manager.build_network(
+            [(self._get_stations(station_ids), loop) for station_ids, loop in designs]
+        )
+
+    def extend_path(
+        self, path_id: EntityId, end: PathEnd, station_id: EntityId
+    ) -> None:
+        self.path_manager.extend_path(
+            self._get_path(path_id), end, self._get_stations([station_id])[0]
+        )
+
+    def insert_station(
+        self, path_id: EntityId, index: int, station_id: EntityId
+    ) -> None:
+        self.path_manager.insert_station(
+            self._get_path(path_id), index, self._get_stations([station_id])[0]
+        )
+
+    def remove_station(self, path_id: EntityId, station_id: EntityId) -> None:
+        self.path_manager.remove_station(
+            self._get_path(path_id), self._get_stations([station_id])[0]
         )
 
+    def remove_path(self, path_id: EntityId) -> None:
+        path = self._get_path(path_id)
+        self.path_manager.check_not_editing()
+        self.path_manager.remove_path(path)
+
+    def get_phase_stats(self) -> dict[str, PhaseStats]:
+        """p50 and p99 durations of the last ticks, by phase"""
+        return self.profiler.get_all_stats()
+
+    def get_journey_stats(self) -> JourneyStats:
+        """p50, p95 and p99 waits and journeys in ticks, overall, by station and path"""
+        return self._components.journey_recorder.get_stats()
+
     def toggle_pause(self) -> None:
         if self.is_paused:
             self.steps_allowed = None
@@ -161,15 +212,44 @@ class Engine:
     ### private methods ###
     #######################
 
+    def _get_stations(self, station_ids: Sequence[EntityId]) -> list[Station]:
+        stations = {station.id: station for station in self._components.stations}
+        for station_id in station_ids:
+            if station_id not in stations:
+                raise InvalidActionError(f"There is no station {station_id}")
+        return [stations[station_id] for station_id in station_ids]
+
+    def _get_path(self, path_id: EntityId) -> Path:
+        for path in self._components.paths:
+            if path.id == path_id:
+                return path
+        raise InvalidActionError(f"There is no path {path_id}")
+
+    def _render(self, screen: pygame.surface.Surface) -> None:
+        self._game_renderer.render_game(
+            screen,
+            gui_height=self._gui_height,
+            main_surface_height=self._main_surface_height,
+            paths=self._components.paths,
+            travel_plans=self.travel_plans,
+            editing_intermediate_stations=self.path_manager.editing_intermediate_stations,
+            is_creating_path=bool(self.path_manager.is_creating_or_expanding),
+            ms_until_next_spawn=self._passenger_spawner.ms_until_next_spawn,
+            showing_debug=self.showing_debug,
+            game_speed=self.game_speed,
+            phase_stats=self.get_phase_stats() if self.showing_debug else {},
+        )
+
     def _move_metros(self, dt_ms: int) -> None:
         for path in self._components.paths:
             for metro in path.metros:
                 path.move_metro(metro, dt_ms)
 
     def _move_passengers(self) -> None:
-        for metro in self._components.metros:
-
-            if not metro.current_station:
-                continue
-
-            self._passenger_mover.move_passengers(metro)
+        arrivals = self._metro_arrivals[:]
+        self._metro_arrivals.clear()
+        for metro in arrivals:
+            # the metro may have been removed, or left the station
+            station = metro.current_station
+            if station and metro in self._components.metros:
+                self._passenger_mover.on_metro_arrival(metro, station)
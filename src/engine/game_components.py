@@ -5,6 +5,8 @@ from src.entity import Metro, Passenger, Path, Station
 from src.gui.gui import GUI
 from src.protocols.passenger_mediator import PassengersMediatorProtocol
 
+from .journey_recorder import JourneyRecorder
+from .passenger_queues import PassengerQueues
 from .status import EngineStatus
 
 
@@ -19,6 +21,12 @@ class GameComponents:
         init=False, default_factory=PathColorManager
     )
     gui: GUI = field(init=False, default_factory=GUI)
+    passenger_queues: PassengerQueues = field(
+        init=False, default_factory=PassengerQueues
+    )
+    journey_recorder: JourneyRecorder = field(
+        init=False, default_factory=JourneyRecorder
+    )
 
     @property
     def passengers(self) -> list[Passenger]:
@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
 import pygame
 
@@ -9,6 +9,7 @@ from src.entity import Passenger, Path
 from .game_components import GameComponents
 from .passenger_spawner import TravelPlansMapping
 from .path_edition import EditingIntermediateStations
+from .profiler import PhaseStats
 
 
 class GameRenderer:
@@ -31,6 +32,7 @@ class GameRenderer:
         ms_until_next_spawn: float,
         showing_debug: bool,
         game_speed: float,
+        phase_stats: Mapping[str, PhaseStats],
     ) -> None:
         main_surface = screen.subsurface(
             0, gui_height, Config.screen_width, main_surface_height
@@ -53,6 +55,7 @@ class GameRenderer:
                 travel_plans,
                 ms_until_next_spawn,
                 game_speed,
+                phase_stats,
             )
 
     def _draw_paths(
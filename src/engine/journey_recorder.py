@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+from src.config import journey_histogram_bin_ticks, journey_histogram_num_bins
+from src.entity import Passenger, Station
+from src.entity.ids import EntityId
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    TickColumn = npt.NDArray[np.int64]
+
+NO_TICK: Final = -1
+_INITIAL_NUM_ROWS: Final = 1024
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    p50_ticks: float
+    p95_ticks: float
+    p99_ticks: float
+    num_samples: int
+    # samples at or beyond max_ticks, counted in the last bin
+    num_overflows: int
+    max_ticks: float
+
+    def is_saturated(self, ticks: float) -> bool:
+        """Whether a percentile is in the last bin with overflows, a lower bound only"""
+        return self.num_overflows > 0 and ticks >= self.max_ticks
+
+
+@dataclass(frozen=True)
+class JourneyStats:
+    # waits at stations, before each boarding
+    wait: LatencyStats | None
+    # from spawning to arriving
+    journey: LatencyStats | None
+    wait_by_station: dict[EntityId, LatencyStats]
+    # journeys by the station where passengers spawned
+    journey_by_station: dict[EntityId, LatencyStats]
+    # waits by the path boarded
+    wait_by_path: dict[EntityId, LatencyStats]
+    # rides from boarding to getting off the path
+    ride_by_path: dict[EntityId, LatencyStats]
+
+
+class StreamingHistogram:
+    """
+    Counts of values in bins of fixed width, the last bin also counting the larger
+    values. Adding a value is O(1); percentiles are the upper edge of their bin, so
+    a percentile among the larger values is only known to be at least max_value,
+    num_overflows telling how many there are.
+    """
+
+    __slots__ = ("bin_width", "_counts", "num_samples", "num_overflows")
+
+    def __init__(self, bin_width: int, num_bins: int) -> None:
+        assert bin_width > 0 and num_bins > 0
+        self.bin_width: Final = bin_width
+        self._counts: Final = np.zeros(num_bins, dtype=np.int64)
+        self.num_samples = 0
+        self.num_overflows = 0
+
+    @property
+    def max_value(self) -> int:
+        return self.bin_width * len(self._counts)
+
+    def add(self, value: int) -> None:
+        index = max(value, 0) // self.bin_width
+        if index >= len(self._counts):
+            index = len(self._counts) - 1
+            self.num_overflows += 1
+        self._counts[index] += 1
+        self.num_samples += 1
+
+    def get_percentiles(self, percentiles: Sequence[float]) -> list[float]:
+        assert self.num_samples
+        cumulative = np.cumsum(self._counts)
+        ranks = np.ceil(np.asarray(percentiles) / 100 * self.num_samples)
+        indexes = np.searchsorted(cumulative, np.maximum(ranks, 1))
+        return [float((index + 1) * self.bin_width) for index in indexes.tolist()]
+
+    def get_stats(self) -> LatencyStats:
+        p50, p95, p99 = self.get_percentiles([50, 95, 99])
+        return LatencyStats(
+            p50, p95, p99, self.num_samples, self.num_overflows, float(self.max_value)
+        )
+
+
+class JourneyRecorder:
+    """
+    Spawn and first boarding ticks of the passengers in the game, stored in columns
+    with a row per passenger, and histograms of the waits, rides and journeys,
+    overall, by station and by path. Every event is O(1).
+
+    The row of a passenger is freed when they arrive and reused by a later spawn,
+    so the columns only grow with the number of passengers in the game at once.
+    Their spawn, first boarding and arrival ticks are first appended to the
+    journey columns, which grow by a row per finished journey.
+    Passengers that weren't spawned by the game have no row, and their events are
+    ignored.
+    """
+
+    __slots__ = (
+        "_bin_ticks",
+        "_num_bins",
+        "_rows",
+        "num_rows",
+        "_free_rows",
+        "_spawn_ticks",
+        "_board_ticks",
+        "_last_event_ticks",
+        "_origins",
+        "num_journeys",
+        "_journey_spawn_ticks",
+        "_journey_board_ticks",
+        "_arrival_ticks",
+        "wait",
+        "journey",
+        "_wait_by_station",
+        "_journey_by_station",
+        "_wait_by_path",
+        "_ride_by_path",
+    )
+
+    def __init__(
+        self,
+        bin_ticks: int = journey_histogram_bin_ticks,
+        num_bins: int = journey_histogram_num_bins,
+    ) -> None:
+        self._bin_ticks: Final = bin_ticks
+        self._num_bins: Final = num_bins
+        # rows by passenger num id
+        self._rows: Final[dict[int, int]] = {}
+        # rows used so far, some of them freed
+        self.num_rows = 0
+        self._free_rows: Final[list[int]] = []
+        self._spawn_ticks = _create_column(_INITIAL_NUM_ROWS)
+        self._board_ticks = _create_column(_INITIAL_NUM_ROWS)
+        # when the passenger started waiting or riding
+        self._last_event_ticks = _create_column(_INITIAL_NUM_ROWS)
+        self._origins: list[EntityId] = []
+        # finished journeys, append-only
+        self.num_journeys = 0
+        self._journey_spawn_ticks = _create_column(_INITIAL_NUM_ROWS)
+        self._journey_board_ticks = _create_column(_INITIAL_NUM_ROWS)
+        self._arrival_ticks = _create_column(_INITIAL_NUM_ROWS)
+        self.wait: Final = StreamingHistogram(bin_ticks, num_bins)
+        self.journey: Final = StreamingHistogram(bin_ticks, num_bins)
+        self._wait_by_station: Final[dict[EntityId, StreamingHistogram]] = {}
+        self._journey_by_station: Final[dict[EntityId, StreamingHistogram]] = {}
+        self._wait_by_path: Final[dict[EntityId, StreamingHistogram]] = {}
+        self._ride_by_path: Final[dict[EntityId, StreamingHistogram]] = {}
+
+    ######################
+    ### public methods ###
+    ######################
+
+    def on_spawn(self, passenger: Passenger, station: Station, tick: int) -> None:
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._origins[row] = station.id
+        else:
+            row = self.num_rows
+            if row == len(self._spawn_ticks):
+                self._grow()
+            self.num_rows += 1
+            self._origins.append(station.id)
+        self._rows[passenger.num_id] = row
+        self._spawn_ticks[row] = tick
+        self._last_event_ticks[row] = tick
+
+    def on_board(
+        self, passenger: Passenger, station: Station, path_id: EntityId, tick: int
+    ) -> None:
+        row = self._rows.get(passenger.num_id)
+        if row is None:
+            return
+        wait = tick - int(self._last_event_ticks[row])
+        self.wait.add(wait)
+        self._get_histogram(self._wait_by_station, station.id).add(wait)
+        self._get_histogram(self._wait_by_path, path_id).add(wait)
+        if self._board_ticks[row] == NO_TICK:
+            self._board_ticks[row] = tick
+        self._last_event_ticks[row] = tick
+
+    def on_alight(self, passenger: Passenger, path_id: EntityId, tick: int) -> None:
+        row = self._rows.get(passenger.num_id)
+        if row is None:
+            return
+        self._record_ride(row, path_id, tick)
+
+    def on_arrival(self, passenger: Passenger, path_id: EntityId, tick: int) -> None:
+        row = self._rows.get(passenger.num_id)
+        if row is None:
+            return
+        self._record_ride(row, path_id, tick)
+        journey = tick - int(self._spawn_ticks[row])
+        self.journey.add(journey)
+        self._get_histogram(self._journey_by_station, self._origins[row]).add(journey)
+        self._append_journey(row, tick)
+        self._free_row(passenger)
+
+    def get_stats(self) -> JourneyStats:
+        return JourneyStats(
+            wait=self.wait.get_stats() if self.wait.num_samples else None,
+            journey=self.journey.get_stats() if self.journey.num_samples else None,
+            wait_by_station=_get_stats_by_id(self._wait_by_station),
+            journey_by_station=_get_stats_by_id(self._journey_by_station),
+            wait_by_path=_get_stats_by_id(self._wait_by_path),
+            ride_by_path=_get_stats_by_id(self._ride_by_path),
+        )
+
+    @property
+    def num_passengers(self) -> int:
+        """Passengers with a row, spawned and not arrived yet"""
+        return len(self._rows)
+
+    @property
+    def spawn_ticks(self) -> TickColumn:
+        """NO_TICK for the free rows"""
+        return self._spawn_ticks[: self.num_rows]
+
+    @property
+    def board_ticks(self) -> TickColumn:
+        """First boarding of each passenger, NO_TICK if they haven't boarded yet"""
+        return self._board_ticks[: self.num_rows]
+
+    @property
+    def journey_spawn_ticks(self) -> TickColumn:
+        """Spawn of each finished journey, in order of arrival"""
+        return self._journey_spawn_ticks[: self.num_journeys]
+
+    @property
+    def journey_board_ticks(self) -> TickColumn:
+        """First boarding of each finished journey"""
+        return self._journey_board_ticks[: self.num_journeys]
+
+    @property
+    def arrival_ticks(self) -> TickColumn:
+        """Arrival of each finished journey"""
+        return self._arrival_ticks[: self.num_journeys]
+
+    def get_row(self, passenger: Passenger) -> int | None:
+        return self._rows.get(passenger.num_id)
+
+    #######################
+    ### private methods ###
+    #######################
+
+    def _record_ride(self, row: int, path_id: EntityId, tick: int) -> None:
+        ride = tick - int(self._last_event_ticks[row])
+        self._get_histogram(self._ride_by_path, path_id).add(ride)
+        self._last_event_ticks[row] = tick
+
+    def _append_journey(self, row: int, tick: int) -> None:
+        index = self.num_journeys
+        if index == len(self._arrival_ticks):
+            num_journeys = 2 * index
+            self._journey_spawn_ticks = _resize_column(
+                self._journey_spawn_ticks, num_journeys
+            )
+            self._journey_board_ticks = _resize_column(
+                self._journey_board_ticks, num_journeys
+            )
+            self._arrival_ticks = _resize_column(self._arrival_ticks, num_journeys)
+        self._journey_spawn_ticks[index] = self._spawn_ticks[row]
+        self._journey_board_ticks[index] = self._board_ticks[row]
+        self._arrival_ticks[index] = tick
+        self.num_journeys += 1
+
+    def _free_row(self, passenger: Passenger) -> None:
+        row = self._rows.pop(passenger.num_id)
+        self._spawn_ticks[row] = NO_TICK
+        self._board_ticks[row] = NO_TICK
+        self._last_event_ticks[row] = NO_TICK
+        self._free_rows.append(row)
+
+    def _get_histogram(
+        self, histograms: dict[EntityId, StreamingHistogram], id: EntityId
+    ) -> StreamingHistogram:
+        histogram = histograms.get(id)
+        if histogram is None:
+            histogram = histograms[id] = StreamingHistogram(
+                self._bin_ticks, self._num_bins
+            )
+        return histogram
+
+    def _grow(self) -> None:
+        num_rows = 2 * len(self._spawn_ticks)
+        self._spawn_ticks = _resize_column(self._spawn_ticks, num_rows)
+        self._board_ticks = _resize_column(self._board_ticks, num_rows)
+        self._last_event_ticks = _resize_column(self._last_event_ticks, num_rows)
+
+
+def _create_column(num_rows: int) -> TickColumn:
+    return np.full(num_rows, NO_TICK, dtype=np.int64)
+
+
+def _resize_column(column: TickColumn, num_rows: int) -> TickColumn:
+    resized = _create_column(num_rows)
+    resized[: len(column)] = column
+    return resized
+
+
+def _get_stats_by_id(
+    histograms: dict[EntityId, StreamingHistogram],
+) -> dict[EntityId, LatencyStats]:
+    return {id: histogram.get_stats() for id, histogram in histograms.items()}
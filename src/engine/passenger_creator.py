@@ -1,40 +1,66 @@
 from __future__ import annotations
 
-import random
 from collections.abc import Sequence
-from typing import Final, Mapping
+from typing import Final
+
+import numpy as np
 
 from src.config import passenger_color, passenger_size
 from src.entity import Passenger, Station
 from src.geometry.type import ShapeType
 from src.utils import get_shape_from_type
 
-ShapeTypesToOthers = Mapping[ShapeType, Sequence[ShapeType]]
-
 
 class PassengerCreator:
-    __slots__ = ("_shape_types_to_others",)
-    _shape_types_to_others: Final[ShapeTypesToOthers]
+    """
+    Creates passengers whose destination is a shape type different from the one of
+    their station. The shape types are kept in a table where the row of each type
+    lists the indexes of the other types, so destinations are drawn in one call.
+    """
+
+    __slots__ = ("_shape_types", "_type_indexes", "_others")
 
     def __init__(self, station_types: Sequence[ShapeType]):
-        self._shape_types_to_others = self._map_shape_types_to_others(station_types)
+        self._shape_types: Final = list(dict.fromkeys(station_types))
+        self._type_indexes: Final = {
+            shape_type: i for i, shape_type in enumerate(self._shape_types)
+        }
+        num_types = len(self._shape_types)
+        all_indexes = np.arange(num_types)
+        # row i holds every type index except i: shape (num_types, num_types - 1)
+        self._others: Final = np.array(
+            [np.delete(all_indexes, i) for i in range(num_types)], dtype=np.intp
+        ).reshape(num_types, max(num_types - 1, 0))
 
     # public methods
 
-    def create_passenger(self, station: Station) -> Passenger:
-        other_shape_types = self._shape_types_to_others[station.shape.type]
-        destination_shape_type = random.choice(other_shape_types)
-        return _create_passenger_with_shape_type(destination_shape_type)
+    def can_create_passengers(self) -> bool:
+        return len(self._shape_types) > 1
 
-    # private methods
+    def create_passengers(self, stations: Sequence[Station]) -> list[Passenger]:
+        """Creates one passenger for each station"""
+        assert self.can_create_passengers()
+        if not stations:
+            return []
+        rows = np.fromiter(
+            (self._type_indexes[station.shape.type] for station in stations),
+            dtype=np.intp,
+            count=len(stations),
+        )
+        columns = np.random.randint(self._others.shape[1], size=len(stations))
+        destinations = self._others[rows, columns]
+        return [
+            _create_passenger_with_shape_type(self._shape_types[destination])
+            for destination in destinations.tolist()
+        ]
 
-    def _map_shape_types_to_others(
-        self, station_types: Sequence[ShapeType]
-    ) -> ShapeTypesToOthers:
-        return {
-            shape_type: [x for x in station_types if x != shape_type]
-            for shape_type in set(station_types)
-        }
+    def create_passengers_with_destinations(
+        self, destination_types: Sequence[ShapeType]
+    ) -> list[Passenger]:
+        return [
+            _create_passenger_with_shape_type(shape_type)
+            for shape_type in destination_types
+        ]
 
 
 def _create_passenger_with_shape_type(shape_type: ShapeType) -> Passenger:
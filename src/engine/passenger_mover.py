@@ -4,7 +4,6 @@ from typing import Final
 from src.entity import Metro, Passenger, Station
 
 from .game_components import GameComponents
-from .path_finder import find_next_path_for_passenger_at_station
 
 
 class PassengerMover:
@@ -15,24 +14,22 @@ class PassengerMover:
 
     # public methods
 
-    def move_passengers(self, metro: Metro) -> None:
-        station = metro.current_station
-        assert station
-
-        to_arrive: list[Passenger] = []
-        from_metro_to_station: list[Passenger] = []
-        from_station_to_metro: list[Passenger] = []
+    def on_metro_arrival(self, metro: Metro, station: Station) -> None:
+        """
+        Passengers get off and on the metro, once per stop. Only the passengers
+        queued for the metro or the station are visited.
+        """
+        queues = self._components.passenger_queues
+        assert metro.path_id
 
         # queue
-        for passenger in metro.passengers:
-            if have_same_shape_type(station, passenger):
-                to_arrive.append(passenger)
-            elif self._is_next_planned_station(station, passenger):
-                from_metro_to_station.append(passenger)
-
-        for passenger in station.passengers:
-            if self._metro_is_in_passenger_next_path(passenger, metro):
-                from_station_to_metro.append(passenger)
+        to_arrive = queues.get_arriving(metro, station)
+        from_metro_to_station = [
+            passenger
+            for passenger in queues.get_alighting(metro, station)
+            if not have_same_shape_type(station, passenger)
+        ]
+        from_station_to_metro = queues.get_boarding(station, metro.path_id)
 
         # process
         self._make_passengers_arrive(to_arrive, metro)
@@ -45,27 +42,16 @@ class PassengerMover:
 
     # private methods
 
-    def _is_next_planned_station(self, station: Station, passenger: Passenger) -> bool:
-        travel_plan = passenger.travel_plan
-        assert travel_plan
-        return travel_plan.get_next_station() == station
-
-    def _metro_is_in_passenger_next_path(
-        self, passenger: Passenger, metro: Metro
-    ) -> bool:
-        travel_plan = passenger.travel_plan
-        assert travel_plan
-        next_path = travel_plan.next_path
-        if not next_path:
-            return False
-        return next_path.id == metro.path_id
-
     def _make_passengers_arrive(
         self, to_arrive: Sequence[Passenger], metro: Metro
     ) -> None:
+        assert metro.path_id
+        tick = self._components.status.game_time
         for passenger in to_arrive:
             passenger.is_at_destination = True
+            self._components.passenger_queues.remove_riding(metro, passenger)
             metro.passenger_arrives(passenger)
+            self._components.journey_recorder.on_arrival(passenger, metro.path_id, tick)
             passenger.travel_plan = None
             self._components.status.score += 1
 
@@ -85,9 +71,17 @@ class PassengerMover:
         station: Station,
         from_station_to_metro: Sequence[Passenger],
     ) -> None:
+        queues = self._components.passenger_queues
+        assert metro.path_id
+        tick = self._components.status.game_time
         for passenger in from_station_to_metro:
             if metro.has_room():
+                queues.remove_waiting(station, metro.path_id, passenger)
                 station.move_passenger(passenger, metro)
+                queues.add_riding(metro, passenger)
+                self._components.journey_recorder.on_board(
+                    passenger, station, metro.path_id, tick
+                )
 
     def _move_passenger_to_station(
         self,
@@ -95,12 +89,16 @@ class PassengerMover:
         metro: Metro,
         station: Station,
     ) -> None:
+        queues = self._components.passenger_queues
+        queues.remove_riding(metro, passenger)
         metro.move_passenger(passenger, station)
         travel_plan = passenger.travel_plan
         assert travel_plan
-        travel_plan.increment_next_station()
-        find_next_path_for_passenger_at_station(
-            self._components.paths, travel_plan, station
+        travel_plan.complete_leg()
+        queues.add_waiting(station, passenger)
+        assert metro.path_id
+        self._components.journey_recorder.on_alight(
+            passenger, metro.path_id, self._components.status.game_time
         )
 
 
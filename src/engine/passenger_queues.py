@@ -0,0 +1,117 @@
+from collections.abc import Callable
+from typing import Final
+
+from src.entity import Metro, Passenger, Station
+from src.entity.ids import EntityId
+from src.geometry.type import ShapeType
+
+# dicts without values keep the insertion order, as queues do
+_Queue = dict[Passenger, None]
+
+
+class PassengerQueues:
+    """
+    Passengers indexed by the stops that concern them, so a metro arriving at a
+    station only visits the passengers it affects: the waiting ones by station and
+    next path id, the riding ones by metro and alighting station, and by metro and
+    destination shape.
+
+    Entries are added when a passenger gets a travel plan or changes of holder,
+    and are checked when read, stale ones being dropped.
+    """
+
+    __slots__ = ("_waiting", "_alighting", "_arriving")
+
+    def __init__(self) -> None:
+        self._waiting: Final[dict[Station, dict[EntityId, _Queue]]] = {}
+        self._alighting: Final[dict[Metro, dict[Station, _Queue]]] = {}
+        self._arriving: Final[dict[Metro, dict[ShapeType, _Queue]]] = {}
+
+    ######################
+    ### public methods ###
+    ######################
+
+    def add_waiting(self, station: Station, passenger: Passenger) -> None:
+        next_path = passenger.travel_plan.next_path if passenger.travel_plan else None
+        if next_path:
+            queues = self._waiting.setdefault(station, {})
+            queues.setdefault(next_path.id, {})[passenger] = None
+
+    def add_riding(self, metro: Metro, passenger: Passenger) -> None:
+        shape_type = passenger.destination_shape.type
+        self._arriving.setdefault(metro, {}).setdefault(shape_type, {})[
+            passenger
+        ] = None
+        next_station = (
+            passenger.travel_plan.next_station if passenger.travel_plan else None
+        )
+        if next_station:
+            buckets = self._alighting.setdefault(metro, {})
+            buckets.setdefault(next_station, {})[passenger] = None
+
+    def get_boarding(self, station: Station, path_id: EntityId) -> list[Passenger]:
+        """Passengers waiting at the station for the path, in arrival order"""
+        queue = self._waiting.get(station, {}).get(path_id)
+        if not queue:
+            return []
+        return _prune(queue, lambda p: _is_waiting_for(p, station, path_id))
+
+    def get_alighting(self, metro: Metro, station: Station) -> list[Passenger]:
+        """Passengers of the metro planning to get off at the station"""
+        queue = self._alighting.get(metro, {}).get(station)
+        if not queue:
+            return []
+        return _prune(queue, lambda p: _is_riding_to(p, metro, station))
+
+    def get_arriving(self, metro: Metro, station: Station) -> list[Passenger]:
+        """Passengers of the metro whose destination has the shape of the station"""
+        queue = self._arriving.get(metro, {}).get(station.shape.type)
+        if not queue:
+            return []
+        return _prune(queue, lambda p: p in metro.passengers)
+
+    def remove_waiting(
+        self, station: Station, path_id: EntityId, passenger: Passenger
+    ) -> None:
+        """Passengers that were never queued are ignored"""
+        self._waiting.get(station, {}).get(path_id, {}).pop(passenger, None)
+
+    def remove_riding(self, metro: Metro, passenger: Passenger) -> None:
+        """Riders that were never queued are ignored"""
+        shape_type = passenger.destination_shape.type
+        self._arriving.get(metro, {}).get(shape_type, {}).pop(passenger, None)
+        for queue in self._alighting.get(metro, {}).values():
+            queue.pop(passenger, None)
+
+    def forget_metro(self, metro: Metro) -> None:
+        self._alighting.pop(metro, None)
+        self._arriving.pop(metro, None)
+
+    def forget_path(self, path_id: EntityId) -> None:
+        for queues in self._waiting.values():
+            queues.pop(path_id, None)
+
+
+def _prune(queue: _Queue, is_valid: Callable[[Passenger], bool]) -> list[Passenger]:
+    passengers: list[Passenger] = []
+    for passenger in list(queue):
+        if is_valid(passenger):
+            passengers.append(passenger)
+        else:
+            del queue[passenger]
+    return passengers
+
+
+def _is_waiting_for(passenger: Passenger, station: Station, path_id: EntityId) -> bool:
+    travel_plan = passenger.travel_plan
+    if not travel_plan or passenger not in station.passengers:
+        return False
+    next_path = travel_plan.next_path
+    return next_path is not None and next_path.id == path_id
+
+
+def _is_riding_to(passenger: Passenger, metro: Metro, station: Station) -> bool:
+    travel_plan = passenger.travel_plan
+    if not travel_plan or passenger not in metro.passengers:
+        return False
+    return travel_plan.next_station == station
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
-from typing import Final, Mapping
+from typing import TYPE_CHECKING, Final, Mapping, Sequence
+
+import numpy as np
 
 from src.config import Config
+from src.entity.holder import Holder
 from src.entity.passenger import Passenger
+from src.entity.station import Station
 from src.geometry.type import ShapeType
 from src.protocols.travel_plan import TravelPlanProtocol
 
+from .demand import Demand, DemandModel, UniformDemand
 from .game_components import GameComponents
 from .passenger_creator import PassengerCreator
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 TravelPlansMapping = Mapping[Passenger, TravelPlanProtocol]
 
 
@@ -18,15 +26,31 @@ class PassengerSpawner:
         "_components",
         "_interval_step",
         "_ms_until_next_spawn",
+        "_passenger_creator",
+        "_stations_snapshot",
+        "_time_ms",
+        "_last_spawn_time_ms",
+        "demand_model",
     )
 
-    def __init__(self, components: GameComponents, interval_step: int):
+    def __init__(
+        self,
+        components: GameComponents,
+        interval_step: int,
+        demand_model: DemandModel | None = None,
+    ):
         self._components = components
         self._interval_step: Final[int] = interval_step * 1000
 
         self._ms_until_next_spawn: float = (
             self._interval_step / Config.passenger_spawning.first_time_divisor
         )
+        self._passenger_creator: PassengerCreator | None = None
+        # stations the creator was built for, to rebuild it when they change
+        self._stations_snapshot: list[Station] = []
+        self._time_ms: float = 0
+        self._last_spawn_time_ms: float = 0
+        self.demand_model: DemandModel = demand_model or UniformDemand()
 
     ######################
     ### public methods ###
@@ -34,6 +58,7 @@ class PassengerSpawner:
 
     def increment_time(self, dt_ms: int) -> None:
         self._ms_until_next_spawn -= dt_ms
+        self._time_ms += dt_ms
 
     def manage_passengers_spawning(self) -> None:
         if self._is_passenger_spawn_time():
@@ -49,23 +74,81 @@ class PassengerSpawner:
     #######################
 
     def _spawn_passengers(self) -> None:
-        station_types = self._get_station_shape_types()
-        passenger_creator = PassengerCreator(station_types)
-        for station in self._components.stations:
-            if not station.has_room():
-                continue
-            passenger = passenger_creator.create_passenger(station)
-            station.add_new_passenger(passenger)
+        passenger_creator = self._get_passenger_creator()
+        if not passenger_creator.can_create_passengers():
+            return
+        stations = self._components.stations
+        demand = self.demand_model.get_demand(
+            stations, self._time_ms, self._time_ms - self._last_spawn_time_ms
+        )
+        self._last_spawn_time_ms = self._time_ms
+        origins, destinations = _get_origins_with_room(stations, demand)
+        origin_stations = [stations[i] for i in origins.tolist()]
+        if destinations is None:
+            passengers = passenger_creator.create_passengers(origin_stations)
+        else:
+            passengers = passenger_creator.create_passengers_with_destinations(
+                destinations
+            )
+        Holder.add_new_passengers_to_holders(list(zip(origin_stations, passengers)))
+        tick = self._components.status.game_time
+        for station, passenger in zip(origin_stations, passengers):
+            self._components.journey_recorder.on_spawn(passenger, station, tick)
+
+    def _get_passenger_creator(self) -> PassengerCreator:
+        stations = self._components.stations
+        # the list comparison checks identity first, so it's cheap when unchanged
+        if self._passenger_creator is None or stations != self._stations_snapshot:
+            self._passenger_creator = PassengerCreator(self._get_station_shape_types())
+            self._stations_snapshot = list(stations)
+        return self._passenger_creator
 
     def _get_station_shape_types(self) -> list[ShapeType]:
-        station_shape_types: list[ShapeType] = []
-        for station in self._components.stations:
-            if station.shape.type not in station_shape_types:
-                station_shape_types.append(station.shape.type)
-        return station_shape_types
+        return list(
+            dict.fromkeys(station.shape.type for station in self._components.stations)
+        )
 
     def _is_passenger_spawn_time(self) -> bool:
         return self._ms_until_next_spawn <= 0
 
     def _reset(self) -> None:
         self._ms_until_next_spawn = self._interval_step
+
+
+def _get_origins_with_room(
+    stations: Sequence[Station], demand: Demand
+) -> tuple[npt.NDArray[np.intp], list[ShapeType] | None]:
+    """
+    Drops the passengers that don't fit in their station, and the ones whose
+    destination is the shape of their station.
+    """
+    origins = demand.origins
+    is_kept = np.ones(len(origins), dtype=bool)
+    if demand.destinations is not None:
+        is_kept &= np.fromiter(
+            (
+                stations[origin].shape.type != destination
+                for origin, destination in zip(origins.tolist(), demand.destinations)
+            ),
+            dtype=bool,
+            count=len(origins),
+        )
+    room = np.fromiter(
+        (station.capacity - station.occupation for station in stations),
+        dtype=np.intp,
+        count=len(stations),
+    )
+    # rank of each passenger among the kept ones of the same station
+    keys = np.where(is_kept, origins, len(stations))
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    first_of_station = np.searchsorted(sorted_keys, sorted_keys, side="left")
+    ranks = np.empty(len(origins), dtype=np.intp)
+    ranks[order] = np.arange(len(origins)) - first_of_station
+    is_kept &= ranks < room[origins]
+    destinations = (
+        None
+        if demand.destinations is None
+        else [d for d, kept in zip(demand.destinations, is_kept.tolist()) if kept]
+    )
+    return origins[is_kept], destinations
@@ -40,7 +40,6 @@ class EditingIntermediateStations:
         assert path_segment
 
         self.path.stations.remove(station)
-        # TODO: update metros' travel steps
         self.path.update_segments()
 
     def draw(self, surface: pygame.surface.Surface) -> None:
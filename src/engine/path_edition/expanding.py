@@ -87,5 +87,4 @@ class ExpandingPath(CreatingOrExpandingPathBase):
         index = index - 1
         # we insert the station *after* that index
         path.stations.insert(index + 1, station)
-        # TODO: update metros' travel step
         path.update_segments()
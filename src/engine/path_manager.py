@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Final, Sequence
+from typing import Final, Literal, Sequence
 
 from src.config import Config, max_num_metros, max_num_paths
-from src.entity import Metro, Path, Station
-from src.entity.segments import PathSegment, Segment
+from src.entity import Metro, Passenger, Path, Station
+from src.entity.segments import PaddingSegment, PathSegment, Segment
+from src.exceptions import InvalidActionError
 from src.geometry.point import Point
 from src.tools.setup_logging import configure_logger
 
@@ -21,6 +22,12 @@ from .travel_plan_finder import TravelPlanFinder
 
 logger = configure_logger(__name__)
 
+PathEnd = Literal["start", "end"]
+# stations of a path and whether it loops
+PathDesign = tuple[Sequence[Station], bool]
+# a passenger and the station it was moved to
+Placement = tuple[Station, Passenger]
+
 
 class PathManager:
     __slots__ = (
@@ -79,13 +86,95 @@ class PathManager:
         return gen_wrapper_creating_or_expanding(self._creating_or_expanding_path)
 
     def remove_path(self, path: Path) -> None:
-        self._components.gui.path_to_button[path].remove_path()
-        for metro in path.metros:
-            self._remove_metro(metro)
-        self._components.path_color_manager.release_color_for_path(path)
-        self._components.paths.remove(path)
-        self._components.gui.assign_paths_to_buttons(self._components.paths)
-        self._find_travel_plan_for_passengers()
+        moved = self._remove_path(path)
+        self._on_network_changed([path], moved)
+
+    def create_path(self, stations: Sequence[Station], loop: bool = False) -> Path:
+        """
+        Creates a finished path through the stations, with a metro if there are
+        metros left. Raises InvalidActionError if the path isn't allowed.
+        """
+        self.check_not_editing()
+        if len(self._components.paths) >= self.max_num_paths:
+            raise InvalidActionError(f"There are already {self.max_num_paths} paths")
+        _check_stations(stations, loop)
+        path = self._add_path(stations, loop)
+        self._on_network_changed()
+        return path
+
+    def build_network(self, designs: Sequence[PathDesign]) -> list[Path]:
+        """
+        Replaces all the paths with new ones, given as their stations and whether
+        they loop. The segments of each path are built once, and the travel plans
+        are updated once at the end. Raises InvalidActionError, without changing
+        anything, if any path isn't allowed.
+        """
+        self.check_not_editing()
+        if len(designs) > self.max_num_paths:
+            raise InvalidActionError(
+                f"At most {self.max_num_paths} paths are allowed, got {len(designs)}"
+            )
+        for stations, loop in designs:
+            _check_stations(stations, loop)
+        moved: list[Placement] = []
+        for path in self._components.paths[:]:
+            moved.extend(self._remove_path(path))
+        paths = [self._add_path(stations, loop) for stations, loop in designs]
+        self._on_network_changed(moved=moved)
+        return paths
+
+    def extend_path(self, path: Path, end: PathEnd, station: Station) -> None:
+        """
+        Adds the station at an end of the path. Adding the station at the other end
+        makes the path a loop.
+        """
+        self.check_not_editing()
+        if path.is_looped:
+            raise InvalidActionError("Looped paths can't be extended")
+        other_end = path.last_station if end == "start" else path.first_station
+        if station is other_end and len(path.stations) > 2:
+            path.set_stations(path.stations, is_looped=True)
+        elif station in path.stations:
+            raise InvalidActionError(f"{station} is already in the path")
+        elif end == "start":
+            path.set_stations([station, *path.stations], is_looped=False)
+        else:
+            path.set_stations([*path.stations, station], is_looped=False)
+        self._on_network_changed([path])
+
+    def insert_station(self, path: Path, index: int, station: Station) -> None:
+        """
+        Inserts the station between the stations at index - 1 and index; in a loop,
+        index can also be the number of stations, between the last and the first.
+        """
+        self.check_not_editing()
+        if station in path.stations:
+            raise InvalidActionError(f"{station} is already in the path")
+        max_index = len(path.stations) if path.is_looped else len(path.stations) - 1
+        if not 1 <= index <= max_index:
+            raise InvalidActionError(f"No segment of the path before index {index}")
+        if _segment_has_metros(path.get_path_segments()[index - 1], path.metros):
+            raise InvalidActionError("Segments with metros can't be edited")
+        stations = list(path.stations)
+        stations.insert(index, station)
+        path.set_stations(stations, path.is_looped)
+        self._on_network_changed([path])
+
+    def remove_station(self, path: Path, station: Station) -> None:
+        self.check_not_editing()
+        if station not in path.stations:
+            raise InvalidActionError(f"{station} is not in the path")
+        if len(path.stations) <= (3 if path.is_looped else 2):
+            raise InvalidActionError("The path would be too short, remove it instead")
+        if any(
+            _segment_is_at_station(metro.current_segment, station)
+            for metro in path.metros
+        ):
+            raise InvalidActionError("Segments with metros can't be edited")
+        path.set_stations(
+            [s for s in path.stations if s is not station], path.is_looped
+        )
+        self._on_network_changed([path])
 
     def try_to_set_temporary_point(self, position: Point) -> None:
         if self._creating_or_expanding_path:
@@ -132,6 +221,10 @@ class PathManager:
     def get_paths_with_station(self, station: Station) -> list[Path]:
         return [path for path in self._components.paths if station in path.stations]
 
+    def check_not_editing(self) -> None:
+        if self._creating_or_expanding_path or self.editing_intermediate_stations:
+            raise InvalidActionError("A path is being edited with the mouse")
+
     @property
     def is_creating_or_expanding(self) -> bool:
         return bool(self._creating_or_expanding_path)
@@ -140,6 +233,50 @@ class PathManager:
     ### private methods ###
     #######################
 
+    def _add_path(self, stations: Sequence[Station], loop: bool) -> Path:
+        result = self._components.path_color_manager.get_first_path_color_available()
+        assert result
+        path_order, color = result
+        path = Path(color, path_order)
+        self._components.path_color_manager.assign_color_to_path(color, path)
+        self._components.paths.append(path)
+        path.set_stations(stations, loop)
+        if len(self._components.metros) < self.max_num_metros:
+            metro = Metro(self._components.passengers_mediator)
+            path.add_metro(metro)
+            self._components.metros.append(metro)
+        return path
+
+    def _remove_path(self, path: Path) -> list[Placement]:
+        """Returns the riders of its metros, moved to stations to be replanned"""
+        button = self._components.gui.path_to_button.get(path)
+        if button:
+            button.remove_path()
+        moved: list[Placement] = []
+        for metro in path.metros:
+            moved.extend(self._remove_metro(metro))
+        self._components.path_color_manager.release_color_for_path(path)
+        self._components.paths.remove(path)
+        self._components.passenger_queues.forget_path(path.id)
+        return moved
+
+    def _on_network_changed(
+        self,
+        changed_paths: Sequence[Path] | None = None,
+        moved: Sequence[Placement] = (),
+    ) -> None:
+        """
+        Updates the buttons and the travel plans. The moved passengers are replanned
+        from their new station. When the changed paths are given, only the
+        passengers whose travel plan uses them are replanned.
+        """
+        self._components.gui.assign_paths_to_buttons(self._components.paths)
+        self._travel_plan_finder.replan_passengers_at(moved)
+        if changed_paths is None:
+            self._find_travel_plan_for_passengers()
+        else:
+            self._travel_plan_finder.replan_passengers_of(changed_paths)
+
     def _insert_station(self, station: Station) -> None:
         assert self.editing_intermediate_stations
         # get the index before insertion
@@ -150,22 +287,36 @@ class PathManager:
         path.stations.insert(index + 1, station)
         path.update_segments()
         self.stop_edition()
+        self._travel_plan_finder.replan_passengers_of([path])
 
     def _remove_station(self, station: Station) -> None:
         assert self.editing_intermediate_stations
+        path = self.editing_intermediate_stations.path
         self.editing_intermediate_stations.remove_station(station)
         self.stop_edition()
+        self._travel_plan_finder.replan_passengers_of([path])
 
-    def _remove_metro(self, metro: Metro) -> None:
+    def _remove_metro(self, metro: Metro) -> list[Placement]:
+        """Returns its riders, moved to stations to be replanned"""
+        moved: list[Placement] = []
         for passenger in metro.passengers[:]:
-            assert passenger.last_station
-            metro.move_passenger(passenger, passenger.last_station)
+            # back to the last station, even if it's full
+            station = passenger.last_station
+            assert station
+            metro.move_passenger(passenger, station, over_capacity=True)
+            if metro.path_id:
+                self._components.journey_recorder.on_alight(
+                    passenger, metro.path_id, self._components.status.game_time
+                )
+            moved.append((station, passenger))
         assert not metro.passengers
         self._components.metros.remove(metro)
+        self._components.passenger_queues.forget_metro(metro)
         if Config.debug_path_and_metros:
             print(
                 f"Removed item from metros. Total metros: {len(self._components.metros)}"
             )
+        return moved
 
     def _find_travel_plan_for_passengers(self) -> None:
         self._travel_plan_finder.find_travel_plan_for_passengers()
@@ -176,6 +327,24 @@ class PathManager:
 ################################
 
 
+def _check_stations(stations: Sequence[Station], loop: bool) -> None:
+    min_num_stations = 3 if loop else 2
+    if len(stations) < min_num_stations:
+        raise InvalidActionError(
+            f"A path needs at least {min_num_stations} stations, got {len(stations)}"
+        )
+    if len(set(stations)) != len(stations):
+        raise InvalidActionError("A path can't go through a station twice")
+
+
+def _segment_is_at_station(segment: Segment, station: Station) -> bool:
+    """Whether the segment starts or ends at the station, or turns around it"""
+    if isinstance(segment, PaddingSegment):
+        return segment.stations.current is station
+    assert isinstance(segment, PathSegment)
+    return station in (segment.stations.start, segment.stations.end)
+
+
 def _segment_has_metros(segment: Segment, metros: Sequence[Metro]) -> bool:
     return any(
         metro.current_segment == segment for metro in metros if metro.current_segment
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Final
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    p50_ms: float
+    p99_ms: float
+    num_samples: int
+
+
+class PhaseProfiler:
+    """
+    Keeps the durations of the last samples of each named phase in ring buffers.
+    Timing a phase reuses the same timer object, so the overhead is two
+    perf_counter calls and a store in the buffer.
+    """
+
+    __slots__ = ("_buffer_size", "_timers", "enabled")
+
+    def __init__(self, buffer_size: int) -> None:
+        assert buffer_size > 0
+        self._buffer_size: Final = buffer_size
+        self._timers: Final[dict[str, PhaseTimer]] = {}
+        self.enabled = True
+
+    ######################
+    ### public methods ###
+    ######################
+
+    def measure(self, phase: str) -> PhaseTimer:
+        """Context manager recording the duration of its block under phase"""
+        timer = self._timers.get(phase)
+        if timer is None:
+            timer = PhaseTimer(self, self._buffer_size)
+            self._timers[phase] = timer
+        return timer
+
+    def get_stats(self, phase: str) -> PhaseStats | None:
+        timer = self._timers.get(phase)
+        if timer is None or timer.num_samples == 0:
+            return None
+        return timer.get_stats()
+
+    def get_all_stats(self) -> dict[str, PhaseStats]:
+        return {
+            phase: timer.get_stats()
+            for phase, timer in self._timers.items()
+            if timer.num_samples
+        }
+
+    def reset(self) -> None:
+        for timer in self._timers.values():
+            timer.reset()
+
+
+class PhaseTimer:
+    __slots__ = ("_profiler", "_durations_ms", "_next_index", "num_samples", "_start")
+
+    def __init__(self, profiler: PhaseProfiler, buffer_size: int) -> None:
+        self._profiler: Final = profiler
+        self._durations_ms: Final = np.zeros(buffer_size, dtype=np.float64)
+        self._next_index = 0
+        self.num_samples = 0
+        self._start: float | None = None
+
+    def __enter__(self) -> PhaseTimer:
+        if self._profiler.enabled:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._start is None:
+            return
+        self.record((time.perf_counter() - self._start) * 1000)
+        self._start = None
+
+    def record(self, duration_ms: float) -> None:
+        self._durations_ms[self._next_index] = duration_ms
+        self._next_index = (self._next_index + 1) % len(self._durations_ms)
+        self.num_samples = min(self.num_samples + 1, len(self._durations_ms))
+
+    def get_stats(self) -> PhaseStats:
+        assert self.num_samples
+        p50, p99 = np.percentile(self._durations_ms[: self.num_samples], [50, 99])
+        return PhaseStats(float(p50), float(p99), self.num_samples)
+
+    def reset(self) -> None:
+        self._next_index = 0
+        self.num_samples = 0
@@ -1,46 +1,45 @@
-import random
-from collections.abc import Sequence
-from typing import Final, Mapping
+import weakref
+from collections.abc import Iterable, Sequence
+from typing import Final
 
-from src.entity import Passenger, Station
+from src.config import transfer_penalty
+from src.entity import Metro, Passenger, Station
 from src.entity.path.path import Path
+from src.entity.segments import PathSegment
 from src.geometry.type import ShapeType
-from src.graph.graph_algo import bfs, build_station_nodes_dict
-from src.graph.node import Node
-from src.graph.skip_intermediate import skip_stations_on_same_path
-from src.travel_plan import TravelPlan
+from src.graph.routing import Router
+from src.travel_plan import Leg, TravelPlan
 
 from .game_components import GameComponents
-from .path_finder import find_next_path_for_passenger_at_station
 
 DEBUG = False
 
 
 class TravelPlanFinder:
-    __slots__ = (
-        "_components",
-        "_station_nodes_mapping",
-    )
+    __slots__ = ("_components", "_router", "_passengers_by_path")
 
     def __init__(self, components: GameComponents):
         self._components: Final = components
-        self._station_nodes_mapping: Mapping[Station, Node] | None = None
+        self._router: Final = Router(transfer_penalty)
+        # passengers whose travel plan used the path when it was assigned; a
+        # passenger stays until they get a new plan or are gone, so the plan must
+        # be checked before relying on an entry
+        self._passengers_by_path: Final[dict[Path, weakref.WeakSet[Passenger]]] = {}
 
     ######################
     ### public methods ###
     ######################
 
     def find_travel_plan_for_passengers(self) -> None:
-        self._station_nodes_mapping = build_station_nodes_dict(
-            self._components.stations, self._components.paths
-        )
+        self._router.update(self._components.stations, self._components.paths)
+        destinations: dict[ShapeType, list[Station]] = {}
         for station in self._components.stations:
             # if station is not in any path
             if not self._station_is_connected(station):
                 # passengers shouldn't have a travel plan
                 for passenger in station.passengers:
                     if passenger.travel_plan:
-                        passenger.travel_plan = None
+                        self._set_travel_plan(passenger, None)
                 continue
             for passenger in station.passengers:
                 if _passenger_has_travel_plan_with_next_path(
@@ -49,7 +48,73 @@ class TravelPlanFinder:
                     continue
                 if DEBUG:
                     print(f"Looking for a travel plan for passenger {passenger}")
-                self._find_travel_plan_for_passenger(station, passenger)
+                shape_type = passenger.destination_shape.type
+                if shape_type not in destinations:
+                    destinations[shape_type] = self._get_stations_for_shape_type(
+                        shape_type
+                    )
+                self._find_travel_plan_for_passenger(
+                    station, passenger, destinations[shape_type]
+                )
+
+    def replan_passengers_of(self, paths: Iterable[Path]) -> None:
+        """
+        Finds new travel plans, in one batch, for the passengers whose travel plan
+        uses any of the paths, after the paths were removed or edited. The other
+        passengers keep their travel plan.
+        """
+        passengers: dict[Passenger, None] = {}
+        for path in paths:
+            path_passengers = self._passengers_by_path.get(path)
+            if path_passengers is None:
+                continue
+            for passenger in path_passengers:
+                if _travel_plan_uses_path(passenger, path):
+                    passengers[passenger] = None
+            if path not in self._components.paths:
+                del self._passengers_by_path[path]
+        if not passengers:
+            return
+
+        self._router.update(self._components.stations, self._components.paths)
+        destinations: dict[ShapeType, list[Station]] = {}
+        for passenger in passengers:
+            travel_plan = passenger.travel_plan
+            assert travel_plan
+            leg = travel_plan.next_leg
+            assert leg
+            shape_type = passenger.destination_shape.type
+            if shape_type not in destinations:
+                destinations[shape_type] = self._get_stations_for_shape_type(shape_type)
+            # waiting passengers are at the station where their next leg starts,
+            # the others ride it
+            if passenger in leg.board_station.passengers:
+                self._find_travel_plan_for_passenger(
+                    leg.board_station, passenger, destinations[shape_type]
+                )
+            elif metro := _get_metro_with_passenger(leg.path.metros, passenger):
+                self._find_travel_plan_for_riding_passenger(
+                    metro, leg, passenger, destinations[shape_type]
+                )
+
+    def replan_passengers_at(
+        self, placements: Sequence[tuple[Station, Passenger]]
+    ) -> None:
+        """
+        Finds new travel plans for passengers just moved to the stations, like the
+        riders of a removed metro, starting from there.
+        """
+        if not placements:
+            return
+        self._router.update(self._components.stations, self._components.paths)
+        destinations: dict[ShapeType, list[Station]] = {}
+        for station, passenger in placements:
+            shape_type = passenger.destination_shape.type
+            if shape_type not in destinations:
+                destinations[shape_type] = self._get_stations_for_shape_type(shape_type)
+            self._find_travel_plan_for_passenger(
+                station, passenger, destinations[shape_type]
+            )
 
     #######################
     ### private methods ###
@@ -62,29 +127,59 @@ class TravelPlanFinder:
         self,
         station: Station,
         passenger: Passenger,
+        destinations: Sequence[Station],
     ) -> None:
-        assert self._station_nodes_mapping
-        possible_dst_stations = self._get_stations_for_shape_type(
-            passenger.destination_shape.type
+        route = self._router.find_route(
+            station, passenger.destination_shape.type, destinations
         )
+        self._set_legs(passenger, route.legs if route else [])
+        self._components.passenger_queues.add_waiting(station, passenger)
 
-        for possible_dst_station in possible_dst_stations:
-            start = self._station_nodes_mapping[station]
-            end = self._station_nodes_mapping[possible_dst_station]
-            node_path = bfs(start, end)
-            if len(node_path) == 0:
-                continue
-
-            assert len(node_path) > 1, "The passenger should have already arrived"
-            node_path = skip_stations_on_same_path(node_path)
-            passenger.travel_plan = TravelPlan(node_path[1:], passenger.num_id)
-            self._find_next_path_for_passenger_at_station(passenger, station)
-            break
-
+    def _find_travel_plan_for_riding_passenger(
+        self,
+        metro: Metro,
+        leg: Leg,
+        passenger: Passenger,
+        destinations: Sequence[Station],
+    ) -> None:
+        shape_type = passenger.destination_shape.type
+        if leg.alight_station not in leg.path.stations:
+            route = self._router.find_route_from_path(
+                leg.path, leg.board_station, shape_type, destinations
+            )
+            if route:
+                self._set_legs(passenger, route.legs)
+            else:
+                # no way to the destination, get off at the next stop to wait there
+                next_stop = _get_next_stop(metro)
+                self._set_legs(passenger, [Leg(leg.path, leg.board_station, next_stop)])
         else:
-            travel_plan = TravelPlan([], passenger.num_id)
-            if travel_plan != passenger.travel_plan:
-                passenger.travel_plan = travel_plan
+            # keep getting off where planned, and go on from there
+            route = self._router.find_route(
+                leg.alight_station, shape_type, destinations
+            )
+            self._set_legs(passenger, [leg, *route.legs] if route else [leg])
+        self._components.passenger_queues.add_riding(metro, passenger)
+
+    def _set_legs(self, passenger: Passenger, legs: Sequence[Leg]) -> None:
+        travel_plan = TravelPlan(legs, passenger.num_id)
+        if travel_plan != passenger.travel_plan:
+            self._set_travel_plan(passenger, travel_plan)
+
+    def _set_travel_plan(
+        self, passenger: Passenger, travel_plan: TravelPlan | None
+    ) -> None:
+        if passenger.travel_plan:
+            for leg in passenger.travel_plan.legs:
+                path_passengers = self._passengers_by_path.get(leg.path)
+                if path_passengers is not None:
+                    path_passengers.discard(passenger)
+        passenger.travel_plan = travel_plan
+        if travel_plan:
+            for leg in travel_plan.legs:
+                self._passengers_by_path.setdefault(leg.path, weakref.WeakSet()).add(
+                    passenger
+                )
 
     def _get_stations_for_shape_type(self, shape_type: ShapeType) -> list[Station]:
         stations = [
@@ -92,24 +187,38 @@ class TravelPlanFinder:
             for station in self._components.stations
             if station.shape.type == shape_type
         ]
-        random.shuffle(stations)
         return stations
 
-    def _find_next_path_for_passenger_at_station(
-        self, passenger: Passenger, station: Station
-    ) -> None:
-        assert passenger.travel_plan
-        find_next_path_for_passenger_at_station(
-            self._components.paths, passenger.travel_plan, station
-        )
-
 
 def _passenger_has_travel_plan_with_next_path(
     passenger: Passenger, paths: Sequence[Path]
 ) -> bool:
     if not passenger.travel_plan:
         return False
-    return (
-        passenger.travel_plan.next_path in paths
-        or passenger.travel_plan.next_station is not None
-    )
+    return passenger.travel_plan.next_path in paths
+
+
+def _travel_plan_uses_path(passenger: Passenger, path: Path) -> bool:
+    if not passenger.travel_plan:
+        return False
+    return any(leg.path is path for leg in passenger.travel_plan.remaining_legs)
+
+
+def _get_next_stop(metro: Metro) -> Station:
+    """Station at the end of the next path segment the metro travels"""
+    travel_step = metro.travel_step
+    while travel_step and not isinstance(travel_step.current, PathSegment):
+        travel_step = travel_step.next
+    assert travel_step
+    segment = travel_step.current
+    assert isinstance(segment, PathSegment)
+    return segment.stations.end if travel_step.is_forward else segment.stations.start
+
+
+def _get_metro_with_passenger(
+    metros: Sequence[Metro], passenger: Passenger
+) -> Metro | None:
+    for metro in metros:
+        if passenger in metro.passengers:
+            return metro
+    return None
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from typing import Iterator
-
 from src.config import Config
 from src.geometry.point import Point
 from src.gui.gui import get_gui_height, get_main_surface_height
 from src.protocols.passenger_mediator import PassengersMediatorProtocol
-from src.utils import get_random_position, get_random_station_shape
+from src.utils import (
+    get_random_position,
+    get_random_positions,
+    get_random_station_shape,
+)
 
 from .metro import Metro
 from .station import Station
@@ -23,26 +24,26 @@ def get_random_station(passengers_mediator: PassengersMediatorProtocol) -> Stati
     )
 
 
-def generate_stations(
-    previous: Sequence[Station], passengers_mediator: PassengersMediatorProtocol
-) -> Iterator[Station]:
-    while True:
-        new_station = get_random_station(passengers_mediator)
-        if all(
-            station.get_distance_to(new_station) >= Config.min_distance
-            for station in previous
-        ):
-            yield new_station
-
-
 def get_random_stations(
     num: int, passengers_mediator: PassengersMediatorProtocol
 ) -> list[Station]:
-    stations: list[Station] = []
-    generator = generate_stations(stations, passengers_mediator)
-    for _ in range(num):
-        stations.append(next(generator))
-    return stations
+    """
+    Stations separated by at least Config.min_distance, or a bit less if that number
+    of stations doesn't fit. Positions are sampled first, so stations are only created
+    for accepted positions.
+    Raises InfeasibleDensityError if that number of stations still does not fit.
+    """
+    positions = get_random_positions(
+        num,
+        Config.screen_width,
+        round(get_main_surface_height()),
+        Config.min_distance,
+    )
+    gui_offset = Point(0, round(get_gui_height()))
+    return [
+        Station(get_random_station_shape(), position + gui_offset, passengers_mediator)
+        for position in positions
+    ]
 
 
 def get_metros(
@@ -62,10 +62,29 @@ class Holder(Entity):
         self._mediator.on_new_passenger_added(passenger)
         self._add_passenger(passenger)
 
-    def move_passenger(self, passenger: Passenger, dest: Holder) -> None:
+    @staticmethod
+    def add_new_passengers_to_holders(
+        placements: Sequence[tuple[Holder, Passenger]],
+    ) -> None:
+        """
+        Adds each passenger to its holder. All the holders must share the same
+        mediator, which checks the whole batch at once.
+        """
+        if not placements:
+            return
+        mediator = placements[0][0]._mediator
+        assert all(holder._mediator is mediator for holder, _ in placements)
+        mediator.on_new_passengers_added([passenger for _, passenger in placements])
+        for holder, passenger in placements:
+            holder._add_passenger(passenger)
+
+    def move_passenger(
+        self, passenger: Passenger, dest: Holder, *, over_capacity: bool = False
+    ) -> None:
+        """With over_capacity, the destination takes the passenger even if full"""
         source = self
         self._mediator.on_passenger_exit(self, passenger)
-        dest._add_passenger(passenger)
+        dest._add_passenger(passenger, over_capacity=over_capacity)
         source._remove_passenger(passenger)
 
     @property
@@ -84,13 +103,17 @@ class Holder(Entity):
     ### private methods ###
     #######################
 
-    def _add_passenger(self, passenger: Passenger) -> None:
-        assert self.has_room()
+    def _add_passenger(
+        self, passenger: Passenger, *, over_capacity: bool = False
+    ) -> None:
+        assert over_capacity or self.has_room()
         self._passengers.append(passenger)
+        self._mediator.on_holder_changed(self)
 
     def _remove_passenger(self, passenger: Passenger) -> None:
         assert passenger in self._passengers
         self._passengers.remove(passenger)
+        self._mediator.on_holder_changed(self)
 
     def _draw_passengers(self, surface: pygame.surface.Surface) -> None:
         assert self._mediator
@@ -26,6 +26,7 @@ class Metro(Holder):
         "_current_station",
         "path_id",
         "travel_step",
+        "segment_progress",
     )
     game_speed: Final = metro_speed_per_ms
     _size = metro_size
@@ -41,6 +42,8 @@ class Metro(Holder):
         )
         self._current_station: Station | None = None
         self.travel_step: TravelStep | None = None
+        # distance travelled along the current segment, in the travel direction
+        self.segment_progress: float = 0
         self.path_id: EntityId | None = None
 
     def __del__(self) -> None:
@@ -73,6 +76,7 @@ class Metro(Holder):
         self._current_station = station
         if station:
             self._update_passengers_last_station()
+            self._mediator.on_metro_arrival(self)
 
     def passenger_arrives(self, passenger: Passenger) -> None:
         assert passenger in self._passengers
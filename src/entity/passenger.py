@@ -20,6 +20,8 @@ class Passenger(Entity):
         "is_at_destination",
         "_travel_plan",
         "last_station",
+        # for the index of passengers by path of their travel plans
+        "__weakref__",
     )
 
     def __init__(self, destination_shape: Shape) -> None:
@@ -48,5 +50,5 @@ class Passenger(Entity):
     @travel_plan.setter
     def travel_plan(self, value: TravelPlanProtocol | None) -> None:
         if self._travel_plan and value:
-            assert value.node_path != self._travel_plan.node_path
+            assert value.legs != self._travel_plan.legs
         self._travel_plan = value
@@ -1,13 +1,11 @@
-import math
 from dataclasses import dataclass
 
 from src.entity.metro import Metro
-from src.entity.segments import PaddingSegment, PathSegment
+from src.entity.segments import PaddingSegment, PathSegment, Segment
 from src.entity.station import Station
 from src.geometry.point import Point
 from src.geometry.polygons import Polygon
-from src.geometry.types import radians_to_degrees
-from src.geometry.utils import get_direction, get_distance
+from src.geometry.types import create_degrees
 
 from .state import PathState
 
@@ -23,38 +21,56 @@ class MetroMovementSystem:
     ######################
 
     def move_metro(self, metro: Metro, dt_ms: int) -> None:
-        dst_position, dst_station = _determine_destination(metro)
-
-        direction, distance_to_destination = _calculate_direction_and_distance(
-            metro.position, dst_position
-        )
+        segment = metro.current_segment
+        geometry = segment.geometry
 
         if isinstance(metro.shape, Polygon):
-            _set_metro_rotation_angle(metro.shape, direction)
+            _set_metro_rotation_angle(metro.shape, metro)
 
         distance_can_travel = metro.game_speed * dt_ms
+        distance_to_destination = geometry.length - metro.segment_progress
 
         segment_end_reached = distance_can_travel >= distance_to_destination
         if segment_end_reached:
-            self._handle_metro_movement_at_the_end_of_the_segment(metro, dst_station)
+            self._handle_metro_movement_at_the_end_of_the_segment(metro)
         else:
             metro.current_station = None
-            metro.position += direction * distance_can_travel
+            metro.segment_progress += distance_can_travel
+            metro.position = _get_position_on_segment(
+                segment, metro.is_forward, metro.segment_progress
+            )
+
+    def relocate_metro(self, metro: Metro) -> None:
+        """
+        Places the metro on its current segment, at the point nearest to its position.
+        It should be called when the travel step of the metro is replaced.
+        """
+        segment = metro.current_segment
+        geometry = segment.geometry
+        origin = _get_origin(segment, metro.is_forward)
+        direction = geometry.direction if metro.is_forward else -1 * geometry.direction
+        offset = metro.position - origin
+        projection = offset.left * direction.left + offset.top * direction.top
+        metro.segment_progress = min(max(projection, 0), geometry.length)
+        metro.position = _get_position_on_segment(
+            segment, metro.is_forward, metro.segment_progress
+        )
 
     #######################
     ### private methods ###
     #######################
 
-    def _handle_metro_movement_at_the_end_of_the_segment(
-        self, metro: Metro, possible_dest_station: Station | None
-    ) -> None:
+    def _handle_metro_movement_at_the_end_of_the_segment(self, metro: Metro) -> None:
         """Handle metro movement at the end of the segment"""
+        dst_position, possible_dest_station = _determine_destination(metro)
+        metro.position = dst_position
         # Update the current station if necessary
         if metro.current_station != possible_dest_station:
             metro.current_station = possible_dest_station
         assert metro.travel_step
         assert metro.travel_step.next
         metro.travel_step = metro.travel_step.next
+        metro.segment_progress = 0
         return
 
 
@@ -63,12 +79,33 @@ class MetroMovementSystem:
 #########################
 
 
-def _set_metro_rotation_angle(polygon: Polygon, direct: Point) -> None:
-    radians = math.atan2(direct.top, direct.left)
-    degrees = radians_to_degrees(radians)
+def _set_metro_rotation_angle(polygon: Polygon, metro: Metro) -> None:
+    """Uses the heading precomputed for the current segment, so no trigonometry is needed"""
+    heading = metro.current_segment.geometry.heading
+    if heading is None:
+        # zero length segment: keep the previous angle
+        return
+    degrees = heading if metro.is_forward else create_degrees(heading + 180)
     polygon.set_degrees(degrees)
 
 
+def _get_origin(segment: Segment, is_forward: bool) -> Point:
+    return segment.start if is_forward else segment.end
+
+
+def _get_position_on_segment(
+    segment: Segment, is_forward: bool, progress: float
+) -> Point:
+    direction = segment.geometry.direction
+    if not is_forward:
+        progress = -progress
+    origin = _get_origin(segment, is_forward)
+    return Point(
+        origin.left + direction.left * progress,
+        origin.top + direction.top * progress,
+    )
+
+
 def _determine_destination(metro: Metro) -> tuple[Point, Station | None]:
     """
     Determine the position and the possible station at the end of current segment.
@@ -87,12 +124,3 @@ def _determine_destination(metro: Metro) -> tuple[Point, Station | None]:
         dst_station = None
 
     return dst_position, dst_station
-
-
-def _calculate_direction_and_distance(
-    start_point: Point, end_point: Point
-) -> tuple[Point, float]:
-    """Calculate the distance and direction to the destination point"""
-    distance = get_distance(start_point, end_point)
-    direction = get_direction(start_point, end_point)
-    return direction, distance
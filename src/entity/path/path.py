@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import itertools
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Final
 
 import pygame
@@ -11,6 +11,7 @@ from src.entity.path.metro_movement import MetroMovementSystem
 from src.entity.path.state import PathState
 from src.entity.segments.location import LocationService
 from src.entity.segments.padding_segment import GroupOfThreeStations
+from src.entity.segments.path_segment import StationPair
 from src.entity.travel_step import TravelStep
 from src.geometry.line import Line
 from src.geometry.point import Point
@@ -36,6 +37,7 @@ class Path(Entity):
         "temp_point_is_from_end",
         "_metro_movement_system",
         "_location_service",
+        "version",
     )
 
     def __init__(self, color: Color, path_order: int) -> None:
@@ -55,6 +57,8 @@ class Path(Entity):
         self.temp_point: Point | None = None
         self.temp_point_is_from_end = True
         self._path_order = path_order
+        # incremented every time the segments are updated
+        self.version = 0
 
     def __del__(self) -> None:
         if Config.debug_path_and_metros:
@@ -80,27 +84,39 @@ class Path(Entity):
         self.stations.append(station)
         self.update_segments()
 
+    def set_stations(self, stations: Sequence[Station], is_looped: bool) -> None:
+        """Replaces the stations and the loop with a single update of the segments"""
+        self.stations[:] = list(stations)
+        self._state.is_looped = is_looped
+        self.update_segments()
+
     def update_segments(self) -> None:
-        """This should be called only when it is really needed"""
+        """
+        This should be called only when it is really needed.
+        Segments not affected by the last edit are kept, so only the segments adjacent
+        to it are created and located, and metros on kept segments stay where they are.
+        """
+        previous_segments: Final = {
+            _get_segment_key(segment): segment for segment in self._state.segments
+        }
         segments: list[Segment] = _get_updated_segments(
-            self.stations, self._state.is_looped, self.color
+            self.stations, self._state.is_looped, self.color, previous_segments
         )
-        if segments:
-            travel_step = build_travel_steps(segments, self.is_looped)
-            assert travel_step.current == segments[0]
-            assert travel_step.is_forward
-            if self.metros:
-                metro = self.metros[0]
-                assert metro
-                assert metro.travel_step
-                assert metro.travel_step.next
-                # trigger the clearing of references
-                metro.travel_step.next = None
-                metro.travel_step = travel_step
+        self._location_service.retain(
+            segment.stations for segment in segments if isinstance(segment, PathSegment)
+        )
+        for segment in segments:
+            if previous_segments.get(_get_segment_key(segment)) is not segment:
+                self._location_service.locate_segment(segment, self._path_order)
         self._state.segments.clear()
         self._state.segments.extend(segments)
-        for segment in self._state.segments:
-            self._location_service.locate_segment(segment, self._path_order)
+        if segments:
+            # the metros share the travel steps, built once for the edit
+            travel_steps = build_travel_steps_mapping(segments, self.is_looped)
+            segment_indexes = {segment: i for i, segment in enumerate(segments)}
+            for metro in self.metros:
+                self._update_metro_travel_step(metro, travel_steps, segment_indexes)
+        self.version += 1
 
     def draw(self, surface: pygame.surface.Surface) -> None:
         if self.selected:
@@ -165,6 +181,34 @@ class Path(Entity):
     ### private interface ###
     #########################
 
+    def _update_metro_travel_step(
+        self,
+        metro: Metro,
+        travel_steps: dict[tuple[int, bool], TravelStep],
+        segment_indexes: dict[Segment, int],
+    ) -> None:
+        assert metro.travel_step
+        current_segment = metro.current_segment
+        is_forward = metro.is_forward
+        # trigger the clearing of references
+        metro.travel_step.next = None
+
+        index = segment_indexes.get(current_segment)
+        travel_step = (
+            travel_steps.get((index, is_forward)) if index is not None else None
+        )
+        if travel_step and travel_step.current is current_segment:
+            # the segment has been kept, so the metro progress is still valid
+            metro.travel_step = travel_step
+            return
+
+        origin_station = _get_origin_station(current_segment, is_forward)
+        metro.travel_step = (
+            _find_travel_step_from_station(travel_steps, origin_station, is_forward)
+            or travel_steps[(0, True)]
+        )
+        self._metro_movement_system.relocate_metro(metro)
+
     def _draw_highlighted_stations(self, surface: pygame.surface.Surface) -> None:
         surface_size = surface.get_size()
         selected_surface = pygame.surface.Surface(surface_size, pygame.SRCALPHA)
@@ -186,6 +230,13 @@ class Path(Entity):
 
 
 def build_travel_steps(segments: Sequence[Segment], is_looped: bool) -> TravelStep:
+    return build_travel_steps_mapping(segments, is_looped)[(0, True)]
+
+
+def build_travel_steps_mapping(
+    segments: Sequence[Segment], is_looped: bool
+) -> dict[tuple[int, bool], TravelStep]:
+    """Builds the travel steps, mapped by segment index and direction"""
     assert len(set(segments)) == len(segments)
     travel_step: TravelStep | None = None
     current_index = 0
@@ -225,19 +276,56 @@ def build_travel_steps(segments: Sequence[Segment], is_looped: bool) -> TravelSt
 
         previous = travel_step
     assert travel_step
-    return travel_step
+    assert travel_step is created[(0, True)]
+    return created
+
+
+SegmentKey = StationPair | GroupOfThreeStations
+
+
+def _get_segment_key(segment: Segment) -> SegmentKey:
+    assert isinstance(segment, (PathSegment, PaddingSegment))
+    return segment.stations
+
+
+def _get_origin_station(segment: Segment, is_forward: bool) -> Station:
+    """Returns the station the segment departs from in the given direction"""
+    if isinstance(segment, PathSegment):
+        return segment.stations.start if is_forward else segment.stations.end
+    assert isinstance(segment, PaddingSegment)
+    return segment.stations.current
+
+
+def _find_travel_step_from_station(
+    travel_steps: Mapping[tuple[int, bool], TravelStep],
+    station: Station,
+    is_forward: bool,
+) -> TravelStep | None:
+    """
+    Returns the travel step of the path segment departing from the station,
+    preferring the given direction.
+    """
+    candidates = [
+        travel_step
+        for travel_step in travel_steps.values()
+        if isinstance(travel_step.current, PathSegment)
+        and _get_origin_station(travel_step.current, travel_step.is_forward) == station
+    ]
+    candidates.sort(key=lambda travel_step: travel_step.is_forward != is_forward)
+    return candidates[0] if candidates else None
 
 
 def _get_updated_segments(
     stations: Sequence[Station],
     is_looped: bool,
     color: Color,
+    previous_segments: Mapping[SegmentKey, Segment],
 ) -> list[Segment]:
 
     path_segments: Sequence[PathSegment] = _create_path_segments(
-        stations, color, is_looped
+        stations, color, is_looped, previous_segments
     )
-    segments = _add_padding_segments(path_segments, color, is_looped)
+    segments = _add_padding_segments(path_segments, color, is_looped, previous_segments)
     _update_connections(segments)
     return segments
 
@@ -246,9 +334,14 @@ def _create_path_segments(
     stations: Sequence[Station],
     color: Color,
     is_looped: bool,
+    previous_segments: Mapping[SegmentKey, Segment],
 ) -> list[PathSegment]:
 
     def create_path_segment(s1: Station, s2: Station) -> PathSegment:
+        previous = previous_segments.get(StationPair(s1, s2))
+        if previous:
+            assert isinstance(previous, PathSegment)
+            return previous
         return PathSegment(color, s1, s2)
 
     path_segments = [
@@ -264,44 +357,44 @@ def _add_padding_segments(
     path_segments: Sequence[PathSegment],
     color: Color,
     is_looped: bool,
+    previous_segments: Mapping[SegmentKey, Segment],
 ) -> list[Segment]:
+
+    def create_padding_segment(
+        prev_segment: PathSegment, next_segment: PathSegment
+    ) -> PaddingSegment:
+        assert prev_segment.stations.end is next_segment.stations.start
+        stations = GroupOfThreeStations(
+            prev_segment.stations.start,
+            prev_segment.stations.end,
+            next_segment.stations.end,
+        )
+        previous = previous_segments.get(stations)
+        if previous:
+            assert isinstance(previous, PaddingSegment)
+            return previous
+        return PaddingSegment(color, stations)
+
     if not path_segments:
         return []
     segments: list[Segment] = []
     for current_segment, next_segment in itertools.pairwise(path_segments):
         segments.append(current_segment)
-        assert current_segment.stations.end is next_segment.stations.start
-        padding_segment = PaddingSegment(
-            color,
-            GroupOfThreeStations(
-                current_segment.stations.start,
-                current_segment.stations.end,
-                next_segment.stations.end,
-            ),
-        )
-
-        segments.append(padding_segment)
+        segments.append(create_padding_segment(current_segment, next_segment))
 
     segments.append(path_segments[-1])
 
     if is_looped:
-        prev_segment = path_segments[-1]
-        next_segment = path_segments[0]
-        assert prev_segment.stations.end is next_segment.stations.start
-        segments.append(
-            PaddingSegment(
-                color,
-                GroupOfThreeStations(
-                    prev_segment.stations.start,
-                    prev_segment.stations.end,
-                    next_segment.stations.end,
-                ),
-            )
-        )
+        segments.append(create_padding_segment(path_segments[-1], path_segments[0]))
     return segments
 
 
 def _update_connections(segments: Sequence[Segment]) -> None:
+    if not segments:
+        return
+    # segments can be reused, so previous connections at the ends are cleared
+    segments[0].connections.start = None
+    segments[-1].connections.end = None
     for current, next_segment in itertools.pairwise(segments):
         current.connections.end = next_segment
         next_segment.connections.start = current
@@ -3,8 +3,10 @@ __all__ = [
     "PathSegment",
     "Segment",
     "SegmentEdges",
+    "SegmentGeometry",
+    "get_segment_geometry",
 ]
 from .padding_segment import PaddingSegment
 from .path_segment import PathSegment
 from .segment import Segment
-from .visual_segment import SegmentEdges
+from .visual_segment import SegmentEdges, SegmentGeometry, get_segment_geometry
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Final
 
-from src.config import path_order_shift
-from src.entity.segments import PaddingSegment, PathSegment, Segment, SegmentEdges
+from src.config import Config, path_order_shift
+from src.entity.ids import EntityId
+from src.entity.segments import (
+    PaddingSegment,
+    PathSegment,
+    Segment,
+    SegmentEdges,
+    get_segment_geometry,
+)
 from src.entity.station import Station
 from src.geometry.point import Point
 from src.geometry.types import create_degrees
@@ -16,18 +25,30 @@ if TYPE_CHECKING:
     from src.entity.segments.path_segment import StationPair
 
 PathOrder = int
+EdgeKey = tuple[EntityId, EntityId, PathOrder]
 
 
 class LocationService:
-    def __init__(self) -> None:
-        # positions of PathSegment start from a point to another (the nearest to the first station of the tuple)
-        self.connection_positions: Final[
-            dict[tuple[Station, Station, PathOrder], Point]
-        ] = {}
+    def __init__(self, max_size: int | None = None) -> None:
+        # positions of PathSegment edges, keyed by the id of the station where the edge is,
+        # the id of the other station of the segment and the path order
+        self.connection_positions: Final[OrderedDict[EdgeKey, Point]] = OrderedDict()
+        # optional bound, evicting the least recently used positions
+        self._max_size: Final = max_size
 
     def clear(self) -> None:
         self.connection_positions.clear()
 
+    def retain(self, station_pairs: Iterable[StationPair]) -> None:
+        """Removes the cached positions not belonging to the given station pairs"""
+        keys_to_keep: set[tuple[EntityId, EntityId]] = set()
+        for stations in station_pairs:
+            keys_to_keep.add((stations.start.id, stations.end.id))
+            keys_to_keep.add((stations.end.id, stations.start.id))
+        for key in list(self.connection_positions):
+            if key[:2] not in keys_to_keep:
+                del self.connection_positions[key]
+
     def locate_segment(self, segment: Segment, path_order: int) -> None:
         match segment:
             case PaddingSegment():
@@ -36,7 +57,7 @@ class LocationService:
                 edges = self.get_path_segment_edges(segment.stations, path_order)
             case _:
                 assert False
-        segment.visual.set_edges(edges)
+        segment.visual.set_edges(edges, get_segment_geometry(edges))
 
     def get_padding_segment_edges(
         self, stations: GroupOfThreeStations, path_order: int
@@ -54,24 +75,39 @@ class LocationService:
     def get_path_segment_edges(
         self, stations: StationPair, path_order: int
     ) -> SegmentEdges:
+        start_key = (stations.start.id, stations.end.id, path_order)
+        end_key = (stations.end.id, stations.start.id, path_order)
+        start = self._get_cached(start_key)
+        end = self._get_cached(end_key)
+        if start and end and not Config.debug_location_cache:
+            return SegmentEdges(start, end)
+
         offset_vector = _get_offset_vector(stations, path_order)
-        start_key = (stations.start, stations.end, path_order)
-        start = self.connection_positions.get(start_key)
         if not start:
             start = stations.start.position + offset_vector
-            self.connection_positions[start_key] = start
+            self._add_to_cache(start_key, start)
         else:
             assert start == stations.start.position + offset_vector
 
-        end_key = (stations.end, stations.start, path_order)
-        end = self.connection_positions.get(end_key)
         if not end:
             end = stations.end.position + offset_vector
-            self.connection_positions[end_key] = end
+            self._add_to_cache(end_key, end)
         else:
             assert end == stations.end.position + offset_vector
         return SegmentEdges(start, end)
 
+    def _get_cached(self, key: EdgeKey) -> Point | None:
+        position = self.connection_positions.get(key)
+        if position and self._max_size is not None:
+            self.connection_positions.move_to_end(key)
+        return position
+
+    def _add_to_cache(self, key: EdgeKey, position: Point) -> None:
+        self.connection_positions[key] = position
+        if self._max_size is not None:
+            while len(self.connection_positions) > self._max_size:
+                self.connection_positions.popitem(last=False)
+
 
 def _get_offset_vector(stations: StationPair, path_order: int) -> Point:
     factor = _get_sign_using_station_num_id(stations.start, stations.end)
@@ -8,7 +8,7 @@ import pygame
 
 from src.entity.entity import Entity
 from src.entity.ids import EntityId
-from src.entity.segments.visual_segment import VisualSegment
+from src.entity.segments.visual_segment import SegmentGeometry, VisualSegment
 from src.geometry.point import Point
 from src.type import Color
 
@@ -49,5 +49,9 @@ class Segment(Entity, ABC):
     def end(self) -> Point:
         return self.visual.end
 
+    @property
+    def geometry(self) -> SegmentGeometry:
+        return self.visual.geometry
+
     def repr(self) -> str:
         return f"{type(self).__name__}(id={self.num_id})"
@@ -9,6 +9,7 @@ import pygame
 from src.config import Config
 from src.geometry.line import Line
 from src.geometry.point import Point
+from src.geometry.types import Degrees, radians_to_degrees
 from src.type import Color
 
 
@@ -18,9 +19,21 @@ class SegmentEdges:
     end: Point
 
 
+@dataclass(frozen=True)
+class SegmentGeometry:
+    """Geometry of a located segment, computed once so metros can move using only arithmetic"""
+
+    length: float
+    # unit vector from start to end, (0, 0) if the length is zero
+    direction: Point
+    # angle of the segment from start to end, None if the length is zero
+    heading: Degrees | None
+
+
 class VisualSegment:
-    __slots__ = ("color", "_edges", "line")
+    __slots__ = ("color", "_edges", "line", "geometry")
     line: Line
+    geometry: SegmentGeometry
 
     def __init__(
         self,
@@ -29,9 +42,10 @@ class VisualSegment:
         self.color: Final = color
         self._edges: SegmentEdges | None = None
 
-    def set_edges(self, value: SegmentEdges) -> None:
+    def set_edges(self, value: SegmentEdges, geometry: SegmentGeometry) -> None:
         assert not self._edges
         self._edges = value
+        self.geometry = geometry
         self.line = Line(
             color=self.color,
             start=self.start,
@@ -64,6 +78,19 @@ class VisualSegment:
         self.line.draw(surface)
 
 
+def get_segment_geometry(edges: SegmentEdges) -> SegmentGeometry:
+    diff_left = edges.end.left - edges.start.left
+    diff_top = edges.end.top - edges.start.top
+    length = math.hypot(diff_left, diff_top)
+    if length == 0:
+        return SegmentGeometry(0, Point(0, 0), None)
+    return SegmentGeometry(
+        length,
+        Point(diff_left / length, diff_top / length),
+        radians_to_degrees(math.atan2(diff_top, diff_left)),
+    )
+
+
 def distance_point_segment(
     Ax: float, Ay: float, Bx: float, By: float, Cx: float, Cy: float
 ) -> float | None:
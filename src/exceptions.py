@@ -1,2 +1,10 @@
 class GameException(Exception):
     pass
+
+
+class InvalidActionError(GameException):
+    """Raised when a command can't be applied to the current network"""
+
+
+class InfeasibleDensityError(GameException):
+    """Raised when the requested points don't fit in an area at the minimum distance"""
@@ -0,0 +1,139 @@
+"""Poisson-disk sampling of points with a minimum distance between them"""
+
+import math
+
+import numpy as np
+
+from src.exceptions import InfeasibleDensityError
+from src.geometry.point import Point
+
+# candidates tried around each active point before discarding it (Bridson's k)
+_ATTEMPTS_PER_POINT = 30
+_MAX_TRIES = 5
+# density of the hexagonal packing of circles, the densest one
+_MAX_PACKING_DENSITY = math.pi / (2 * math.sqrt(3))
+
+
+def get_max_num_points(width: float, height: float, min_distance: float) -> int:
+    """
+    Upper bound of the number of points that can be placed in the area.
+    Each point is the center of a circle of radius min_distance / 2 not overlapping the
+    others, and those circles are inside the area expanded by that radius.
+    """
+    radius = min_distance / 2
+    circle_area = math.pi * radius**2
+    available_area = (width + min_distance) * (height + min_distance)
+    return math.floor(available_area * _MAX_PACKING_DENSITY / circle_area)
+
+
+def poisson_disk_sample(
+    width: float, height: float, min_distance: float, num_points: int
+) -> list[Point]:
+    """
+    Returns num_points random points in [0, width] x [0, height] separated by at least
+    min_distance, using Bridson's algorithm accelerated with a background grid.
+    Raises InfeasibleDensityError if that number of points does not fit in the area.
+    """
+    assert num_points >= 0
+    if num_points == 0:
+        return []
+    if min_distance <= 0:
+        return [
+            Point(np.random.rand() * width, np.random.rand() * height)
+            for _ in range(num_points)
+        ]
+    max_num_points = get_max_num_points(width, height, min_distance)
+    if num_points > max_num_points:
+        raise InfeasibleDensityError(
+            f"{num_points} points can't be placed at a minimum distance of "
+            f"{min_distance} in a {width}x{height} area (maximum: {max_num_points})"
+        )
+    # random candidates anywhere stop as soon as there are enough points, and
+    # spread them over the whole area
+    points = _sample_by_dart_throwing(width, height, min_distance, num_points)
+    if len(points) == num_points:
+        return points
+    for _ in range(_MAX_TRIES):
+        points = _sample_maximal_set(width, height, min_distance)
+        if len(points) >= num_points:
+            # random subset, as the generation order is spatially correlated
+            indexes = np.random.permutation(len(points))[:num_points]
+            return [points[i] for i in indexes]
+    raise InfeasibleDensityError(
+        f"Unable to place {num_points} points at a minimum distance of "
+        f"{min_distance} in a {width}x{height} area"
+    )
+
+
+class _PointGrid:
+    """Background grid with cells small enough to hold one point at most"""
+
+    __slots__ = ("_cell_size", "_grid", "coords", "_min_distance_sq")
+
+    def __init__(self, width: float, height: float, min_distance: float) -> None:
+        self._cell_size = min_distance / math.sqrt(2)
+        num_cols = math.floor(width / self._cell_size) + 1
+        num_rows = math.floor(height / self._cell_size) + 1
+        # index of the point inside each cell, -1 if empty
+        self._grid = np.full((num_cols, num_rows), -1, dtype=np.int64)
+        self.coords: list[tuple[float, float]] = []
+        self._min_distance_sq = min_distance**2
+
+    def add(self, x: float, y: float) -> None:
+        self._grid[int(x / self._cell_size), int(y / self._cell_size)] = len(
+            self.coords
+        )
+        self.coords.append((x, y))
+
+    def fits(self, x: float, y: float) -> bool:
+        col = int(x / self._cell_size)
+        row = int(y / self._cell_size)
+        neighbors = self._grid[
+            max(col - 2, 0) : col + 3,
+            max(row - 2, 0) : row + 3,
+        ]
+        for index in neighbors[neighbors >= 0]:
+            other_x, other_y = self.coords[index]
+            if (other_x - x) ** 2 + (other_y - y) ** 2 < self._min_distance_sq:
+                return False
+        return True
+
+
+def _sample_by_dart_throwing(
+    width: float, height: float, min_distance: float, num_points: int
+) -> list[Point]:
+    grid = _PointGrid(width, height, min_distance)
+    num_candidates = num_points * _ATTEMPTS_PER_POINT
+    candidates_x = (np.random.rand(num_candidates) * width).tolist()
+    candidates_y = (np.random.rand(num_candidates) * height).tolist()
+    for x, y in zip(candidates_x, candidates_y):
+        if grid.fits(x, y):
+            grid.add(x, y)
+            if len(grid.coords) == num_points:
+                break
+    return [Point(x, y) for x, y in grid.coords]
+
+
+def _sample_maximal_set(
+    width: float, height: float, min_distance: float
+) -> list[Point]:
+    grid = _PointGrid(width, height, min_distance)
+    grid.add(np.random.rand() * width, np.random.rand() * height)
+    active = [0]
+    while active:
+        active_idx = np.random.randint(len(active))
+        center_x, center_y = grid.coords[active[active_idx]]
+        # a narrow annulus [min_distance, 1.5 * min_distance) packs points densely
+        radiuses = min_distance * (1 + 0.5 * np.random.rand(_ATTEMPTS_PER_POINT))
+        angles = 2 * math.pi * np.random.rand(_ATTEMPTS_PER_POINT)
+        candidates_x = center_x + radiuses * np.cos(angles)
+        candidates_y = center_y + radiuses * np.sin(angles)
+        for x, y in zip(candidates_x.tolist(), candidates_y.tolist()):
+            if 0 <= x <= width and 0 <= y <= height and grid.fits(x, y):
+                grid.add(x, y)
+                active.append(len(grid.coords) - 1)
+                break
+        else:
+            active[active_idx] = active[-1]
+            active.pop()
+    return [Point(x, y) for x, y in grid.coords]
@@ -5,10 +5,6 @@ from __future__ import annotations
 from typing import Any, List, Sequence
 
 import pygame
-from shapely.geometry import Point as ShapelyPoint  # type: ignore [import-untyped]
-from shapely.geometry.polygon import (  # type: ignore [import-untyped]
-    Polygon as ShapelyPolygon,
-)
 from shortuuid import uuid
 from typing_extensions import override
 
@@ -21,7 +17,7 @@ from src.type import Color
 
 
 class Polygon(Shape):
-    __slots__ = ("points", "degrees")
+    __slots__ = ("points", "degrees", "_rotated_points", "_rotated_degrees")
 
     def __init__(
         self, shape_type: ShapeType, color: Color, points: Sequence[Point]
@@ -30,19 +26,27 @@ class Polygon(Shape):
         self.id = f"Polygon-{uuid()}"
         self.points = points
         self.degrees: Degrees = create_degrees(0)
+        # rotated points are cached, so they are only recomputed when the angle changes
+        self._rotated_points: Sequence[Point] = []
+        self._rotated_degrees: Degrees | None = None
 
     @override
     def draw(self, surface: pygame.surface.Surface, position: Point) -> None:
         super()._set_position(position)
         tuples: List[tuple[float, float]] = []
-        for point in self.points:
-            rotated_point = point.rotate(self.degrees)
+        for rotated_point in self._get_rotated_points():
             tuples.append((rotated_point + self.position).to_tuple())
         pygame.draw.polygon(
             surface, self.color, tuples, width=1 if Config.unfilled_shapes else 0
         )
 
     def contains(self, point: Point) -> bool:
+        # shapely is slow to import and only needed for hit tests
+        from shapely.geometry import Point as ShapelyPoint  # type: ignore [import-untyped]
+        from shapely.geometry.polygon import (  # type: ignore [import-untyped]
+            Polygon as ShapelyPolygon,
+        )
+
         shapely_point: Any = ShapelyPoint(point.left, point.top)
         tuples = [(x + self.position).to_tuple() for x in self.points]
         polygon: Any = ShapelyPolygon(tuples)
@@ -60,3 +64,9 @@ class Polygon(Shape):
         return Polygon(
             self.type, self.color, [Point(p.left * f, p.top * f) for p in self.points]
         )
+
+    def _get_rotated_points(self) -> Sequence[Point]:
+        if self._rotated_degrees != self.degrees:
+            self._rotated_points = [point.rotate(self.degrees) for point in self.points]
+            self._rotated_degrees = self.degrees
+        return self._rotated_points
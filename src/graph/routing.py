@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Final
+
+from src.entity import Path, Station
+from src.geometry.type import ShapeType
+from src.travel_plan import Leg
+
+TopologyKey = tuple[Hashable, ...]
+
+
+@dataclass(frozen=True)
+class Route:
+    # one leg per path taken, the last one reaching the destination
+    legs: Sequence[Leg]
+    # distance travelled plus the transfer penalties
+    cost: float
+
+
+@dataclass(frozen=True)
+class _ShortestPathTree:
+    # cost from each node to the nearest destination, and the next node on the way
+    costs: list[float]
+    next_nodes: list[int]
+
+
+class Router:
+    """
+    Shortest routes over a line-expanded graph: a node per station of each path,
+    edges between consecutive stations of a path weighted by their distance, and
+    edges between the nodes of a station weighted by the transfer penalty. Metros
+    run both ways on open paths, but only forward on loops, so the edges of loops
+    only go forward.
+
+    The graph is rebuilt when the stations or paths change. For each destination
+    shape, a shortest path tree towards the stations of that shape is computed once
+    with Dijkstra and shared by every passenger going there.
+    """
+
+    __slots__ = (
+        "transfer_penalty",
+        "_topology_key",
+        "_node_stations",
+        "_node_paths",
+        "_edges",
+        "_station_nodes",
+        "_path_nodes",
+        "_trees",
+    )
+
+    def __init__(self, transfer_penalty: float) -> None:
+        assert transfer_penalty > 0
+        self.transfer_penalty: Final = transfer_penalty
+        self._topology_key: TopologyKey | None = None
+        self._node_stations: list[Station] = []
+        self._node_paths: list[Path] = []
+        # edges into each node and their weight, the trees being built backward
+        self._edges: list[list[tuple[int, float]]] = []
+        self._station_nodes: dict[Station, list[int]] = {}
+        self._path_nodes: dict[Path, range] = {}
+        self._trees: Final[dict[ShapeType, _ShortestPathTree]] = {}
+
+    ######################
+    ### public methods ###
+    ######################
+
+    def update(self, stations: Sequence[Station], paths: Sequence[Path]) -> None:
+        """Rebuilds the graph, and forgets the trees, if the network changed"""
+        topology_key = _get_topology_key(stations, paths)
+        if topology_key == self._topology_key:
+            return
+        self._topology_key = topology_key
+        self._trees.clear()
+        self._build_graph(
+            [path for path in paths if not path.is_being_created and path.stations]
+        )
+
+    def find_route(
+        self,
+        origin: Station,
+        shape_type: ShapeType,
+        destinations: Sequence[Station],
+    ) -> Route | None:
+        """
+        Cheapest route from the station to the nearest one of the destinations,
+        which are the stations of the shape type. None if there is no route.
+        """
+        origin_nodes = self._station_nodes.get(origin)
+        if not origin_nodes:
+            return None
+        tree = self._get_tree(shape_type, destinations)
+        node = min(origin_nodes, key=tree.costs.__getitem__)
+        cost = tree.costs[node]
+        if cost == math.inf or cost == 0:
+            return None
+        return Route(self._follow_tree(tree, node, origin), cost)
+
+    def find_route_from_path(
+        self,
+        path: Path,
+        board_station: Station,
+        shape_type: ShapeType,
+        destinations: Sequence[Station],
+    ) -> Route | None:
+        """
+        Cheapest route for a passenger riding the path since the board station,
+        the first leg staying on it. None if the path isn't in the graph or there
+        is no route.
+        """
+        path_nodes = self._path_nodes.get(path)
+        if not path_nodes:
+            return None
+        tree = self._get_tree(shape_type, destinations)
+        node = min(path_nodes, key=tree.costs.__getitem__)
+        cost = tree.costs[node]
+        if cost == math.inf:
+            return None
+        legs = self._follow_tree(tree, node, board_station)
+        if legs[0].path is not path:
+            # getting off where the path is left, even the board station
+            legs.insert(0, Leg(path, board_station, self._node_stations[node]))
+        return Route(legs, cost)
+
+    #######################
+    ### private methods ###
+    #######################
+
+    def _build_graph(self, paths: Sequence[Path]) -> None:
+        self._node_stations = []
+        self._node_paths = []
+        self._edges = []
+        self._station_nodes = {}
+        self._path_nodes = {}
+        for path in paths:
+            first = len(self._node_stations)
+            for station in path.stations:
+                node = len(self._node_stations)
+                self._node_stations.append(station)
+                self._node_paths.append(path)
+                self._edges.append([])
+                self._station_nodes.setdefault(station, []).append(node)
+            last = len(self._node_stations) - 1
+            self._path_nodes[path] = range(first, last + 1)
+            for node in range(first, last):
+                self._add_edge(node, node + 1, both_ways=not path.is_looped)
+            if path.is_looped and last - first > 1:
+                self._add_edge(last, first, both_ways=False)
+        for nodes in self._station_nodes.values():
+            for i, node in enumerate(nodes):
+                for other in nodes[i + 1 :]:
+                    self._edges[node].append((other, self.transfer_penalty))
+                    self._edges[other].append((node, self.transfer_penalty))
+
+    def _get_tree(
+        self, shape_type: ShapeType, destinations: Sequence[Station]
+    ) -> _ShortestPathTree:
+        tree = self._trees.get(shape_type)
+        if tree is None:
+            tree = self._trees[shape_type] = self._build_tree(destinations)
+        return tree
+
+    def _follow_tree(
+        self, tree: _ShortestPathTree, node: int, board_station: Station
+    ) -> list[Leg]:
+        legs: list[Leg] = []
+        next_node = tree.next_nodes[node]
+        while next_node != -1:
+            station = self._node_stations[node]
+            if self._node_stations[next_node] is station:
+                # transfer
+                if station is not board_station:
+                    legs.append(Leg(self._node_paths[node], board_station, station))
+                    board_station = station
+            node, next_node = next_node, tree.next_nodes[next_node]
+        legs.append(
+            Leg(self._node_paths[node], board_station, self._node_stations[node])
+        )
+        return legs
+
+    def _add_edge(self, a: int, b: int, both_ways: bool) -> None:
+        """Edge from a to b, and from b to a if both_ways"""
+        distance = self._node_stations[a].get_distance_to(self._node_stations[b])
+        self._edges[b].append((a, distance))
+        if both_ways:
+            self._edges[a].append((b, distance))
+
+    def _build_tree(self, destinations: Sequence[Station]) -> _ShortestPathTree:
+        """Dijkstra from all the destinations at once, following the edges backward"""
+        costs = [math.inf] * len(self._node_stations)
+        next_nodes = [-1] * len(self._node_stations)
+        heap: list[tuple[float, int]] = []
+        for station in destinations:
+            for node in self._station_nodes.get(station, ()):
+                costs[node] = 0
+                heap.append((0, node))
+        heapq.heapify(heap)
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if cost > costs[node]:
+                continue
+            for neighbor, weight in self._edges[node]:
+                new_cost = cost + weight
+                if new_cost < costs[neighbor]:
+                    costs[neighbor] = new_cost
+                    next_nodes[neighbor] = node
+                    heapq.heappush(heap, (new_cost, neighbor))
+        return _ShortestPathTree(costs, next_nodes)
+
+
+def _get_topology_key(
+    stations: Sequence[Station], paths: Sequence[Path]
+) -> TopologyKey:
+    return (
+        tuple(stations),
+        tuple((path.id, path.version, path.is_being_created) for path in paths),
+    )
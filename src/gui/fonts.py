@@ -0,0 +1,21 @@
+from pathlib import Path
+from typing import Final
+
+import pygame
+
+# font shipped with pygame, so text looks the same on every host
+font_path: Final = Path(pygame.__file__).parent / pygame.font.get_default_font()
+
+_fonts: Final[dict[int, pygame.font.Font]] = {}
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """The bundled font at this size, loaded once per process"""
+    if not pygame.font.get_init():
+        # fonts loaded before pygame.font.quit can't be used anymore
+        _fonts.clear()
+        pygame.font.init()
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(font_path, size)
+    return font
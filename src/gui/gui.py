@@ -4,13 +4,17 @@ import pygame
 
 from src.config import (
     Config,
+    debug_font_size,
     gui_height_proportion,
     score_display_coords,
     score_font_size,
+    text_cache_size,
 )
 from src.entity.path import Path
 from src.geometry.point import Point
+from src.gui.fonts import get_font
 from src.gui.path_button import PathButton, get_path_buttons
+from src.gui.text_cache import TextCache
 
 _gui_height = Config.screen_height * gui_height_proportion
 _main_surface_height = Config.screen_height - _gui_height
@@ -29,22 +33,27 @@ class GUI:
         "path_buttons",
         "path_to_button",
         "buttons",
-        "font",
-        "small_font",
         "last_pos",
         "clock",
+        "text_cache",
     )
 
     def init(self, max_num_paths: int) -> None:
-        pygame.font.init()
         self.path_to_button: dict[Path, PathButton] = {}
 
-        self.font = pygame.font.SysFont("arial", score_font_size)
-        self.small_font = pygame.font.SysFont("arial", 18)
         self.path_buttons: Sequence[PathButton] = get_path_buttons(max_num_paths)
         self.buttons = [*self.path_buttons]
         self.last_pos: Point | None = None
         self.clock: pygame.time.Clock | None = None
+        self.text_cache = TextCache(text_cache_size)
+
+    @property
+    def font(self) -> pygame.font.Font:
+        return get_font(score_font_size)
+
+    @property
+    def small_font(self) -> pygame.font.Font:
+        return get_font(debug_font_size)
 
     def assign_paths_to_buttons(self, paths: Sequence[Path]) -> None:
         for path_button in self.path_buttons:
@@ -73,5 +82,5 @@ class GUI:
         gui.fill((220, 220, 220))
         for button in self.buttons:
             button.draw(gui)
-        text_surface = self.font.render(f"Score: {score}", True, (0, 0, 0))
+        text_surface = self.text_cache.render(self.font, f"Score: {score}", (0, 0, 0))
         gui.blit(text_surface, score_display_coords)
@@ -0,0 +1,41 @@
+from collections import OrderedDict
+from typing import Final
+
+import pygame
+
+from src.type import Color
+
+TextKey = tuple[pygame.font.Font, str, Color]
+
+
+class TextCache:
+    """Least recently used cache of rendered text surfaces"""
+
+    __slots__ = ("_surfaces", "_max_size")
+
+    def __init__(self, max_size: int) -> None:
+        assert max_size > 0
+        self._max_size: Final = max_size
+        self._surfaces: Final[OrderedDict[TextKey, pygame.surface.Surface]] = (
+            OrderedDict()
+        )
+
+    def render(
+        self, font: pygame.font.Font, text: str, color: Color
+    ) -> pygame.surface.Surface:
+        key = (font, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self._max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
@@ -5,10 +5,11 @@ import time
 import numpy as np
 import pygame
 
-from src.config import Config, screen_color
+from src.config import Config, frame_metrics_interval_ms, screen_color
 from src.engine.engine import Engine
 from src.event.convert import convert_pygame_event
 from src.reactor import UI_Reactor
+from src.tools.frame_metrics import FrameMetricsLogger
 from src.tools.setup_logging import configure_logger
 
 logger = configure_logger("main")
@@ -56,12 +57,12 @@ def main() -> None:
     engine = Engine()
     engine.set_clock(clock)
     reactor = UI_Reactor(engine)
+    frame_metrics = FrameMetricsLogger(logger, frame_metrics_interval_ms)
 
     while True:
         dt_ms = clock.tick(Config.framerate)
         t = time.time()
-        logger.info(f"{dt_ms=}")
-        logger.info(f"fps: {round(clock.get_fps(), 2)}\n")
+        frame_metrics.add_frame(dt_ms, clock.get_fps())
         engine.increment_time(dt_ms)
         screen.fill(screen_color)
         engine.render(screen)
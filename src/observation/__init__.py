@@ -0,0 +1,16 @@
+from .encoder import ObservationEncoder
+from .layout import SHAPE_TYPES, ObservationArrays, ObservationLayout
+from .pixels import PixelObservation
+from .shared import SharedObservationReader, SharedObservationWriter
+from .tensor_encoder import TensorObservationEncoder
+
+__all__ = [
+    "ObservationArrays",
+    "ObservationEncoder",
+    "ObservationLayout",
+    "PixelObservation",
+    "SHAPE_TYPES",
+    "SharedObservationReader",
+    "SharedObservationWriter",
+    "TensorObservationEncoder",
+]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import Final
+
+from src.engine.game_components import GameComponents
+
+from .layout import SHAPE_INDEXES, ObservationArrays, ObservationLayout
+
+
+class ObservationEncoder:
+    """
+    Writes the state of the game into the observation arrays of a layout, in place.
+    Entities beyond the layout maximums are left out.
+    """
+
+    __slots__ = ("_layout",)
+
+    def __init__(self, layout: ObservationLayout) -> None:
+        self._layout: Final = layout
+
+    def encode(self, components: GameComponents, arrays: ObservationArrays) -> None:
+        version = arrays["version"]
+        version[0] += 1
+        self._encode_stations(components, arrays)
+        self._encode_paths(components, arrays)
+        self._encode_metros(components, arrays)
+        version[0] += 1
+
+    def _encode_stations(
+        self, components: GameComponents, arrays: ObservationArrays
+    ) -> None:
+        stations = components.stations[: self._layout.max_stations]
+        mask = arrays["station_mask"]
+        positions = arrays["station_positions"]
+        shapes = arrays["station_shapes"]
+        queues = arrays["station_queues"]
+        mask[:] = False
+        positions[:] = 0
+        shapes[:] = -1
+        queues[:] = 0
+        for i, station in enumerate(stations):
+            mask[i] = True
+            positions[i] = station.position.to_tuple()
+            shapes[i] = SHAPE_INDEXES[station.shape.type]
+            queue = queues[i]
+            for passenger in station.passengers:
+                queue[SHAPE_INDEXES[passenger.destination_shape.type]] += 1
+
+    def _encode_paths(
+        self, components: GameComponents, arrays: ObservationArrays
+    ) -> None:
+        station_indexes = {
+            station: i
+            for i, station in enumerate(
+                components.stations[: self._layout.max_stations]
+            )
+        }
+        mask = arrays["path_mask"]
+        is_looped = arrays["path_is_looped"]
+        membership = arrays["path_membership"]
+        mask[:] = False
+        is_looped[:] = False
+        membership[:] = 0
+        for i, path in enumerate(components.paths[: self._layout.max_paths]):
+            mask[i] = True
+            is_looped[i] = path.is_looped
+            for station in path.stations:
+                index = station_indexes.get(station)
+                if index is not None:
+                    membership[i, index] = 1
+
+    def _encode_metros(
+        self, components: GameComponents, arrays: ObservationArrays
+    ) -> None:
+        path_indexes = {
+            path.id: i
+            for i, path in enumerate(components.paths[: self._layout.max_paths])
+        }
+        mask = arrays["metro_mask"]
+        positions = arrays["metro_positions"]
+        paths = arrays["metro_paths"]
+        loads = arrays["metro_loads"]
+        mask[:] = False
+        positions[:] = 0
+        paths[:] = -1
+        loads[:] = 0
+        for i, metro in enumerate(components.metros[: self._layout.max_metros]):
+            mask[i] = True
+            positions[i] = metro.position.to_tuple()
+            paths[i] = path_indexes.get(metro.path_id, -1) if metro.path_id else -1
+            loads[i] = metro.occupation
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+import numpy as np
+import numpy.typing as npt
+
+from src.config import max_num_metros, max_num_paths, observation_max_stations
+from src.geometry.type import ShapeType
+
+# index of each shape type in the shape columns of the observation
+SHAPE_TYPES: Final = tuple(ShapeType)
+SHAPE_INDEXES: Final = {shape_type: i for i, shape_type in enumerate(SHAPE_TYPES)}
+
+ArraySpec = tuple[tuple[int, ...], np.dtype[Any]]
+ObservationArrays = dict[str, npt.NDArray[Any]]
+
+
+@dataclass(frozen=True)
+class ObservationLayout:
+    """
+    Shapes and dtypes of the observation arrays, and their offsets when they are
+    stored one after another in a single buffer. Rows beyond the number of
+    entities are zeroed and marked as absent in the masks.
+    """
+
+    max_stations: int = observation_max_stations
+    max_paths: int = max_num_paths
+    max_metros: int = max_num_metros
+    specs: dict[str, ArraySpec] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        num_shapes = len(SHAPE_TYPES)
+        s, p, m = self.max_stations, self.max_paths, self.max_metros
+        specs: dict[str, ArraySpec] = {
+            # incremented before and after each write: odd while writing
+            "version": ((1,), np.dtype(np.int64)),
+            "station_mask": ((s,), np.dtype(np.bool_)),
+            "station_positions": ((s, 2), np.dtype(np.float32)),
+            # shape index, -1 for absent stations
+            "station_shapes": ((s,), np.dtype(np.int8)),
+            # waiting passengers by destination shape
+            "station_queues": ((s, num_shapes), np.dtype(np.int16)),
+            "path_mask": ((p,), np.dtype(np.bool_)),
+            "path_is_looped": ((p,), np.dtype(np.bool_)),
+            # 1 if the station is in the path
+            "path_membership": ((p, s), np.dtype(np.int8)),
+            "metro_mask": ((m,), np.dtype(np.bool_)),
+            "metro_positions": ((m, 2), np.dtype(np.float32)),
+            # path index, -1 for absent metros
+            "metro_paths": ((m,), np.dtype(np.int8)),
+            "metro_loads": ((m,), np.dtype(np.int16)),
+        }
+        object.__setattr__(self, "specs", specs)
+
+    def get_offsets(self) -> dict[str, int]:
+        """Offset of each array in a buffer holding all of them, 8-byte aligned"""
+        offsets: dict[str, int] = {}
+        offset = 0
+        for name, (shape, dtype) in self.specs.items():
+            offsets[name] = offset
+            offset += _align(int(np.prod(shape)) * dtype.itemsize)
+        return offsets
+
+    @property
+    def num_bytes(self) -> int:
+        return sum(
+            _align(int(np.prod(shape)) * dtype.itemsize)
+            for shape, dtype in self.specs.values()
+        )
+
+    def create_arrays(self, buffer: memoryview) -> ObservationArrays:
+        """Views of the arrays over the buffer, without copying it"""
+        assert len(buffer) >= self.num_bytes
+        offsets = self.get_offsets()
+        return {
+            name: np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offsets[name])
+            for name, (shape, dtype) in self.specs.items()
+        }
+
+
+def _align(num_bytes: int) -> int:
+    return (num_bytes + 7) // 8 * 8
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Final
+
+import numpy as np
+import numpy.typing as npt
+import pygame
+
+from src.config import Config, pixel_observation_size, screen_color
+from src.engine.engine import Engine
+
+PixelArray = npt.NDArray[np.uint8]
+
+
+class PixelObservation:
+    """
+    Renders the engine into an offscreen surface and exposes the frame as arrays of
+    shape (height, width, 3), without copying it.
+
+    The surfaces are created over NumPy buffers rather than viewed through
+    pygame.surfarray.pixels3d, which locks the surface for as long as the view
+    lives and makes blitting into it fail. The arrays returned are therefore
+    always up to date and can be kept between renders.
+    """
+
+    __slots__ = ("_engine", "surface", "pixels", "_scaled_surface", "observation")
+
+    def __init__(
+        self, engine: Engine, size: tuple[int, int] | None = pixel_observation_size
+    ) -> None:
+        """
+        The frame is downsampled in place to `size` (width, height) after each
+        render; with None the observation is the full resolution frame.
+        """
+        self._engine: Final = engine
+        self.surface, buffer = _create_surface(
+            (Config.screen_width, Config.screen_height)
+        )
+        self.pixels: Final[PixelArray] = buffer[..., :3]
+        self._scaled_surface: pygame.surface.Surface | None = None
+        observation = self.pixels
+        if size is not None and size != self.surface.get_size():
+            self._scaled_surface, scaled_buffer = _create_surface(size)
+            observation = scaled_buffer[..., :3]
+        self.observation: Final[PixelArray] = observation
+
+    def render(self) -> PixelArray:
+        self.surface.fill(screen_color)
+        self._engine.render(self.surface)
+        if self._scaled_surface:
+            pygame.transform.smoothscale(
+                self.surface, self._scaled_surface.get_size(), self._scaled_surface
+            )
+        return self.observation
+
+
+def _create_surface(size: tuple[int, int]) -> tuple[pygame.surface.Surface, PixelArray]:
+    width, height = size
+    buffer = np.zeros((height, width, 4), dtype=np.uint8)
+    return pygame.image.frombuffer(buffer.data, size, "RGBX"), buffer
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Final
+
+from src.engine.game_components import GameComponents
+
+from .encoder import ObservationEncoder
+from .layout import ObservationArrays, ObservationLayout
+
+
+class SharedObservationWriter:
+    """
+    Owns a shared memory block holding the observation arrays of a layout, and
+    encodes the game state directly into it. Readers in other processes attach to
+    it by name.
+    """
+
+    __slots__ = ("layout", "_memory", "arrays", "_encoder")
+
+    def __init__(self, layout: ObservationLayout, name: str | None = None) -> None:
+        self.layout: Final = layout
+        self._memory: Final = shared_memory.SharedMemory(
+            name=name, create=True, size=layout.num_bytes
+        )
+        assert self._memory.buf is not None
+        self.arrays: Final[ObservationArrays] = layout.create_arrays(self._memory.buf)
+        for array in self.arrays.values():
+            array.fill(0)
+        self._encoder: Final = ObservationEncoder(layout)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def write(self, components: GameComponents) -> None:
+        self._encoder.encode(components, self.arrays)
+
+    def close(self) -> None:
+        """Releases the block; the writer owns it, so it's also destroyed"""
+        self.arrays.clear()
+        self._memory.close()
+        self._memory.unlink()
+
+
+class SharedObservationReader:
+    """
+    Zero-copy views of the observation arrays written by a SharedObservationWriter
+    in another process. The views change as the writer writes.
+    """
+
+    __slots__ = ("layout", "_memory", "arrays")
+
+    def __init__(self, name: str, layout: ObservationLayout) -> None:
+        self.layout: Final = layout
+        self._memory: Final = _attach(name)
+        assert self._memory.buf is not None
+        self.arrays: Final[ObservationArrays] = layout.create_arrays(self._memory.buf)
+
+    @property
+    def version(self) -> int:
+        return int(self.arrays["version"][0])
+
+    def is_being_written(self) -> bool:
+        return self.version % 2 == 1
+
+    def snapshot(self) -> ObservationArrays | None:
+        """
+        A copy of the arrays that is consistent, or None if the writer was writing
+        while copying them.
+        """
+        version = self.version
+        if version % 2 == 1:
+            return None
+        copy = {name: array.copy() for name, array in self.arrays.items()}
+        if self.version != version:
+            return None
+        return copy
+
+    def close(self) -> None:
+        self.arrays.clear()
+        self._memory.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attaches to the block without registering it with the resource tracker of this
+    process, which would destroy the block, or warn about a leak, when the process
+    exits, while the writer still owns it.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # before 3.13, attaching always registers the block
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
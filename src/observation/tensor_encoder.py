@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from typing import Any, Final
+
+import numpy as np
+import numpy.typing as npt
+
+from src.config import Config
+from src.engine.game_components import GameComponents
+from src.entity import Metro, Path, Station
+from src.entity.holder import Holder
+from src.entity.ids import EntityId
+
+from .layout import SHAPE_INDEXES, SHAPE_TYPES, ObservationArrays, ObservationLayout
+
+# columns of the station features
+STATION_PRESENT: Final = 0
+STATION_X: Final = 1
+STATION_Y: Final = 2
+STATION_SHAPE: Final = 3  # one column per shape type from here
+STATION_OCCUPATION: Final = STATION_SHAPE + len(SHAPE_TYPES)
+NUM_STATION_FEATURES: Final = STATION_OCCUPATION + 1
+
+# columns of the metro features
+METRO_PRESENT: Final = 0
+METRO_X: Final = 1
+METRO_Y: Final = 2
+METRO_LOAD: Final = 3
+METRO_PATH: Final = 4
+METRO_IS_FORWARD: Final = 5
+NUM_METRO_FEATURES: Final = 6
+
+PathKey = tuple[EntityId, int]
+
+
+class TensorObservationEncoder:
+    """
+    Fixed-shape arrays describing the game, allocated once and updated in place:
+    - station_features: (stations, NUM_STATION_FEATURES), positions normalized
+    - path_adjacency: (paths, stations, stations), 1 between consecutive stations
+    - metro_features: (metros, NUM_METRO_FEATURES)
+    - passenger_counts: (stations + metros, shapes), passengers by destination shape
+
+    Only what changed since the last update is rewritten: holders are marked when
+    the mediator reports a change in their passengers, and paths when their version
+    changes. Metro positions are rewritten on every update.
+    """
+
+    __slots__ = (
+        "layout",
+        "arrays",
+        "_components",
+        "_stations",
+        "_metros",
+        "_path_keys",
+        "_holder_rows",
+        "_dirty_holders",
+    )
+
+    def __init__(self, components: GameComponents, layout: ObservationLayout) -> None:
+        self.layout: Final = layout
+        self._components: Final = components
+        s, p, m = layout.max_stations, layout.max_paths, layout.max_metros
+        self.arrays: Final[ObservationArrays] = {
+            "station_features": np.zeros((s, NUM_STATION_FEATURES), np.float32),
+            "path_adjacency": np.zeros((p, s, s), np.int8),
+            "metro_features": np.zeros((m, NUM_METRO_FEATURES), np.float32),
+            "passenger_counts": np.zeros((s + m, len(SHAPE_TYPES)), np.int16),
+        }
+        # entities the arrays were written for
+        self._stations: list[Station] = []
+        self._metros: list[Metro] = []
+        self._path_keys: list[PathKey | None] = [None] * p
+        # row of each holder in passenger_counts, by identity
+        self._holder_rows: dict[int, int] = {}
+        self._dirty_holders: Final[dict[int, Holder]] = {}
+        components.passengers_mediator.add_holder_listener(self._on_holder_changed)
+        self.update()
+
+    ######################
+    ### public methods ###
+    ######################
+
+    def update(self) -> ObservationArrays:
+        components = self._components
+        stations = components.stations[: self.layout.max_stations]
+        metros = components.metros[: self.layout.max_metros]
+        stations_changed = stations != self._stations
+        if stations_changed:
+            self._write_all_stations(stations)
+        if stations_changed or metros != self._metros:
+            self._metros = list(metros)
+            self._update_holder_rows()
+            self._dirty_holders.clear()
+            for row, holder in enumerate([*self._stations, *self._metros]):
+                self._write_counts(row, holder)
+            self._clear_rows_from(len(self._stations), len(self._metros))
+        else:
+            for key, holder in self._dirty_holders.items():
+                dirty_row = self._holder_rows.get(key)
+                if dirty_row is not None:
+                    self._write_counts(dirty_row, holder)
+            self._dirty_holders.clear()
+        self._write_paths(force=stations_changed)
+        self._write_metros()
+        return self.arrays
+
+    def close(self) -> None:
+        self._components.passengers_mediator.remove_holder_listener(
+            self._on_holder_changed
+        )
+
+    #######################
+    ### private methods ###
+    #######################
+
+    def _on_holder_changed(self, holder: Holder) -> None:
+        self._dirty_holders[id(holder)] = holder
+
+    def _update_holder_rows(self) -> None:
+        max_stations = self.layout.max_stations
+        self._holder_rows = {
+            **{id(station): i for i, station in enumerate(self._stations)},
+            **{id(metro): max_stations + i for i, metro in enumerate(self._metros)},
+        }
+
+    def _clear_rows_from(self, num_stations: int, num_metros: int) -> None:
+        counts = self.arrays["passenger_counts"]
+        counts[num_stations : self.layout.max_stations] = 0
+        counts[self.layout.max_stations + num_metros :] = 0
+
+    def _write_all_stations(self, stations: list[Station]) -> None:
+        self._stations = list(stations)
+        features = self.arrays["station_features"]
+        features[:] = 0
+        for i, station in enumerate(stations):
+            row = features[i]
+            row[STATION_PRESENT] = 1
+            row[STATION_X] = station.position.left / Config.screen_width
+            row[STATION_Y] = station.position.top / Config.screen_height
+            row[STATION_SHAPE + SHAPE_INDEXES[station.shape.type]] = 1
+
+    def _write_counts(self, row: int, holder: Holder) -> None:
+        counts = self.arrays["passenger_counts"][row]
+        counts[:] = 0
+        for passenger in holder.passengers:
+            counts[SHAPE_INDEXES[passenger.destination_shape.type]] += 1
+        if row < self.layout.max_stations:
+            self.arrays["station_features"][row, STATION_OCCUPATION] = (
+                holder.occupation / holder.capacity
+            )
+        else:
+            self.arrays["metro_features"][
+                row - self.layout.max_stations, METRO_LOAD
+            ] = (holder.occupation / holder.capacity)
+
+    def _write_paths(self, force: bool) -> None:
+        paths = self._components.paths[: self.layout.max_paths]
+        adjacency = self.arrays["path_adjacency"]
+        for i in range(self.layout.max_paths):
+            path = paths[i] if i < len(paths) else None
+            key = (path.id, path.version) if path else None
+            if not force and key == self._path_keys[i]:
+                continue
+            self._path_keys[i] = key
+            adjacency[i] = 0
+            if path:
+                self._write_path_adjacency(adjacency[i], path)
+
+    def _write_path_adjacency(self, adjacency: npt.NDArray[Any], path: Path) -> None:
+        indexes = [self._get_station_index(station) for station in path.stations]
+        pairs = list(zip(indexes, indexes[1:]))
+        if path.is_looped and len(indexes) > 2:
+            pairs.append((indexes[-1], indexes[0]))
+        for a, b in pairs:
+            if a is not None and b is not None:
+                adjacency[a, b] = adjacency[b, a] = 1
+
+    def _get_station_index(self, station: Station) -> int | None:
+        row = self._holder_rows.get(id(station))
+        return row if row is not None and row < self.layout.max_stations else None
+
+    def _write_metros(self) -> None:
+        features = self.arrays["metro_features"]
+        path_indexes = {
+            path.id: i
+            for i, path in enumerate(self._components.paths[: self.layout.max_paths])
+        }
+        features[len(self._metros) :] = 0
+        for i, metro in enumerate(self._metros):
+            row = features[i]
+            row[METRO_PRESENT] = 1
+            row[METRO_X] = metro.position.left / Config.screen_width
+            row[METRO_Y] = metro.position.top / Config.screen_height
+            row[METRO_PATH] = (
+                path_indexes.get(metro.path_id, -1) if metro.path_id else -1
+            )
+            row[METRO_IS_FORWARD] = bool(metro.travel_step and metro.is_forward)
@@ -1,16 +1,21 @@
-from typing import Final
+from typing import Callable, Final, Sequence
 
 from src.entity.holder import Holder
+from src.entity.metro import Metro
 from src.entity.passenger import Passenger
 from src.entity.station import Station
 from src.exceptions import GameException
 
 
 class PassengersMediator:
-    __slots__ = ("_holders",)
+    __slots__ = ("_holders", "_holder_listeners", "_arrival_listeners")
 
     def __init__(self) -> None:
         self._holders: Final[list[Holder]] = []
+        # called with every holder whose passengers change
+        self._holder_listeners: Final[list[Callable[[Holder], None]]] = []
+        # called with every metro arriving at a station
+        self._arrival_listeners: Final[list[Callable[[Metro], None]]] = []
 
     ######################
     ### public methods ###
@@ -25,12 +30,46 @@ class PassengersMediator:
                 "Passengers can be in more than one Holder at the same time"
             )
 
+    def on_new_passengers_added(self, passengers: Sequence[Passenger]) -> None:
+        new_passengers = set(passengers)
+        if len(new_passengers) != len(passengers) or self._any_holder_has_any(
+            new_passengers
+        ):
+            raise GameException(
+                "Passengers can be in more than one Holder at the same time"
+            )
+
     def on_passenger_exit(self, source: Holder, passenger: Passenger) -> None:
         if isinstance(source, Station):
             passenger.last_station = source
 
+    def on_holder_changed(self, holder: Holder) -> None:
+        for listener in self._holder_listeners:
+            listener(holder)
+
+    def add_holder_listener(self, listener: Callable[[Holder], None]) -> None:
+        self._holder_listeners.append(listener)
+
+    def remove_holder_listener(self, listener: Callable[[Holder], None]) -> None:
+        self._holder_listeners.remove(listener)
+
+    def on_metro_arrival(self, metro: Metro) -> None:
+        for listener in self._arrival_listeners:
+            listener(metro)
+
+    def add_arrival_listener(self, listener: Callable[[Metro], None]) -> None:
+        self._arrival_listeners.append(listener)
+
+    def remove_arrival_listener(self, listener: Callable[[Metro], None]) -> None:
+        self._arrival_listeners.remove(listener)
+
     #######################
     ### private methods ###
     #######################
     def _any_holder_has(self, passenger: Passenger) -> bool:
         return any(passenger in holder.passengers for holder in self._holders)
+
+    def _any_holder_has_any(self, passengers: set[Passenger]) -> bool:
+        return any(
+            not passengers.isdisjoint(holder.passengers) for holder in self._holders
+        )
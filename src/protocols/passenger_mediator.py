@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Callable, Protocol, Sequence
 
 from src.entity.passenger import Passenger
 
 if TYPE_CHECKING:
     from src.entity.holder import Holder
+    from src.entity.metro import Metro
 
 
 class PassengersMediatorProtocol(Protocol):
@@ -14,4 +15,18 @@ class PassengersMediatorProtocol(Protocol):
 
     def on_new_passenger_added(self, passenger: Passenger) -> None: ...
 
+    def on_new_passengers_added(self, passengers: Sequence[Passenger]) -> None: ...
+
     def on_passenger_exit(self, source: Holder, passenger: Passenger) -> None: ...
+
+    def on_holder_changed(self, holder: Holder) -> None: ...
+
+    def add_holder_listener(self, listener: Callable[[Holder], None]) -> None: ...
+
+    def remove_holder_listener(self, listener: Callable[[Holder], None]) -> None: ...
+
+    def on_metro_arrival(self, metro: Metro) -> None: ...
+
+    def add_arrival_listener(self, listener: Callable[[Metro], None]) -> None: ...
+
+    def remove_arrival_listener(self, listener: Callable[[Metro], None]) -> None: ...
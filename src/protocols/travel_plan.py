@@ -5,14 +5,22 @@ from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from src.entity import Path, Station
-    from src.graph.node import Node
+    from src.travel_plan import Leg
 
 
 class TravelPlanProtocol(Protocol):
-    next_path: Path | None
-    next_station: Station | None
-    node_path: Sequence[Node]
+    legs: Sequence[Leg]
 
-    def get_next_station(self) -> "Station | None": ...
+    @property
+    def remaining_legs(self) -> Sequence[Leg]: ...
 
-    def increment_next_station(self) -> None: ...
+    @property
+    def next_leg(self) -> Leg | None: ...
+
+    @property
+    def next_path(self) -> Path | None: ...
+
+    @property
+    def next_station(self) -> Station | None: ...
+
+    def complete_leg(self) -> None: ...
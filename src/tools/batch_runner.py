@@ -0,0 +1,163 @@
+"""
+Runs headless games for every combination of seeds, station counts and strategies
+in a pool of processes, and writes their metrics to a CSV or Parquet file.
+
+python -m src.tools.batch_runner --seeds 1 2 3 --stations 10 20
+    --strategies left_to_right loop --duration 300 --output results.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import os
+import random
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+import numpy as np
+
+from src.config import Config
+from src.engine.engine import Engine
+from src.exceptions import GameException
+from src.tools.strategies import STRATEGIES
+
+
+@dataclass(frozen=True)
+class RunSpec:
+    seed: int
+    num_stations: int
+    strategy: str
+    duration_s: float
+
+
+@dataclass(frozen=True)
+class RunResult:
+    seed: int
+    num_stations: int
+    strategy: str
+    duration_s: float
+    num_paths: int
+    num_metros: int
+    score: int
+    # delivered passengers per simulated minute
+    throughput_per_min: float
+    waiting_passengers: int
+    full_stations: int
+    ticks: int
+    wall_time_s: float
+    ticks_per_s: float
+
+
+def run_game(spec: RunSpec) -> RunResult:
+    """Runs one game in this process, stepping the engine at the game framerate"""
+    random.seed(spec.seed)
+    np.random.seed(spec.seed)
+    Config.num_stations = spec.num_stations
+    engine = Engine()
+    components = engine._components  # pyright: ignore [reportPrivateUsage]
+    STRATEGIES[spec.strategy](engine, list(components.stations))
+
+    dt_ms = round(1000 / Config.framerate)
+    ticks = round(spec.duration_s * 1000 / dt_ms)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        engine.increment_time(dt_ms)
+    wall_time_s = time.perf_counter() - start
+
+    score = components.status.score
+    return RunResult(
+        seed=spec.seed,
+        num_stations=spec.num_stations,
+        strategy=spec.strategy,
+        duration_s=spec.duration_s,
+        num_paths=len(components.paths),
+        num_metros=len(components.metros),
+        score=score,
+        throughput_per_min=score / (ticks * dt_ms / 60_000) if ticks else 0,
+        waiting_passengers=sum(station.occupation for station in components.stations),
+        full_stations=sum(not station.has_room() for station in components.stations),
+        ticks=ticks,
+        wall_time_s=wall_time_s,
+        ticks_per_s=ticks / wall_time_s if wall_time_s else 0,
+    )
+
+
+def run_batch(specs: Sequence[RunSpec], max_workers: int | None) -> list[RunResult]:
+    """
+    Runs the games in a pool whose workers are reused between games, so the game
+    modules are imported once per worker instead of once per game.
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker
+    ) as executor:
+        return list(executor.map(run_game, specs))
+
+
+def write_results(results: Sequence[RunResult], path: str | Path) -> None:
+    if Path(path).suffix == ".parquet":
+        _write_parquet(results, path)
+        return
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, [field.name for field in fields(RunResult)])
+        writer.writeheader()
+        writer.writerows(asdict(result) for result in results)
+
+
+def _write_parquet(results: Sequence[RunResult], path: str | Path) -> None:
+    try:
+        import pandas as pd  # type: ignore [import-untyped]
+    except ImportError as error:
+        raise GameException(
+            "Writing Parquet files requires pandas and pyarrow; use a .csv output"
+        ) from error
+    pd.DataFrame([asdict(result) for result in results]).to_parquet(path)
+
+
+def _init_worker() -> None:
+    # headless games
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Runs headless games in parallel and collects their metrics."
+    )
+    parser.add_argument("--seeds", type=int, nargs="+", required=True)
+    parser.add_argument("--stations", type=int, nargs="+", default=[10])
+    parser.add_argument(
+        "--strategies", nargs="+", choices=sorted(STRATEGIES), default=["loop"]
+    )
+    parser.add_argument(
+        "--duration", type=float, default=300, help="Simulated seconds per game"
+    )
+    parser.add_argument("--workers", type=int, help="Number of processes")
+    parser.add_argument(
+        "-o", "--output", default="results.csv", help="CSV or .parquet file"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    specs = [
+        RunSpec(seed, num_stations, strategy, args.duration)
+        for seed, num_stations, strategy in itertools.product(
+            args.seeds, args.stations, args.strategies
+        )
+    ]
+    start = time.perf_counter()
+    results = run_batch(specs, args.workers)
+    write_results(results, args.output)
+    print(
+        f"{len(results)} games written to {args.output} "
+        f"in {time.perf_counter() - start:.1f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
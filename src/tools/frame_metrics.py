@@ -0,0 +1,46 @@
+import logging
+from typing import Final
+
+
+class FrameMetricsLogger:
+    """
+    Accumulates the frame durations and logs a summary once per interval, so the
+    frame loop doesn't log (or format strings) every frame.
+    """
+
+    __slots__ = (
+        "_logger",
+        "_interval_ms",
+        "_elapsed_ms",
+        "_num_frames",
+        "_max_dt_ms",
+    )
+
+    def __init__(self, logger: logging.Logger, interval_ms: float) -> None:
+        assert interval_ms > 0
+        self._logger: Final = logger
+        self._interval_ms: Final = interval_ms
+        self._elapsed_ms: float = 0
+        self._num_frames = 0
+        self._max_dt_ms: float = 0
+
+    def add_frame(self, dt_ms: float, fps: float) -> None:
+        self._elapsed_ms += dt_ms
+        self._num_frames += 1
+        if dt_ms > self._max_dt_ms:
+            self._max_dt_ms = dt_ms
+        if self._elapsed_ms >= self._interval_ms:
+            self._flush(fps)
+
+    def _flush(self, fps: float) -> None:
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "frames: %d, mean dt_ms: %.1f, max dt_ms: %.1f, fps: %.2f",
+                self._num_frames,
+                self._elapsed_ms / self._num_frames,
+                self._max_dt_ms,
+                fps,
+            )
+        self._elapsed_ms = 0
+        self._num_frames = 0
+        self._max_dt_ms = 0
@@ -0,0 +1,103 @@
+import sys
+import threading
+from collections import Counter
+from pathlib import Path, PurePath
+from types import FrameType
+from typing import Final, Iterable
+
+from src.tools import trace_config as config
+from src.tools.setup_logging import get_main_directory
+
+exclude_patterns = config.exclude_patterns
+# frames under these are folded into them
+fold_patterns = config.custom_exclude_patterns
+fold_function_patterns = config.function_exclude_patterns
+
+
+class SamplingProfiler:
+    """
+    Snapshots the stack of a thread from a background thread at a fixed rate and
+    counts the samples of each stack. Frames matching the trace_config exclude
+    patterns are skipped, and the frames under a custom-excluded file or function
+    are folded into it, so its time is still accounted for.
+    """
+
+    __slots__ = ("_interval_s", "_thread_id", "_thread", "_stop_event", "counts")
+
+    def __init__(self, rate_hz: float, thread_id: int | None = None) -> None:
+        assert rate_hz > 0
+        self._interval_s: Final = 1 / rate_hz
+        self._thread_id: Final = (
+            thread_id if thread_id is not None else threading.get_ident()
+        )
+        self._thread: threading.Thread | None = None
+        self._stop_event: Final = threading.Event()
+        self.counts: Final[Counter[str]] = Counter()
+
+    def start(self) -> None:
+        assert self._thread is None
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def sample(self) -> None:
+        frame = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return
+        stack = get_collapsed_stack(frame)
+        del frame
+        if stack:
+            self.counts[stack] += 1
+
+    def get_collapsed_lines(self) -> list[str]:
+        """Lines in the collapsed-stack format read by flamegraph tools"""
+        return [f"{stack} {count}" for stack, count in self.counts.most_common()]
+
+    def write(self, path: str | Path) -> None:
+        with open(path, "w") as file:
+            file.writelines(line + "\n" for line in self.get_collapsed_lines())
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval_s):
+            self.sample()
+
+
+def get_collapsed_stack(frame: FrameType | None) -> str:
+    """Frames from the outermost to the innermost, separated by semicolons"""
+    labels: list[str] = []
+    while frame is not None:
+        filename = to_unix(frame.f_code.co_filename)
+        function_name = frame.f_code.co_name
+        if not any_match(exclude_patterns, target=filename):
+            if any_match(fold_patterns, target=filename) or any_match(
+                fold_function_patterns, target=function_name
+            ):
+                # the frames below are folded into this one
+                labels.clear()
+            labels.append(f"{simplify_filename(filename)}:{function_name}()")
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def simplify_filename(filename: str) -> str:
+    main_directory = to_unix(str(get_main_directory()))
+    if filename.startswith(main_directory):
+        return filename[len(main_directory) :].lstrip("/")
+    return PurePath(filename).name
+
+
+def to_unix(filename: str) -> str:
+    return filename.replace("\\", "/")
+
+
+def any_match(patterns: Iterable[str], *, target: str) -> bool:
+    return any(pattern in target for pattern in patterns)
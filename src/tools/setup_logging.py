@@ -1,27 +1,49 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path, PurePath
+from typing import Final
 
 _MAIN_DIRECTORY = PurePath(__file__).parents[2]
 
+# size-based rotation of each log file
+_MAX_LOG_BYTES: Final = 1_000_000
+_LOG_BACKUP_COUNT: Final = 3
+
+# records are queued by the loggers and written by a background thread
+_log_queue: Final[queue.SimpleQueue[logging.LogRecord]] = queue.SimpleQueue()
+_listener: logging.handlers.QueueListener | None = None
+
 
 def get_main_directory() -> PurePath:
     return _MAIN_DIRECTORY
 
 
 def configure_logger(name: str, level: int = logging.DEBUG) -> logging.Logger:
-    """Configure a logger and send its output to a file"""
+    """
+    Configure a logger and send its output to a rotating file. The logger only puts
+    the records in a queue; the file is written from a background thread.
+    """
     log_file_name = f"{name}.log"
     # Create a specific logger
     logger = logging.getLogger(name)
     logger.propagate = False  # Prevent propagation to the root logger
     logger.setLevel(level)  # Set the logger level
 
-    # Create a specific FileHandler to write to a file
+    # Create a specific RotatingFileHandler to write to a file
     path = Path(get_main_directory()) / "logs"  # pragma: no mutate
     if not path.exists():
         path.mkdir()
-    file_handler = logging.FileHandler(path / log_file_name, encoding="utf-8")
+    file_handler = logging.handlers.RotatingFileHandler(
+        path / log_file_name,
+        maxBytes=_MAX_LOG_BYTES,
+        backupCount=_LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
     file_handler.setLevel(level)  # Set the FileHandler level
+    # the listener is shared, so each file only takes the records of its logger
+    file_handler.addFilter(logging.Filter(name))
 
     # Create a formatter and add it to the FileHandler
     formatter = logging.Formatter(
@@ -29,9 +51,36 @@ def configure_logger(name: str, level: int = logging.DEBUG) -> logging.Logger:
     )
     file_handler.setFormatter(formatter)
 
-    # Add the FileHandler to the logger
-    logger.addHandler(file_handler)
+    # Add the QueueHandler to the logger, and the FileHandler to the listener
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _add_handler_to_listener(file_handler)
     logger.info("\n")
     logger.info("START")
 
     return logger
+
+
+def stop_logging() -> None:
+    """Writes the pending records and stops the background thread"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def _add_handler_to_listener(handler: logging.Handler) -> None:
+    global _listener
+    if _listener is None:
+        _listener = logging.handlers.QueueListener(
+            _log_queue, handler, respect_handler_level=True
+        )
+        _listener.start()
+    else:
+        # replacing the tuple is atomic, so the running thread sees either one
+        _listener.handlers = (*_listener.handlers, handler)
+
+
+atexit.register(stop_logging)
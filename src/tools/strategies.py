@@ -0,0 +1,57 @@
+"""Scripted ways of building a network, to run games without a player"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Final
+
+from src.engine.engine import Engine
+from src.entity import Station
+
+Strategy = Callable[[Engine, Sequence[Station]], None]
+
+
+def split_stations(stations: Sequence[Station], num_paths: int) -> list[list[Station]]:
+    """Interleaved groups of stations, sharing one station with the previous group"""
+    groups = [list(stations[i::num_paths]) for i in range(num_paths)]
+    for previous, group in zip(groups, groups[1:]):
+        group.insert(len(group) // 2, previous[len(previous) // 2])
+    return [group for group in groups if len(group) > 1]
+
+
+def no_paths(engine: Engine, stations: Sequence[Station]) -> None:
+    pass
+
+
+def left_to_right_paths(engine: Engine, stations: Sequence[Station]) -> None:
+    """Every allowed path, each one crossing the screen from left to right"""
+    ordered = sorted(
+        stations, key=lambda station: (station.position.left, station.position.top)
+    )
+    num_paths = min(engine.path_manager.max_num_paths, len(ordered) // 2)
+    engine.build_network(
+        [
+            ([station.id for station in stations_of_path], False)
+            for stations_of_path in split_stations(ordered, num_paths)
+        ]
+    )
+
+
+def nearest_neighbor_loop(engine: Engine, stations: Sequence[Station]) -> None:
+    """One looped path visiting the nearest unvisited station each time"""
+    if len(stations) < 3:
+        return
+    remaining = list(stations[1:])
+    tour = [stations[0]]
+    while remaining:
+        nearest = min(remaining, key=tour[-1].get_distance_to)
+        remaining.remove(nearest)
+        tour.append(nearest)
+    engine.build_network([([station.id for station in tour], True)])
+
+
+STRATEGIES: Final[dict[str, Strategy]] = {
+    "none": no_paths,
+    "left_to_right": left_to_right_paths,
+    "loop": nearest_neighbor_loop,
+}
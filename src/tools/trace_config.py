@@ -3,6 +3,7 @@ exclude_patterns: tuple[str, ...] = (
     "site-packages",
     "AppData",
     "<string>",
+    "<frozen",
 )
 
 custom_exclude_patterns = (
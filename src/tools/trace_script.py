@@ -1,12 +1,14 @@
+import argparse
 import datetime
 import linecache
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Final, Iterable
+from typing import Any, Final
 
 from src.main import main
 from src.tools import trace_config as config
+from src.tools.sampling_profiler import SamplingProfiler, any_match, to_unix
 from src.tools.setup_logging import get_main_directory
 
 exclude_patterns = config.exclude_patterns + config.custom_exclude_patterns
@@ -50,14 +52,6 @@ def simplify_filename(co_filename: str) -> str:
     return to_unix(co_filename.split(project_directory_name)[1][1:])
 
 
-def to_unix(filename: str) -> str:
-    return filename.replace("\\", "/")
-
-
-def any_match(patterns: Iterable[str], *, target: str) -> bool:
-    return any(pattern in target for pattern in patterns)
-
-
 def traceit(frame: Any, event: Any, arg: Any) -> Any:
     global i, last, last_function_name, jump
     if event == "line":
@@ -121,10 +115,52 @@ def write(text: str) -> None:
         file.write(text + "\n")
 
 
-if __name__ == "__main__":
+def run_line_tracer() -> None:
     write("")
     write("******************")
     write(str(datetime.datetime.now()))
     write("******************")
     sys.settrace(traceit)
     main()
+
+
+def run_sampling_profiler(rate_hz: float, output: str) -> None:
+    profiler = SamplingProfiler(rate_hz)
+    profiler.start()
+    try:
+        main()
+    finally:
+        profiler.stop()
+        profiler.write(output)
+        print(f"{sum(profiler.counts.values())} samples written to {output}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Runs the game tracing every line or sampling its stacks."
+    )
+    parser.add_argument(
+        "--sampling",
+        action="store_true",
+        help="Sample the stacks instead of tracing every line",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=1000, help="Samples per second (sampling mode)"
+    )
+    parser.add_argument(
+        "--output",
+        default=str(Path(get_main_directory()) / "profile.collapsed"),
+        help="Collapsed stacks output file (sampling mode)",
+    )
+    args, game_args = parser.parse_known_args()
+    # the remaining arguments are for the game
+    sys.argv = sys.argv[:1] + game_args
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.sampling:
+        run_sampling_profiler(args.rate, args.output)
+    else:
+        run_line_tracer()
@@ -1,43 +1,63 @@
+from dataclasses import dataclass
 from typing import Sequence
 
 from src.entity import Path, Station
-from src.graph.node import Node
+
+
+@dataclass(frozen=True)
+class Leg:
+    """A ride on a path, from the station where the passenger boards"""
+
+    path: Path
+    board_station: Station
+    alight_station: Station
 
 
 class TravelPlan:
     __slots__ = (
-        "next_path",
-        "next_station",
-        "node_path",
-        "next_station_idx",
+        "legs",
+        "next_leg_idx",
         "_passenger_num_id",
     )
 
-    def __init__(self, node_path: Sequence[Node], passenger_num_id: int) -> None:
-        self.next_path: Path | None = None
-        self.next_station: Station | None = None
-        self.node_path = node_path
-        self.next_station_idx = 0
+    def __init__(self, legs: Sequence[Leg], passenger_num_id: int) -> None:
+        self.legs = legs
+        self.next_leg_idx = 0
         self._passenger_num_id = passenger_num_id
 
-    def get_next_station(self) -> Station | None:
-        if len(self.node_path) > 0:
-            next_node = self.node_path[self.next_station_idx]
-            next_station = next_node.station
-            self.next_station = next_station
-            return next_station
+    @property
+    def remaining_legs(self) -> Sequence[Leg]:
+        return self.legs[self.next_leg_idx :]
+
+    @property
+    def next_leg(self) -> Leg | None:
+        if self.next_leg_idx < len(self.legs):
+            return self.legs[self.next_leg_idx]
         return None
 
-    def increment_next_station(self) -> None:
-        self.next_station_idx += 1
+    @property
+    def next_path(self) -> Path | None:
+        leg = self.next_leg
+        return leg.path if leg else None
+
+    @property
+    def next_station(self) -> Station | None:
+        """Where the passenger gets off the next path"""
+        leg = self.next_leg
+        return leg.alight_station if leg else None
+
+    def complete_leg(self) -> None:
+        self.next_leg_idx += 1
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, type(self)):
             return False
-        return self.next_path == value.next_path
+        return self.remaining_legs == value.remaining_legs
 
     def __repr__(self) -> str:
-        return f"TravelPlan(passenger_num_id={self._passenger_num_id}, node_path=({self.node_path})"
+        return (
+            f"TravelPlan(passenger_num_id={self._passenger_num_id}, legs=({self.legs})"
+        )
 
     def __str__(self) -> str:
         return f"TravelPlan (passenger {self._passenger_num_id}) = get on {self.next_path}, then get off at {self.next_station}"
@@ -1,4 +1,5 @@
 import colorsys
+import math
 import random
 from typing import Sequence, Tuple
 
@@ -10,26 +11,72 @@ from src.config import (
     station_shape_type_list,
     station_size,
 )
+from src.exceptions import InfeasibleDensityError
 from src.geometry.circle import Circle
 from src.geometry.point import Point
+from src.geometry.poisson_disk import poisson_disk_sample
 from src.geometry.polygons import Cross, Rect, Triangle
 from src.geometry.shape import Shape
 from src.geometry.type import ShapeType
+from src.tools.setup_logging import configure_logger
 from src.type import Color
 
+logger = configure_logger(__name__)
+
+_padding_ratio = 0.1
+_min_distance_reduction = 0.8
+# times the distance is reduced before giving up
+_max_distance_reductions = 5
+
 
 def get_random_position(width: int, height: int) -> Point:
-    padding_ratio = 0.1
     return Point(
         left=round(
-            width * (padding_ratio + np.random.rand() * (1 - padding_ratio * 2))
+            width * (_padding_ratio + np.random.rand() * (1 - _padding_ratio * 2))
         ),
         top=round(
-            height * (padding_ratio + np.random.rand() * (1 - padding_ratio * 2))
+            height * (_padding_ratio + np.random.rand() * (1 - _padding_ratio * 2))
         ),
     )
 
 
+def get_random_positions(
+    num: int, width: int, height: int, min_distance: float
+) -> list[Point]:
+    """
+    Random integer positions with the same padding as get_random_position, separated
+    by at least min_distance. If they don't fit, the distance is reduced a few times,
+    each reduction being logged. Raises InfeasibleDensityError if they still don't
+    fit.
+    """
+    padding = Point(width * _padding_ratio, height * _padding_ratio)
+    num_reductions = 0
+    while True:
+        try:
+            positions = poisson_disk_sample(
+                width * (1 - _padding_ratio * 2),
+                height * (1 - _padding_ratio * 2),
+                # rounding moves each position by less than sqrt(2) / 2
+                min_distance + math.sqrt(2),
+                num,
+            )
+        except InfeasibleDensityError:
+            if num_reductions == _max_distance_reductions:
+                raise
+            num_reductions += 1
+            min_distance *= _min_distance_reduction
+            logger.warning(
+                f"{num} positions don't fit, reducing the distance to {min_distance}"
+            )
+            continue
+        return [
+            Point(
+                round(position.left + padding.left), round(position.top + padding.top)
+            )
+            for position in positions
+        ]
+
+
 def get_random_color() -> Color:
     return hue_to_rgb(np.random.rand())
 
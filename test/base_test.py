@@ -17,6 +17,17 @@ from test.legacy_access import legacy_get_engine_stations
 from test.random_seed_config import RANDOM_SEED
 
 
+def create_path_through(engine: Engine, stations: Sequence[Station]) -> None:
+    """Creates a path the same way the mouse does. Repeat the first station to loop."""
+    wrapper = engine.path_manager.start_path_on_station(stations[0])
+    assert wrapper
+    next(wrapper)
+    for station in stations[1:]:
+        if wrapper.send(("mouse_motion", station)) == "exit":
+            return
+    assert wrapper.send(("mouse_up", stations[-1])) == "exit"
+
+
 class FixedRandomSeedTestCase(unittest.TestCase):
     def setUp(self) -> None:
         random.seed(RANDOM_SEED)
@@ -0,0 +1,46 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from src.config import Config
+from src.tools.batch_runner import RunSpec, run_game, write_results
+
+from test.base_test import BaseTestCase
+
+
+class TestBatchRunner(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._num_stations = Config.num_stations
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        Config.num_stations = self._num_stations
+
+    def test_games_are_reproducible_and_written_as_csv(self) -> None:
+        spec = RunSpec(seed=3, num_stations=8, strategy="left_to_right", duration_s=20)
+        first = run_game(spec)
+        second = run_game(spec)
+        self.assertEqual(first.score, second.score)
+        self.assertEqual(first.num_paths, 4)
+        self.assertGreater(first.ticks, 0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.csv")
+            write_results([first, second], path)
+            with open(path, newline="") as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["strategy"], "left_to_right")
+        self.assertEqual(int(rows[0]["score"]), first.score)
+
+    def test_loop_strategy_creates_a_looped_path(self) -> None:
+        result = run_game(
+            RunSpec(seed=1, num_stations=6, strategy="loop", duration_s=0)
+        )
+        self.assertEqual(result.num_paths, 1)
+        self.assertEqual(result.num_metros, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
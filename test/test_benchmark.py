@@ -0,0 +1,56 @@
+import unittest
+
+from benchmark.import_time import (
+    DEFERRED_MODULES,
+    ENGINE_MODULE,
+    OWN_IMPORT_TIME_BUDGET_MS,
+    measure_import_time,
+)
+from benchmark.report import compare, get_regressions
+from benchmark.scenario import ScenarioSize, create_engine
+from benchmark.suite import BenchmarkResult
+
+from test.base_test import BaseTestCase
+
+
+def _result(name: str, median_ms: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name, runs=1, min_ms=median_ms, median_ms=median_ms, p90_ms=median_ms
+    )
+
+
+class TestBenchmarkReport(unittest.TestCase):
+    def test_slower_benchmarks_beyond_tolerance_are_regressions(self) -> None:
+        results = [_result("a", 2), _result("b", 1.05), _result("new", 1)]
+        comparisons = compare(results, {"a": 1000, "b": 1000})
+        self.assertEqual([c.name for c in comparisons], ["a", "b"])
+        self.assertAlmostEqual(comparisons[0].change, -0.5)
+        regressions = get_regressions(comparisons, tolerance=0.1)
+        self.assertEqual([r.name for r in regressions], ["a"])
+
+
+class TestBenchmarkScenario(BaseTestCase):
+    def test_scenario_has_the_requested_size(self) -> None:
+        size = ScenarioSize("test", num_stations=12, num_paths=3, metros_per_path=2)
+        engine = create_engine(size)
+        components = engine._components  # pyright: ignore [reportPrivateUsage]
+        self.assertEqual(len(components.stations), 12)
+        self.assertEqual(len(components.paths), 3)
+        self.assertEqual(len(components.metros), 6)
+        connected = {station for path in components.paths for station in path.stations}
+        self.assertEqual(len(connected), 12)
+
+
+class TestImportTime(unittest.TestCase):
+    def test_engine_import_is_within_budget(self) -> None:
+        import_time = measure_import_time(ENGINE_MODULE, runs=3)
+        # the modules of the repo alone, pygame and numpy varying more by machine
+        self.assertLess(import_time.own_ms, OWN_IMPORT_TIME_BUDGET_MS)
+        self.assertLess(import_time.own_ms, import_time.total_ms)
+        self.assertIn("pygame", dict(import_time.get_slowest_dependencies(5)))
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, import_time.imported_modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+
+from src.config import station_color, station_size
+from src.engine.demand import (
+    GravityDemand,
+    PoissonDemand,
+    TimeOfDayDemand,
+    TraceDemand,
+    UniformDemand,
+)
+from src.engine.engine import Engine
+from src.entity import Station
+from src.geometry.circle import Circle
+from src.geometry.point import Point
+from src.geometry.polygons import Rect
+from src.geometry.type import ShapeType
+from src.passengers_mediator import PassengersMediator
+
+from test.base_test import FixedRandomSeedTestCase
+from test.legacy_access import legacy_get_engine_stations
+
+
+def _create_stations() -> list[Station]:
+    mediator = PassengersMediator()
+    rect = Rect(color=station_color, width=station_size, height=station_size)
+    circle = Circle(color=station_color, radius=round(station_size / 2))
+    return [
+        Station(rect, Point(0, 0), mediator),
+        Station(circle, Point(100, 0), mediator),
+        Station(rect, Point(200, 0), mediator),
+        Station(circle, Point(10000, 0), mediator),
+    ]
+
+
+class TestDemand(FixedRandomSeedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.stations = _create_stations()
+
+    def test_uniform_demand_has_one_passenger_per_station(self) -> None:
+        demand = UniformDemand().get_demand(self.stations, 1000, 1000)
+        self.assertEqual(demand.origins.tolist(), [0, 1, 2, 3])
+        self.assertIsNone(demand.destinations)
+
+    def test_poisson_demand_follows_the_rate(self) -> None:
+        model = PoissonDemand(rate=2)
+        self.assertEqual(len(model.get_demand(self.stations, 0, 0)), 0)
+        demand = model.get_demand(self.stations, 100_000, 100_000)
+        # 2 passengers per second, 4 stations, 100 seconds
+        self.assertAlmostEqual(len(demand) / 800, 1, delta=0.1)
+
+    def test_time_of_day_demand_is_zero_at_night(self) -> None:
+        model = TimeOfDayDemand(rate=10, profile=[0, 1, 1, 0], day_length_ms=4000)
+        self.assertEqual(len(model.get_demand(self.stations, 4010, 20)), 0)
+        self.assertGreater(len(model.get_demand(self.stations, 2000, 1000)), 0)
+
+    def test_gravity_demand_goes_to_near_stations_of_other_shape(self) -> None:
+        demand = GravityDemand(rate=5).get_demand(self.stations, 10_000, 10_000)
+        assert demand.destinations is not None
+        for origin, destination in zip(demand.origins, demand.destinations):
+            self.assertNotEqual(self.stations[origin].shape.type, destination)
+        from_first = [
+            destination
+            for origin, destination in zip(demand.origins, demand.destinations)
+            if origin == 0
+        ]
+        self.assertEqual(set(from_first), {ShapeType.CIRCLE})
+
+    def test_trace_demand_replays_events_of_each_interval(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.csv")
+            with open(path, "w") as file:
+                file.write("time_ms,station,destination\n")
+                file.write("0,0,circle\n1500,1,RECT\n1000,2,CIRCLE\n9000,7,RECT\n")
+            model = TraceDemand.from_file(path)
+        first = model.get_demand(self.stations, 1000, 1000)
+        self.assertEqual(first.origins.tolist(), [0, 2])
+        second = model.get_demand(self.stations, 2000, 1000)
+        self.assertEqual(second.origins.tolist(), [1])
+        self.assertEqual(second.destinations, [ShapeType.RECT])
+        # station 7 doesn't exist
+        self.assertEqual(len(model.get_demand(self.stations, 10_000, 8000)), 0)
+
+    def test_spawned_passengers_never_exceed_station_capacity(self) -> None:
+        engine = Engine()
+        engine.set_demand_model(PoissonDemand(rate=1000))
+        spawner = engine._passenger_spawner  # pyright: ignore [reportPrivateUsage]
+        for _ in range(3):
+            spawner.increment_time(1000)
+            spawner._spawn_passengers()  # pyright: ignore [reportPrivateUsage]
+        for station in legacy_get_engine_stations(engine):
+            self.assertEqual(station.occupation, station.capacity)
+            for passenger in station.passengers:
+                self.assertNotEqual(
+                    passenger.destination_shape.type, station.shape.type
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ import pygame
 
 from src.config import Config, station_color, station_size
 from src.engine.engine import Engine
+from src.engine.passenger_creator import PassengerCreator
 from src.engine.passenger_spawner import PassengerSpawner
 from src.entity import Station, get_random_stations
 from src.event.mouse import MouseEvent
@@ -72,6 +73,22 @@ class TestEngine(GameplayBaseTestCase):
             len(legacy_get_engine_stations(self.engine)),
         )
 
+    def test_passenger_creator_is_rebuilt_only_when_stations_change(self) -> None:
+        spawner = self.engine._passenger_spawner  # pyright: ignore [reportPrivateUsage]
+        with patch(
+            "src.engine.passenger_spawner.PassengerCreator", wraps=PassengerCreator
+        ) as creator_class:
+            spawner._spawn_passengers()  # pyright: ignore [reportPrivateUsage]
+            spawner._spawn_passengers()  # pyright: ignore [reportPrivateUsage]
+            self.assertEqual(creator_class.call_count, 1)
+            self._replace_stations(
+                get_random_stations(
+                    5, legacy_get_engine_passengers_mediator(self.engine)
+                )
+            )
+            spawner._spawn_passengers()  # pyright: ignore [reportPrivateUsage]
+            self.assertEqual(creator_class.call_count, 2)
+
     @patch.object(PassengerSpawner, "_spawn_passengers", new_callable=Mock)
     def test_is_passenger_spawn_time(self, mock_spawn_passengers: Any) -> None:
         # Run the game until first wave of passengers spawn
@@ -245,7 +262,7 @@ class TestEngine(GameplayBaseTestCase):
         for station in legacy_get_engine_stations(self.engine):
             for passenger in station.passengers:
                 assert passenger.travel_plan
-                self.assertEqual(len(passenger.travel_plan.node_path), 1)
+                self.assertEqual(len(passenger.travel_plan.legs), 1)
 
 
 if __name__ == "__main__":
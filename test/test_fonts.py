@@ -0,0 +1,24 @@
+import unittest
+
+import pygame
+
+from src.gui.fonts import get_font
+
+
+class TestFonts(unittest.TestCase):
+    def test_fonts_are_loaded_once_per_size(self) -> None:
+        font = get_font(20)
+        self.assertIs(get_font(20), font)
+        self.assertIsNot(get_font(30), font)
+        self.assertEqual(font.get_height(), get_font(20).get_height())
+
+    def test_fonts_are_reloaded_after_quitting(self) -> None:
+        font = get_font(20)
+        pygame.font.quit()
+        reloaded = get_font(20)
+        self.assertIsNot(reloaded, font)
+        self.assertGreater(reloaded.render("a", True, (0, 0, 0)).get_width(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
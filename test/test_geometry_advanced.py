@@ -1,16 +1,19 @@
+import math
 import unittest
 from copy import deepcopy
-from unittest.mock import create_autospec
+from unittest.mock import create_autospec, patch
 
 import pygame
 
 from src.config import Config
+from src.exceptions import InfeasibleDensityError
 from src.geometry.circle import Circle
 from src.geometry.line import Line
 from src.geometry.point import Point
+from src.geometry.poisson_disk import poisson_disk_sample
 from src.geometry.polygons import Rect, Triangle
 from src.geometry.types import create_degrees
-from src.utils import get_random_color, get_random_position
+from src.utils import get_random_color, get_random_position, get_random_positions
 
 from test.base_test import BaseTestCase
 
@@ -100,6 +103,19 @@ class TestGeometryAdvanced(BaseTestCase):
         rect.set_degrees(create_degrees(360))
         self.assertSequenceEqual(rect.points, rect_points)
 
+    def test_rect_rotated_points_are_only_computed_when_angle_changes(self) -> None:
+        rect = self._init_rect()
+        rect.set_degrees(create_degrees(90))
+        with patch.object(
+            Point, "rotate", autospec=True, return_value=Point(0, 0)
+        ) as rotate:
+            rect.draw(self.screen, self.position)
+            rect.draw(self.screen, self.position)
+            self.assertEqual(rotate.call_count, len(rect.points))
+            rect.set_degrees(create_degrees(180))
+            rect.draw(self.screen, self.position)
+            self.assertEqual(rotate.call_count, 2 * len(rect.points))
+
     def test_line_draw(self) -> None:
         line = self._init_line()
         line.draw(self.screen)
@@ -112,6 +128,43 @@ class TestGeometryAdvanced(BaseTestCase):
 
         self._draw.polygon.assert_called_once()
 
+    def test_poisson_disk_points_are_inside_area_and_far_apart(self) -> None:
+        min_distance = 50
+        points = poisson_disk_sample(400, 300, min_distance, 20)
+        self.assertEqual(len(points), 20)
+        for point in points:
+            self.assertTrue(0 <= point.left <= 400)
+            self.assertTrue(0 <= point.top <= 300)
+        for i, point in enumerate(points):
+            for other in points[i + 1 :]:
+                self.assertGreaterEqual(
+                    math.dist(point.to_tuple(), other.to_tuple()), min_distance
+                )
+
+    def test_poisson_disk_infeasible_density_raises(self) -> None:
+        with self.assertRaises(InfeasibleDensityError):
+            poisson_disk_sample(100, 100, 50, 100)
+
+    def test_random_positions_are_integers_far_apart(self) -> None:
+        min_distance = 50
+        positions = get_random_positions(20, 500, 400, min_distance)
+        self.assertEqual(len(positions), 20)
+        for i, position in enumerate(positions):
+            self.assertIsInstance(position.left, int)
+            self.assertIsInstance(position.top, int)
+            for other in positions[i + 1 :]:
+                self.assertGreaterEqual(
+                    math.dist(position.to_tuple(), other.to_tuple()), min_distance
+                )
+
+    def test_random_positions_reduce_the_distance_when_they_dont_fit(self) -> None:
+        positions = get_random_positions(100, 500, 400, 50)
+        self.assertEqual(len(positions), 100)
+
+    def test_random_positions_raise_when_they_never_fit(self) -> None:
+        with self.assertRaises(InfeasibleDensityError):
+            get_random_positions(1000, 10, 10, 5)
+
 
 if __name__ == "__main__":
     unittest.main()
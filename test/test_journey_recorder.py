@@ -0,0 +1,187 @@
+import unittest
+
+from src.config import station_color
+from src.engine.engine import Engine
+from src.engine.journey_recorder import NO_TICK, JourneyRecorder, StreamingHistogram
+from src.entity import Passenger, Station
+from src.entity.ids import EntityId
+from src.geometry.circle import Circle
+from src.geometry.point import Point
+from src.passengers_mediator import PassengersMediator
+from src.tools.strategies import left_to_right_paths
+
+from test.base_test import BaseTestCase
+
+PATH_1 = EntityId("Path-1")
+PATH_2 = EntityId("Path-2")
+
+
+class TestStreamingHistogram(BaseTestCase):
+    def test_percentiles_are_upper_bin_edges(self) -> None:
+        histogram = StreamingHistogram(bin_width=10, num_bins=20)
+        for value in range(100):
+            histogram.add(value)
+        stats = histogram.get_stats()
+        self.assertEqual(stats.num_samples, 100)
+        self.assertEqual(stats.p50_ticks, 50)
+        self.assertEqual(stats.p95_ticks, 100)
+        self.assertEqual(stats.p99_ticks, 100)
+
+    def test_large_values_go_to_the_last_bin(self) -> None:
+        histogram = StreamingHistogram(bin_width=10, num_bins=3)
+        histogram.add(5)
+        histogram.add(1000)
+        self.assertEqual(histogram.get_percentiles([50, 100]), [10, 30])
+
+    def test_overflows_mark_the_last_bin_as_saturated(self) -> None:
+        histogram = StreamingHistogram(bin_width=10, num_bins=3)
+        histogram.add(25)
+        self.assertFalse(histogram.get_stats().is_saturated(30))
+        histogram.add(30)
+        histogram.add(1000)
+        stats = histogram.get_stats()
+        self.assertEqual(stats.num_overflows, 2)
+        self.assertEqual(stats.max_ticks, 30)
+        self.assertEqual(stats.p99_ticks, 30)
+        self.assertTrue(stats.is_saturated(stats.p99_ticks))
+        self.assertFalse(stats.is_saturated(20))
+
+
+class TestJourneyRecorder(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.recorder = JourneyRecorder(bin_ticks=1, num_bins=1000)
+        mediator = PassengersMediator()
+        self.stations = [
+            Station(Circle(station_color, 30), Point(i * 100, 0), mediator)
+            for i in range(2)
+        ]
+
+    def _passenger(self) -> Passenger:
+        return Passenger(Circle(station_color, 10))
+
+    def test_journeys_are_timed(self) -> None:
+        passenger = self._passenger()
+        origin, transfer = self.stations
+        self.recorder.on_spawn(passenger, origin, 0)
+        self.recorder.on_board(passenger, origin, PATH_1, 30)
+        self.recorder.on_alight(passenger, PATH_1, 50)
+        self.recorder.on_board(passenger, transfer, PATH_2, 90)
+        self.assertEqual(self.recorder.spawn_ticks.tolist(), [0])
+        self.assertEqual(self.recorder.board_ticks.tolist(), [30])
+        self.recorder.on_arrival(passenger, PATH_2, 100)
+
+        # the row is freed
+        self.assertIsNone(self.recorder.get_row(passenger))
+        self.assertEqual(self.recorder.spawn_ticks.tolist(), [NO_TICK])
+        self.assertEqual(self.recorder.board_ticks.tolist(), [NO_TICK])
+        stats = self.recorder.get_stats()
+        assert stats.wait and stats.journey
+        self.assertEqual(stats.wait.num_samples, 2)
+        self.assertEqual(stats.journey.p50_ticks, 101)
+        self.assertEqual(stats.wait_by_station[origin.id].p50_ticks, 31)
+        self.assertEqual(stats.wait_by_station[transfer.id].p50_ticks, 41)
+        self.assertEqual(stats.journey_by_station[origin.id].num_samples, 1)
+        self.assertNotIn(transfer.id, stats.journey_by_station)
+        self.assertEqual(stats.ride_by_path[PATH_1].p50_ticks, 21)
+        self.assertEqual(stats.ride_by_path[PATH_2].p50_ticks, 11)
+        # the finished journey is kept
+        self.assertEqual(self.recorder.num_journeys, 1)
+        self.assertEqual(self.recorder.journey_spawn_ticks.tolist(), [0])
+        self.assertEqual(self.recorder.journey_board_ticks.tolist(), [30])
+        self.assertEqual(self.recorder.arrival_ticks.tolist(), [100])
+
+    def test_columns_grow(self) -> None:
+        passengers = [self._passenger() for _ in range(3000)]
+        for tick, passenger in enumerate(passengers):
+            self.recorder.on_spawn(passenger, self.stations[0], tick)
+        self.assertEqual(self.recorder.num_rows, 3000)
+        self.assertEqual(self.recorder.spawn_ticks[-1], 2999)
+        self.assertEqual(self.recorder.get_row(passengers[-1]), 2999)
+        self.assertTrue((self.recorder.board_ticks == NO_TICK).all())
+
+    def test_journey_columns_grow(self) -> None:
+        passengers = [self._passenger() for _ in range(3000)]
+        for tick, passenger in enumerate(passengers):
+            self.recorder.on_spawn(passenger, self.stations[0], tick)
+            self.recorder.on_arrival(passenger, PATH_1, tick + 7)
+        self.assertEqual(self.recorder.num_rows, 1)
+        self.assertEqual(self.recorder.num_journeys, 3000)
+        self.assertEqual(self.recorder.journey_spawn_ticks.tolist(), list(range(3000)))
+        self.assertTrue((self.recorder.journey_board_ticks == NO_TICK).all())
+        self.assertEqual(self.recorder.arrival_ticks.tolist(), list(range(7, 3007)))
+
+    def test_rows_of_arrived_passengers_are_reused(self) -> None:
+        first, second, third = (self._passenger() for _ in range(3))
+        origin, destination = self.stations
+        self.recorder.on_spawn(first, origin, 0)
+        self.recorder.on_spawn(second, origin, 5)
+        self.recorder.on_arrival(first, PATH_1, 10)
+        self.recorder.on_spawn(third, destination, 20)
+        self.assertEqual(self.recorder.get_row(third), 0)
+        self.assertEqual(self.recorder.num_rows, 2)
+        self.assertEqual(self.recorder.num_passengers, 2)
+        self.assertEqual(self.recorder.spawn_ticks.tolist(), [20, 5])
+        self.recorder.on_arrival(third, PATH_1, 50)
+        stats = self.recorder.get_stats()
+        self.assertEqual(stats.journey_by_station[destination.id].p50_ticks, 31)
+        self.assertEqual(self.recorder.journey_spawn_ticks.tolist(), [0, 20])
+        self.assertEqual(self.recorder.arrival_ticks.tolist(), [10, 50])
+
+    def test_passengers_not_spawned_are_ignored(self) -> None:
+        passenger = self._passenger()
+        self.recorder.on_board(passenger, self.stations[0], PATH_1, 10)
+        self.recorder.on_arrival(passenger, PATH_1, 20)
+        self.assertIsNone(self.recorder.get_row(passenger))
+        stats = self.recorder.get_stats()
+        self.assertIsNone(stats.wait)
+        self.assertIsNone(stats.journey)
+        self.assertEqual(self.recorder.num_journeys, 0)
+
+
+class TestEngineJourneyStats(BaseTestCase):
+    def test_games_record_waits_and_journeys(self) -> None:
+        engine = Engine()
+        components = engine._components  # pyright: ignore [reportPrivateUsage]
+        left_to_right_paths(engine, components.stations)
+        for _ in range(3000):
+            engine.increment_time(16)
+        stats = engine.get_journey_stats()
+        assert stats.wait and stats.journey
+        self.assertEqual(stats.journey.num_samples, components.status.score)
+        self.assertEqual(
+            components.journey_recorder.num_journeys, components.status.score
+        )
+        self.assertLessEqual(stats.wait.p50_ticks, stats.wait.p99_ticks)
+        self.assertTrue(set(stats.wait_by_path) <= {p.id for p in components.paths})
+        # the rows of the arrived passengers are reused
+        recorder = components.journey_recorder
+        self.assertEqual(recorder.num_passengers, len(components.passengers))
+        self.assertEqual(
+            (recorder.spawn_ticks != NO_TICK).sum(), recorder.num_passengers
+        )
+        self.assertLess(
+            recorder.num_rows, recorder.num_passengers + components.status.score
+        )
+
+    def test_riders_of_removed_paths_alight(self) -> None:
+        engine = Engine()
+        components = engine._components  # pyright: ignore [reportPrivateUsage]
+        station, destination = components.stations[:2]
+        path = engine.create_path([station.id, destination.id])
+        rider = Passenger(destination.shape)
+        station.add_new_passenger(rider)
+        components.journey_recorder.on_spawn(rider, station, 0)
+        station.move_passenger(rider, path.metros[0])
+        engine.remove_path(path.id)
+
+        # the rider is back at a station, still on its journey
+        self.assertIn(rider, components.passengers)
+        stats = engine.get_journey_stats()
+        self.assertEqual(stats.ride_by_path[path.id].num_samples, 1)
+        self.assertIsNone(stats.journey)
+        self.assertIsNotNone(components.journey_recorder.get_row(rider))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,9 @@
 import unittest
+from unittest.mock import patch
 
 from src.entity.segments.location import LocationService
 from src.entity.segments.padding_segment import GroupOfThreeStations
-from src.entity.segments.path_segment import StationPair
+from src.entity.segments.path_segment import PathSegment, StationPair
 from src.entity.station import Station
 from src.geometry.circle import Circle
 from src.geometry.point import Point
@@ -141,6 +142,52 @@ class TestLocation(unittest.TestCase):
         assert first_path_segment_edges.end != third_path_segment_edges.start
         assert first_path_segment_edges.end != third_path_segment_edges.end
 
+    def test_cached_edges_are_not_recomputed(self) -> None:
+        station_1, station_2, _ = self._create_stations(PassengersMediator())
+        stations = StationPair(station_1, station_2)
+        edges = self.location.get_path_segment_edges(stations, 1)
+        with patch("src.entity.segments.location._get_offset_vector") as offset:
+            self.assertEqual(self.location.get_path_segment_edges(stations, 1), edges)
+            offset.assert_not_called()
+
+    def test_retain_removes_positions_of_other_segments(self) -> None:
+        station_1, station_2, station_3 = self._create_stations(PassengersMediator())
+        kept = StationPair(station_1, station_2)
+        self.location.get_path_segment_edges(kept, 1)
+        self.location.get_path_segment_edges(StationPair(station_2, station_3), 1)
+
+        self.location.retain([kept])
+
+        self.assertEqual(
+            set(self.location.connection_positions),
+            {(station_1.id, station_2.id, 1), (station_2.id, station_1.id, 1)},
+        )
+
+    def test_max_size_evicts_least_recently_used(self) -> None:
+        location = LocationService(max_size=4)
+        station_1, station_2, station_3 = self._create_stations(PassengersMediator())
+        first = StationPair(station_1, station_2)
+        location.get_path_segment_edges(first, 1)
+        location.get_path_segment_edges(StationPair(station_2, station_3), 1)
+        location.get_path_segment_edges(first, 1)
+        location.get_path_segment_edges(StationPair(station_1, station_3), 1)
+
+        self.assertEqual(len(location.connection_positions), 4)
+        self.assertIn((station_1.id, station_2.id, 1), location.connection_positions)
+        self.assertNotIn((station_2.id, station_3.id, 1), location.connection_positions)
+
+    def test_locate_segment_sets_geometry(self) -> None:
+        passenger_mediator = PassengersMediator()
+        station_1 = Station(get_circle(), Point(100, 100), passenger_mediator)
+        station_2 = Station(get_circle(), Point(100, 400), passenger_mediator)
+        segment = PathSegment((0, 0, 0), station_1, station_2)
+
+        self.location.locate_segment(segment, 0)
+
+        self.assertEqual(segment.geometry.length, 300)
+        self.assertEqual(segment.geometry.direction, Point(0, 1))
+        self.assertEqual(segment.geometry.heading, 90)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,33 @@
+import logging
+import logging.handlers
+import unittest
+from unittest.mock import Mock
+
+from src.tools.frame_metrics import FrameMetricsLogger
+from src.tools.setup_logging import configure_logger
+
+
+class TestLogging(unittest.TestCase):
+    def test_frame_metrics_are_logged_once_per_interval(self) -> None:
+        logger = Mock(spec=logging.Logger)
+        logger.isEnabledFor.return_value = True
+        frame_metrics = FrameMetricsLogger(logger, interval_ms=100)
+        for _ in range(9):
+            frame_metrics.add_frame(10, fps=100)
+        logger.info.assert_not_called()
+        frame_metrics.add_frame(20, fps=90)
+        logger.info.assert_called_once()
+        _, num_frames, mean_dt_ms, max_dt_ms, fps = logger.info.call_args.args
+        self.assertEqual(num_frames, 10)
+        self.assertAlmostEqual(mean_dt_ms, 11)
+        self.assertEqual(max_dt_ms, 20)
+        self.assertEqual(fps, 90)
+
+    def test_configured_logger_only_enqueues_records(self) -> None:
+        logger = configure_logger("test_logging")
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIsInstance(logger.handlers[0], logging.handlers.QueueHandler)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,17 @@ class TestMediators(unittest.TestCase):
         with self.assertRaises(GameException):
             metro.add_new_passenger(passenger)
 
+    def test_raises_err_if_bulk_added_passenger_is_already_held(self) -> None:
+        passenger = Mock(spec=Passenger)
+        mediator = PassengersMediator()
+        station = Station(Mock(spec=Shape), Mock(spec=Point), mediator)
+        station.add_new_passenger(passenger)
+        metro = Metro(mediator)
+        with self.assertRaises(GameException):
+            Metro.add_new_passengers_to_holders(
+                [(metro, Mock(spec=Passenger)), (metro, passenger)]
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,184 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import PurePath
+
+import numpy as np
+import pygame
+
+from src.engine.engine import Engine
+from src.engine.game_components import GameComponents
+from src.observation import (
+    SHAPE_TYPES,
+    ObservationLayout,
+    PixelObservation,
+    SharedObservationReader,
+    SharedObservationWriter,
+    TensorObservationEncoder,
+)
+from src.observation.tensor_encoder import STATION_OCCUPATION, STATION_PRESENT
+
+from test.base_test import BaseTestCase, FixedRandomSeedTestCase, create_path_through
+
+
+class TestSharedObservation(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = Engine()
+        self.components: GameComponents = (
+            self.engine._components  # pyright: ignore [reportPrivateUsage]
+        )
+        stations = self.components.stations
+        create_path_through(self.engine, stations[:3])
+        self.engine._passenger_spawner._spawn_passengers()  # pyright: ignore [reportPrivateUsage]
+        self.layout = ObservationLayout(max_stations=16, max_paths=2, max_metros=2)
+        self.writer = SharedObservationWriter(self.layout)
+        self.reader = SharedObservationReader(self.writer.name, self.layout)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.reader.close()
+        self.writer.close()
+
+    def test_reader_sees_the_encoded_state_without_copies(self) -> None:
+        self.writer.write(self.components)
+        arrays = self.reader.arrays
+        stations = self.components.stations
+        num_stations = len(stations)
+        self.assertEqual(int(arrays["station_mask"].sum()), num_stations)
+        np.testing.assert_allclose(
+            arrays["station_positions"][0], stations[0].position.to_tuple()
+        )
+        self.assertEqual(
+            SHAPE_TYPES[arrays["station_shapes"][1]], stations[1].shape.type
+        )
+        self.assertEqual(
+            arrays["station_queues"][:num_stations].sum(axis=1).tolist(),
+            [station.occupation for station in stations],
+        )
+        self.assertEqual(arrays["path_membership"][0].tolist()[:4], [1, 1, 1, 0])
+        self.assertEqual(arrays["path_mask"].tolist(), [True, False])
+        self.assertEqual(arrays["metro_paths"].tolist(), [0, -1])
+        self.assertEqual(self.reader.version, 2)
+
+        self.writer.write(self.components)
+        # the same views are updated in place
+        self.assertEqual(self.reader.version, 4)
+        snapshot = self.reader.snapshot()
+        assert snapshot
+        self.assertFalse(np.shares_memory(snapshot["version"], arrays["version"]))
+
+    def test_snapshot_is_refused_while_writing(self) -> None:
+        self.writer.arrays["version"][0] = 1
+        self.assertTrue(self.reader.is_being_written())
+        self.assertIsNone(self.reader.snapshot())
+
+    def test_readers_in_other_processes_leave_the_block(self) -> None:
+        script = (
+            "from src.observation import ObservationLayout, SharedObservationReader\n"
+            "layout = ObservationLayout(max_stations=16, max_paths=2, max_metros=2)\n"
+            f"SharedObservationReader({self.writer.name!r}, layout).close()\n"
+        )
+        env = {
+            **os.environ,
+            "SDL_VIDEODRIVER": "dummy",
+            "PYGAME_HIDE_SUPPORT_PROMPT": "1",
+        }
+        process = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PurePath(__file__).parents[1],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertNotIn("leaked", process.stderr)
+        # the exit of the reader process didn't destroy the block
+        reader = SharedObservationReader(self.writer.name, self.layout)
+        reader.close()
+
+
+class TestTensorObservationEncoder(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = Engine()
+        self.components: GameComponents = (
+            self.engine._components  # pyright: ignore [reportPrivateUsage]
+        )
+        self.layout = ObservationLayout(max_stations=16, max_paths=2, max_metros=2)
+        self.encoder = TensorObservationEncoder(self.components, self.layout)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.encoder.close()
+
+    def test_arrays_have_fixed_shapes_and_are_reused(self) -> None:
+        arrays = self.encoder.update()
+        self.assertEqual(arrays["path_adjacency"].shape, (2, 16, 16))
+        self.assertEqual(arrays["passenger_counts"].shape, (18, len(SHAPE_TYPES)))
+        station_features = arrays["station_features"]
+        self.assertIs(self.encoder.update()["station_features"], station_features)
+        num_stations = len(self.components.stations)
+        self.assertEqual(station_features[:, STATION_PRESENT].sum(), num_stations)
+
+    def test_counts_are_updated_from_holder_events(self) -> None:
+        self.engine._passenger_spawner._spawn_passengers()  # pyright: ignore [reportPrivateUsage]
+        arrays = self.encoder.update()
+        for i, station in enumerate(self.components.stations):
+            self.assertEqual(arrays["passenger_counts"][i].sum(), station.occupation)
+            self.assertAlmostEqual(
+                float(arrays["station_features"][i, STATION_OCCUPATION]),
+                station.occupation / station.capacity,
+                places=5,
+            )
+
+    def test_adjacency_links_consecutive_stations(self) -> None:
+        stations = self.components.stations
+        create_path_through(self.engine, stations[:3])
+        adjacency = self.encoder.update()["path_adjacency"]
+        self.assertEqual(adjacency[0, 0, 1], 1)
+        self.assertEqual(adjacency[0, 1, 0], 1)
+        self.assertEqual(adjacency[0, 1, 2], 1)
+        self.assertEqual(adjacency[0, 0, 2], 0)
+        self.assertEqual(adjacency[0].sum(), 4)
+        self.assertEqual(adjacency[1].sum(), 0)
+
+    def test_unchanged_paths_are_not_rewritten(self) -> None:
+        create_path_through(self.engine, self.components.stations[:3])
+        adjacency = self.encoder.update()["path_adjacency"]
+        # a write would reset the tampered cell
+        adjacency[0, 5, 6] = 1
+        self.encoder.update()
+        self.assertEqual(adjacency[0, 5, 6], 1)
+        self.components.paths[0].update_segments()
+        self.encoder.update()
+        self.assertEqual(adjacency[0, 5, 6], 0)
+
+
+class TestPixelObservation(FixedRandomSeedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        pygame.init()
+        self.engine = Engine()
+
+    def test_observation_is_downsampled_into_the_same_array(self) -> None:
+        pixel_observation = PixelObservation(self.engine, size=(160, 84))
+        observation = pixel_observation.render()
+        self.assertEqual(observation.shape, (84, 160, 3))
+        self.assertIs(pixel_observation.render(), observation)
+        self.assertEqual(pixel_observation.pixels.shape, (840, 1600, 3))
+        # stations and the gui are drawn over the background
+        self.assertGreater(len(np.unique(observation.reshape(-1, 3), axis=0)), 1)
+
+    def test_pixels_are_views_of_the_surface(self) -> None:
+        pixel_observation = PixelObservation(self.engine, size=None)
+        observation = pixel_observation.render()
+        self.assertIs(observation, pixel_observation.pixels)
+        pixel_observation.surface.fill((1, 2, 3))
+        self.assertEqual(observation[0, 0].tolist(), [1, 2, 3])
+        self.assertEqual(observation[-1, -1].tolist(), [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import patch
+
+from src.config import station_color
+from src.engine.engine import Engine
+from src.engine.game_components import GameComponents
+from src.engine.passenger_mover import PassengerMover
+from src.engine.passenger_queues import PassengerQueues
+from src.entity import Metro, Passenger, Path, Station
+from src.entity.holder import Holder
+from src.geometry.circle import Circle
+from src.geometry.point import Point
+from src.geometry.polygons import Rect
+from src.passengers_mediator import PassengersMediator
+from src.travel_plan import Leg, TravelPlan
+
+from test.base_test import BaseTestCase
+
+
+class TestPassengerQueues(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.mediator = PassengersMediator()
+        self.queues = PassengerQueues()
+        self.stations = [
+            Station(Circle(station_color, 30), Point(0, 0), self.mediator),
+            Station(Rect(station_color, 30, 30), Point(100, 0), self.mediator),
+        ]
+        self.paths = [Path((0, 0, 0), 0), Path((0, 0, 0), 1)]
+        for path in self.paths:
+            path.set_stations(self.stations, is_looped=False)
+        self.metro = Metro(self.mediator)
+        self.paths[0].add_metro(self.metro)
+
+    def _passenger(self, path: Path) -> Passenger:
+        passenger = Passenger(Rect(station_color, 10, 10))
+        passenger.travel_plan = TravelPlan(
+            [Leg(path, self.stations[0], self.stations[1])], passenger.num_id
+        )
+        return passenger
+
+    def test_waiting_passengers_are_queued_by_next_path(self) -> None:
+        station = self.stations[0]
+        first, second = self._passenger(self.paths[0]), self._passenger(self.paths[1])
+        Holder.add_new_passengers_to_holders([(station, first), (station, second)])
+        for passenger in (first, second):
+            self.queues.add_waiting(station, passenger)
+        self.assertEqual(self.queues.get_boarding(station, self.paths[0].id), [first])
+        self.assertEqual(self.queues.get_boarding(station, self.paths[1].id), [second])
+
+        # stale entries are dropped when read
+        station.move_passenger(first, self.metro)
+        self.assertEqual(self.queues.get_boarding(station, self.paths[0].id), [])
+
+    def test_riding_passengers_are_bucketed_by_stop(self) -> None:
+        passenger = self._passenger(self.paths[0])
+        self.metro.add_new_passenger(passenger)
+        self.queues.add_riding(self.metro, passenger)
+        self.assertEqual(
+            self.queues.get_alighting(self.metro, self.stations[1]), [passenger]
+        )
+        self.assertEqual(self.queues.get_alighting(self.metro, self.stations[0]), [])
+        self.assertEqual(
+            self.queues.get_arriving(self.metro, self.stations[1]), [passenger]
+        )
+        self.assertEqual(self.queues.get_arriving(self.metro, self.stations[0]), [])
+
+        self.queues.remove_riding(self.metro, passenger)
+        self.assertEqual(self.queues.get_alighting(self.metro, self.stations[1]), [])
+        self.assertEqual(self.queues.get_arriving(self.metro, self.stations[1]), [])
+
+    def test_passengers_never_queued_are_ignored_when_removed(self) -> None:
+        passenger = self._passenger(self.paths[0])
+        self.metro.add_new_passenger(passenger)
+        self.queues.remove_riding(self.metro, passenger)
+        self.queues.remove_waiting(self.stations[0], self.paths[0].id, passenger)
+        self.assertEqual(self.queues.get_arriving(self.metro, self.stations[1]), [])
+
+
+class TestArrivalBoarding(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = Engine()
+        self.components: GameComponents = (
+            self.engine._components  # pyright: ignore [reportPrivateUsage]
+        )
+        origin = self.components.stations[0]
+        destination = next(
+            station
+            for station in self.components.stations
+            if station.shape.type != origin.shape.type
+        )
+        self.arrivals: list[Metro] = []
+        self.components.passengers_mediator.add_arrival_listener(self.arrivals.append)
+        self.path = self.engine.create_path([origin.id, destination.id])
+        self.passenger = Passenger(destination.shape)
+        origin.add_new_passenger(self.passenger)
+
+    def test_passengers_move_once_per_stop(self) -> None:
+        with patch.object(
+            PassengerMover,
+            "on_metro_arrival",
+            autospec=True,
+            side_effect=PassengerMover.on_metro_arrival,
+        ) as on_metro_arrival:
+            for _ in range(2000):
+                self.engine.increment_time(16)
+        num_arrivals = len(self.arrivals)
+        self.assertGreater(num_arrivals, 2)
+        # the last arrival may be handled on the next tick
+        self.assertIn(on_metro_arrival.call_count, (num_arrivals, num_arrivals - 1))
+        self.assertTrue(self.passenger.is_at_destination)
+        self.assertGreaterEqual(self.components.status.score, 1)
+        self.assertNotIn(self.passenger, self.components.passengers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,15 @@
 import unittest
 from math import ceil
 from typing import Final
-from unittest.mock import create_autospec
+from unittest.mock import create_autospec, patch
 
 import pygame
 
 from src.config import metro_speed_per_ms
 from src.entity import Metro, Path, Station, get_random_station, get_random_stations
+from src.entity.path.path import build_travel_steps_mapping
 from src.geometry.point import Point
+from src.geometry.polygons import Polygon
 from src.passengers_mediator import PassengersMediator
 from src.utils import get_random_color, get_random_position, get_random_station_shape
 
@@ -97,6 +99,28 @@ class TestPath(BaseTestCase):
 
         self.assertTrue(path.stations[1].contains(metro.position))
 
+    def test_metro_moves_along_the_segment_using_its_progress(self) -> None:
+        path = Path(get_random_color(), 0)
+        path.add_station(
+            Station(get_random_station_shape(), Point(0, 0), self.passengers_mediator)
+        )
+        path.add_station(
+            Station(
+                get_random_station_shape(), Point(300, 400), self.passengers_mediator
+            )
+        )
+        metro = Metro(self.passengers_mediator)
+        path.add_metro(metro)
+
+        ticks = 10
+        for _ in range(ticks):
+            path.move_metro(metro, dt_ms)
+
+        expected_progress = ticks * dt_ms * metro_speed_per_ms
+        self.assertAlmostEqual(metro.segment_progress, expected_progress)
+        self.assertAlmostEqual(metro.position.left, expected_progress * 0.6)
+        self.assertAlmostEqual(metro.position.top, expected_progress * 0.8)
+
     def test_metro_turns_around_when_it_reaches_the_end(self) -> None:
         path = Path(get_random_color(), 0)
         path.add_station(
@@ -121,6 +145,99 @@ class TestPath(BaseTestCase):
 
         self.assertFalse(metro.is_forward)
 
+    def test_metro_rotation_follows_segment_heading(self) -> None:
+        path = Path(get_random_color(), 0)
+        path.add_station(
+            Station(get_random_station_shape(), Point(0, 0), self.passengers_mediator)
+        )
+        dist_in_one_sec = 1000 * metro_speed_per_ms
+        path.add_station(
+            Station(
+                get_random_station_shape(),
+                Point(0, dist_in_one_sec),
+                self.passengers_mediator,
+            )
+        )
+        metro = Metro(self.passengers_mediator)
+        path.add_metro(metro)
+        assert isinstance(metro.shape, Polygon)
+
+        path.move_metro(metro, dt_ms)
+        self.assertEqual(metro.shape.degrees, 90)
+
+        for _ in range(framerate + 1):
+            path.move_metro(metro, dt_ms)
+        self.assertFalse(metro.is_forward)
+        self.assertEqual(metro.shape.degrees, 270)
+
+    def test_update_segments_keeps_segments_not_affected_by_the_edit(self) -> None:
+        path = Path(get_random_color(), 0)
+        stations = [
+            Station(get_random_station_shape(), Point(x, 0), self.passengers_mediator)
+            for x in (0, 200, 400)
+        ]
+        path.add_station(stations[0])
+        path.add_station(stations[1])
+        metro = Metro(self.passengers_mediator)
+        path.add_metro(metro)
+        for _ in range(10):
+            path.move_metro(metro, dt_ms)
+        first_segment = legacy_path_segments(path)[0]
+        position = metro.position
+        progress = metro.segment_progress
+
+        path.add_station(stations[2])
+
+        segments = legacy_path_segments(path)
+        self.assertEqual(len(segments), 3)
+        self.assertIs(segments[0], first_segment)
+        self.assertIs(metro.current_segment, first_segment)
+        self.assertEqual(metro.position, position)
+        self.assertEqual(metro.segment_progress, progress)
+
+    def test_update_segments_relocates_metro_on_removed_segment(self) -> None:
+        path = Path(get_random_color(), 0)
+        stations = [
+            Station(get_random_station_shape(), Point(x, 0), self.passengers_mediator)
+            for x in (0, 200, 400)
+        ]
+        for station in stations:
+            path.add_station(station)
+        metro = Metro(self.passengers_mediator)
+        path.add_metro(metro)
+        for _ in range(10):
+            path.move_metro(metro, dt_ms)
+        position = metro.position
+
+        path.stations.remove(stations[1])
+        path.update_segments()
+
+        self.assertEqual(len(legacy_path_segments(path)), 1)
+        self.assertIs(metro.current_segment, legacy_path_segments(path)[0])
+        self.assertTrue(metro.is_forward)
+        self.assertEqual(metro.position, position)
+
+    def test_update_segments_builds_the_travel_steps_once(self) -> None:
+        path = Path(get_random_color(), 0)
+        stations = [
+            Station(get_random_station_shape(), Point(x, 0), self.passengers_mediator)
+            for x in (0, 200, 400)
+        ]
+        path.set_stations(stations[:2], is_looped=False)
+        metros = [Metro(self.passengers_mediator) for _ in range(3)]
+        for metro in metros:
+            path.add_metro(metro)
+        with patch(
+            "src.entity.path.path.build_travel_steps_mapping",
+            wraps=build_travel_steps_mapping,
+        ) as build_mapping:
+            path.add_station(stations[2])
+        build_mapping.assert_called_once()
+        for metro in metros:
+            for _ in range(100):
+                path.move_metro(metro, dt_ms)
+            self.assertIn(metro.current_segment, legacy_path_segments(path))
+
     def test_metro_loops_around_the_path(self) -> None:
         path = Path(get_random_color(), 0)
         path.add_station(
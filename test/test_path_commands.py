@@ -0,0 +1,337 @@
+import unittest
+from unittest.mock import patch
+
+from src.config import max_num_paths
+from src.engine.engine import Engine
+from src.engine.game_components import GameComponents
+from src.engine.travel_plan_finder import TravelPlanFinder
+from src.entity import Passenger, Path
+from src.entity.segments import PaddingSegment
+from src.exceptions import InvalidActionError
+from src.graph.routing import Router
+from src.travel_plan import Leg
+
+from test.base_test import BaseTestCase, create_path_through
+
+
+class TestPathCommands(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = Engine()
+        self.components: GameComponents = (
+            self.engine._components  # pyright: ignore [reportPrivateUsage]
+        )
+        self.stations = self.components.stations
+        self.ids = [station.id for station in self.stations]
+
+    def test_create_path_matches_the_mouse(self) -> None:
+        path = self.engine.create_path(self.ids[:3])
+        self.assertEqual(path.stations, self.stations[:3])
+        self.assertFalse(path.is_looped)
+        self.assertEqual(len(path.metros), 1)
+        self.assertIn(path, self.components.gui.path_to_button)
+
+        create_path_through(self.engine, self.stations[3:6])
+        by_mouse = self.components.paths[1]
+        self.assertEqual(
+            len(path.get_path_segments()), len(by_mouse.get_path_segments())
+        )
+
+    def test_create_looped_path(self) -> None:
+        path = self.engine.create_path(self.ids[:3], loop=True)
+        self.assertTrue(path.is_looped)
+        self.assertEqual(len(path.get_path_segments()), 3)
+
+    def test_segments_are_rebuilt_once_per_command(self) -> None:
+        path = self.engine.create_path(self.ids[:3], loop=True)
+        self.assertEqual(path.version, 1)
+        self.engine.insert_station(path.id, 3, self.ids[3])
+        self.assertEqual(path.version, 2)
+
+    def test_invalid_paths_are_refused(self) -> None:
+        for station_ids, loop in [
+            (self.ids[:1], False),
+            (self.ids[:2], True),
+            ([self.ids[0], self.ids[1], self.ids[0]], False),
+        ]:
+            with self.assertRaises(InvalidActionError):
+                self.engine.create_path(station_ids, loop)
+        with self.assertRaises(InvalidActionError):
+            self.engine.create_path([self.ids[0], "unknown"])  # type: ignore [list-item]
+        self.assertEqual(self.components.paths, [])
+
+    def test_paths_are_limited(self) -> None:
+        for i in range(max_num_paths):
+            self.engine.create_path([self.ids[i], self.ids[i + 1]])
+        with self.assertRaises(InvalidActionError):
+            self.engine.create_path(self.ids[:2])
+
+    def test_extend_path(self) -> None:
+        path = self.engine.create_path(self.ids[1:3])
+        self.engine.extend_path(path.id, "start", self.ids[0])
+        self.engine.extend_path(path.id, "end", self.ids[3])
+        self.assertEqual(path.stations, self.stations[:4])
+        with self.assertRaises(InvalidActionError):
+            self.engine.extend_path(path.id, "end", self.ids[1])
+        # reaching the other end closes the loop
+        self.engine.extend_path(path.id, "end", self.ids[0])
+        self.assertTrue(path.is_looped)
+        with self.assertRaises(InvalidActionError):
+            self.engine.extend_path(path.id, "end", self.ids[4])
+
+    def test_insert_and_remove_stations(self) -> None:
+        path = self.engine.create_path([self.ids[0], self.ids[1], self.ids[3]])
+        with self.assertRaises(InvalidActionError):
+            self.engine.insert_station(path.id, 3, self.ids[2])
+        # the metro starts on the first segment
+        self.engine.insert_station(path.id, 2, self.ids[2])
+        self.assertEqual(path.stations, self.stations[:4])
+        self.engine.remove_station(path.id, self.ids[2])
+        self.engine.remove_station(path.id, self.ids[3])
+        self.assertEqual(path.stations, self.stations[:2])
+        with self.assertRaises(InvalidActionError):
+            self.engine.remove_station(path.id, self.ids[0])
+
+    def test_segments_with_metros_are_not_edited(self) -> None:
+        path = self.engine.create_path(self.ids[:2])
+        with self.assertRaises(InvalidActionError):
+            self.engine.insert_station(path.id, 1, self.ids[2])
+        self.assertEqual(path.stations, self.stations[:2])
+
+    def test_stations_next_to_metros_are_not_removed(self) -> None:
+        path = self.engine.create_path(self.ids[:3])
+        metro_segment = path.get_path_segments()[0]
+        self.assertEqual(path.metros[0].current_segment, metro_segment)
+        for station_id in self.ids[:2]:
+            with self.assertRaises(InvalidActionError):
+                self.engine.remove_station(path.id, station_id)
+        self.assertEqual(path.stations, self.stations[:3])
+        self.engine.remove_station(path.id, self.ids[2])
+        self.assertEqual(path.stations, self.stations[:2])
+
+    def test_stations_with_metros_turning_around_are_not_removed(self) -> None:
+        path = self.engine.create_path(self.ids[:3])
+        metro, station = path.metros[0], self.stations[1]
+        for _ in range(2000):
+            self.engine.increment_time(16)
+            segment = metro.current_segment
+            if (
+                isinstance(segment, PaddingSegment)
+                and segment.stations.current is station
+            ):
+                break
+        else:
+            self.fail("the metro never turned around the station")
+        position = metro.position
+        with self.assertRaises(InvalidActionError):
+            self.engine.remove_station(path.id, station.id)
+        self.assertEqual(path.stations, self.stations[:3])
+        self.assertEqual(metro.position, position)
+
+    def test_remove_path(self) -> None:
+        path = self.engine.create_path(self.ids[:3])
+        self.engine.remove_path(path.id)
+        self.assertEqual(self.components.paths, [])
+        self.assertEqual(self.components.metros, [])
+        with self.assertRaises(InvalidActionError):
+            self.engine.remove_path(path.id)
+
+    def test_riders_of_a_removed_path_go_back_to_their_last_station(self) -> None:
+        path = self.engine.create_path(self.ids[:3])
+        station, metro = self.stations[0], path.metros[0]
+        rider = Passenger(self.stations[2].shape)
+        station.add_new_passenger(rider)
+        station.move_passenger(rider, metro)
+        self.assertIs(rider.last_station, station)
+        while station.has_room():
+            station.add_new_passenger(Passenger(self.stations[2].shape))
+        self.engine.remove_path(path.id)
+        # even over capacity
+        self.assertIn(rider, station.passengers)
+        self.assertEqual(station.occupation, station.capacity + 1)
+
+    def test_riders_of_a_removed_path_are_replanned_where_they_land(self) -> None:
+        path = self.engine.create_path(self.ids[:3])
+        station, metro = self.stations[0], path.metros[0]
+        destination = next(
+            other
+            for other in self.stations[3:]
+            if other.shape.type != station.shape.type
+        )
+        other_path = self.engine.create_path([station.id, destination.id])
+        rider = Passenger(destination.shape)
+        station.add_new_passenger(rider)
+        station.move_passenger(rider, metro)
+        self.engine.remove_path(path.id)
+        self.assertIn(rider, station.passengers)
+        assert rider.travel_plan
+        self.assertEqual(
+            rider.travel_plan.legs, [Leg(other_path, station, destination)]
+        )
+
+    def test_riders_get_off_when_their_destination_is_removed(self) -> None:
+        destination = self.stations[0]
+        others = [
+            station
+            for station in self.stations
+            if station.shape.type != destination.shape.type
+        ][:3]
+        path = self.engine.create_path([s.id for s in [*others, destination]])
+        board, metro = others[0], path.metros[0]
+        rider = Passenger(destination.shape)
+        board.add_new_passenger(rider)
+        self.engine._travel_plan_finder.find_travel_plan_for_passengers()  # pyright: ignore [reportPrivateUsage]
+        assert rider.travel_plan
+        self.assertEqual(rider.travel_plan.legs, [Leg(path, board, destination)])
+        board.move_passenger(rider, metro)
+        self.components.passenger_queues.add_riding(metro, rider)
+
+        # the destination was the only station of its shape in the network
+        self.engine.remove_station(path.id, destination.id)
+        assert rider.travel_plan
+        self.assertEqual(rider.travel_plan.legs, [Leg(path, board, others[1])])
+        for _ in range(1000):
+            self.engine.increment_time(16)
+            if rider not in metro.passengers:
+                break
+        self.assertIn(rider, others[1].passengers)
+
+    def test_commands_are_refused_while_editing_with_the_mouse(self) -> None:
+        wrapper = self.engine.path_manager.start_path_on_station(self.stations[0])
+        assert wrapper
+        next(wrapper)
+        with self.assertRaises(InvalidActionError):
+            self.engine.create_path(self.ids[1:3])
+
+
+class TestBuildNetwork(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = Engine()
+        self.components: GameComponents = (
+            self.engine._components  # pyright: ignore [reportPrivateUsage]
+        )
+        self.ids = [station.id for station in self.components.stations]
+
+    def test_network_is_replaced_with_one_rebuild_per_path(self) -> None:
+        old_path = self.engine.create_path(self.ids[:2])
+        with patch.object(
+            TravelPlanFinder,
+            "find_travel_plan_for_passengers",
+            autospec=True,
+        ) as find_travel_plans:
+            paths = self.engine.build_network(
+                [(self.ids[:4], False), (self.ids[4:8], True)]
+            )
+        find_travel_plans.assert_called_once()
+        self.assertEqual(self.components.paths, paths)
+        self.assertNotIn(old_path, self.components.paths)
+        self.assertEqual([path.version for path in paths], [1, 1])
+        self.assertEqual([len(path.stations) for path in paths], [4, 4])
+        self.assertTrue(paths[1].is_looped)
+        self.assertEqual(len(self.components.metros), 2)
+        self.assertEqual(
+            set(self.components.gui.path_to_button), set(self.components.paths)
+        )
+
+    def test_invalid_designs_leave_the_network_unchanged(self) -> None:
+        path = self.engine.create_path(self.ids[:2])
+        with self.assertRaises(InvalidActionError):
+            self.engine.build_network([(self.ids[:3], False), (self.ids[:1], False)])
+        with self.assertRaises(InvalidActionError):
+            self.engine.build_network([(self.ids[:2], False)] * (max_num_paths + 1))
+        self.assertEqual(self.components.paths, [path])
+
+    def test_riders_are_replanned_with_one_routing_update(self) -> None:
+        old_paths = self.engine.build_network(
+            [(self.ids[:3], False), (self.ids[3:6], False)]
+        )
+        riders = []
+        for path in old_paths:
+            station, metro = path.stations[0], path.metros[0]
+            rider = Passenger(path.stations[-1].shape)
+            station.add_new_passenger(rider)
+            station.move_passenger(rider, metro)
+            riders.append(rider)
+        with patch.object(
+            Router,
+            "_build_graph",
+            autospec=True,
+            side_effect=Router._build_graph,  # pyright: ignore [reportPrivateUsage]
+        ) as build_graph:
+            self.engine.build_network([(self.ids[:4], False), (self.ids[4:8], True)])
+        build_graph.assert_called_once()
+        for rider in riders:
+            self.assertTrue(
+                any(rider in station.passengers for station in self.components.stations)
+            )
+            self.assertIsNotNone(rider.travel_plan)
+
+
+class TestReplanning(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = Engine()
+        self.components: GameComponents = (
+            self.engine._components  # pyright: ignore [reportPrivateUsage]
+        )
+        self.ids = [station.id for station in self.components.stations]
+        half = len(self.ids) // 2
+        self.first, self.second = self.engine.build_network(
+            [(self.ids[: half + 1], False), (self.ids[half:], False)]
+        )
+        for _ in range(3):
+            self.engine._passenger_spawner._spawn_passengers()  # pyright: ignore [reportPrivateUsage]
+        self.engine._travel_plan_finder.find_travel_plan_for_passengers()  # pyright: ignore [reportPrivateUsage]
+        self.travel_plans = {
+            passenger: passenger.travel_plan
+            for station in self.components.stations
+            for passenger in station.passengers
+        }
+
+    def _get_passengers_using(self, path: Path) -> set[Passenger]:
+        return {
+            passenger
+            for passenger, travel_plan in self.travel_plans.items()
+            if travel_plan and any(leg.path is path for leg in travel_plan.legs)
+        }
+
+    def test_only_the_passengers_of_a_removed_path_are_replanned(self) -> None:
+        affected = self._get_passengers_using(self.second)
+        self.assertTrue(affected)
+        self.assertTrue(set(self.travel_plans) - affected)
+        with patch.object(
+            Router, "find_route", autospec=True, side_effect=Router.find_route
+        ) as find_route:
+            self.engine.remove_path(self.second.id)
+        self.assertEqual(find_route.call_count, len(affected))
+        for passenger, travel_plan in self.travel_plans.items():
+            if passenger in affected:
+                new_travel_plan = passenger.travel_plan
+                assert new_travel_plan
+                self.assertNotIn(
+                    self.second, [leg.path for leg in new_travel_plan.legs]
+                )
+            else:
+                self.assertIs(passenger.travel_plan, travel_plan)
+
+    def test_edited_paths_replan_their_passengers(self) -> None:
+        affected = self._get_passengers_using(self.first)
+        # away from the metro, which starts on the first segment
+        station = self.first.stations[2]
+        self.engine.remove_station(self.first.id, station.id)
+        for passenger, travel_plan in self.travel_plans.items():
+            new_travel_plan = passenger.travel_plan
+            assert new_travel_plan
+            if passenger not in affected:
+                self.assertIs(new_travel_plan, travel_plan)
+            elif new_travel_plan.legs:
+                self.assertIn(
+                    new_travel_plan.legs[0].board_station, self.components.stations
+                )
+                for leg in new_travel_plan.legs:
+                    self.assertIn(leg.alight_station, leg.path.stations)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import create_autospec
+
+import pygame
+
+from src.engine.engine import Engine
+from src.engine.profiler import PhaseProfiler
+
+from test.base_test import BaseTestCase
+
+
+class TestPhaseProfiler(unittest.TestCase):
+    def test_percentiles_of_recorded_durations(self) -> None:
+        profiler = PhaseProfiler(buffer_size=100)
+        timer = profiler.measure("phase")
+        for duration in range(1, 101):
+            timer.record(duration)
+        stats = profiler.get_stats("phase")
+        assert stats
+        self.assertAlmostEqual(stats.p50_ms, 50.5)
+        self.assertAlmostEqual(stats.p99_ms, 99.01)
+        self.assertEqual(stats.num_samples, 100)
+
+    def test_ring_buffer_keeps_last_samples(self) -> None:
+        profiler = PhaseProfiler(buffer_size=3)
+        timer = profiler.measure("phase")
+        for duration in [100, 100, 1, 1, 1]:
+            timer.record(duration)
+        stats = profiler.get_stats("phase")
+        assert stats
+        self.assertEqual(stats.num_samples, 3)
+        self.assertEqual(stats.p99_ms, 1)
+
+    def test_disabled_profiler_records_nothing(self) -> None:
+        profiler = PhaseProfiler(buffer_size=3)
+        profiler.enabled = False
+        with profiler.measure("phase"):
+            pass
+        self.assertIsNone(profiler.get_stats("phase"))
+        self.assertEqual(profiler.get_all_stats(), {})
+
+
+class TestEngineProfiling(BaseTestCase):
+    def test_engine_phases_are_measured(self) -> None:
+        engine = Engine()
+        engine.increment_time(16)
+        engine.render(create_autospec(pygame.surface.Surface))
+        self.assertEqual(
+            set(engine.get_phase_stats()),
+            {"travel plans", "passengers", "metros", "spawning", "render"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import unittest
+from unittest.mock import patch
+
+from src.config import station_color, station_size
+from src.entity import Path, Station
+from src.geometry.circle import Circle
+from src.geometry.point import Point
+from src.geometry.polygons import Rect
+from src.geometry.type import ShapeType
+from src.graph.routing import Router
+from src.passengers_mediator import PassengersMediator
+from src.travel_plan import Leg, TravelPlan
+
+from test.base_test import BaseTestCase
+
+PENALTY = 100
+
+
+class TestRouter(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.mediator = PassengersMediator()
+        self.router = Router(PENALTY)
+
+    def _circle(self, left: float, top: float) -> Station:
+        shape = Circle(color=station_color, radius=round(station_size / 2))
+        return Station(shape, Point(left, top), self.mediator)
+
+    def _rect(self, left: float, top: float) -> Station:
+        shape = Rect(color=station_color, width=station_size, height=station_size)
+        return Station(shape, Point(left, top), self.mediator)
+
+    def _path(
+        self, stations: list[Station], order: int = 0, is_looped: bool = False
+    ) -> Path:
+        path = Path((0, 0, 0), order)
+        path.set_stations(stations, is_looped=is_looped)
+        return path
+
+    def test_shortest_distance_wins_over_fewer_stations(self) -> None:
+        origin, destination = self._circle(0, 0), self._rect(300, 0)
+        detour = self._path([origin, self._circle(150, 1000), destination])
+        straight = self._path(
+            [origin, self._circle(100, 0), self._circle(200, 0), destination], 1
+        )
+        stations = [*detour.stations, *straight.stations[1:3]]
+        self.router.update(stations, [detour, straight])
+        route = self.router.find_route(origin, ShapeType.RECT, [destination])
+        assert route
+        self.assertEqual(route.legs, [Leg(straight, origin, destination)])
+        self.assertAlmostEqual(route.cost, 300)
+
+    def test_transfers_are_penalized(self) -> None:
+        origin, transfer, destination = (
+            self._circle(0, 0),
+            self._circle(100, 0),
+            self._rect(100, 100),
+        )
+        first = self._path([origin, transfer])
+        second = self._path([transfer, destination], 1)
+        self.router.update([origin, transfer, destination], [first, second])
+        route = self.router.find_route(origin, ShapeType.RECT, [destination])
+        assert route
+        self.assertEqual(
+            route.legs,
+            [Leg(first, origin, transfer), Leg(second, transfer, destination)],
+        )
+        self.assertAlmostEqual(route.cost, 200 + PENALTY)
+
+        # a longer ride without transfers becomes cheaper
+        direct = self._path([origin, self._circle(0, 120), destination], 2)
+        stations = [origin, transfer, destination, direct.stations[1]]
+        self.router.update(stations, [first, second, direct])
+        route = self.router.find_route(origin, ShapeType.RECT, [destination])
+        assert route
+        self.assertEqual([leg.path for leg in route.legs], [direct])
+
+    def test_unreachable_destinations_have_no_route(self) -> None:
+        origin, other, destination = (
+            self._circle(0, 0),
+            self._circle(100, 0),
+            self._rect(100, 100),
+        )
+        path = self._path([origin, other])
+        self.router.update([origin, other, destination], [path])
+        self.assertIsNone(self.router.find_route(origin, ShapeType.RECT, [destination]))
+        self.assertIsNone(
+            self.router.find_route(destination, ShapeType.CIRCLE, [origin, other])
+        )
+
+    def test_riding_passengers_stay_on_their_path_first(self) -> None:
+        board, middle, transfer, destination = (
+            self._circle(0, 0),
+            self._circle(100, 0),
+            self._circle(200, 0),
+            self._rect(200, 100),
+        )
+        riding = self._path([board, middle, transfer])
+        other = self._path([transfer, destination], 1)
+        stations = [board, middle, transfer, destination]
+        self.router.update(stations, [riding, other])
+        route = self.router.find_route_from_path(
+            riding, board, ShapeType.RECT, [destination]
+        )
+        assert route
+        self.assertEqual(
+            route.legs,
+            [Leg(riding, board, transfer), Leg(other, transfer, destination)],
+        )
+        # the destination is on the path
+        route = self.router.find_route_from_path(
+            other, transfer, ShapeType.RECT, [destination]
+        )
+        assert route
+        self.assertEqual(route.legs, [Leg(other, transfer, destination)])
+        self.assertIsNone(
+            self.router.find_route_from_path(
+                self._path([board, middle], 2), board, ShapeType.RECT, [destination]
+            )
+        )
+
+    def test_loops_are_only_ridden_forward(self) -> None:
+        destination, origin = self._rect(0, 0), self._circle(100, 0)
+        loop = self._path(
+            [destination, origin, self._circle(100, 100), self._circle(0, 100)],
+            is_looped=True,
+        )
+        self.router.update(loop.stations, [loop])
+        route = self.router.find_route(origin, ShapeType.RECT, [destination])
+        assert route
+        self.assertEqual(route.legs, [Leg(loop, origin, destination)])
+        # around the loop, not back to the previous station
+        self.assertAlmostEqual(route.cost, 300)
+
+    def test_trees_are_cached_until_the_network_changes(self) -> None:
+        origin, destination = self._circle(0, 0), self._rect(100, 0)
+        path = self._path([origin, destination])
+        stations = [origin, destination]
+        with patch.object(
+            Router, "_build_tree", autospec=True, side_effect=Router._build_tree
+        ) as build_tree:
+            for _ in range(3):
+                self.router.update(stations, [path])
+                self.router.find_route(origin, ShapeType.RECT, [destination])
+            self.assertEqual(build_tree.call_count, 1)
+            path.set_stations([destination, origin], is_looped=False)
+            self.router.update(stations, [path])
+            self.router.find_route(origin, ShapeType.RECT, [destination])
+            self.assertEqual(build_tree.call_count, 2)
+
+
+class TestTravelPlan(BaseTestCase):
+    def test_legs_are_followed_in_order(self) -> None:
+        mediator = PassengersMediator()
+        stations = [
+            Station(Circle(station_color, 30), Point(i * 100, 0), mediator)
+            for i in range(3)
+        ]
+        paths = [Path((0, 0, 0), 0), Path((0, 0, 0), 1)]
+        legs = [
+            Leg(paths[0], stations[0], stations[1]),
+            Leg(paths[1], stations[1], stations[2]),
+        ]
+        travel_plan = TravelPlan(legs, 0)
+        self.assertIs(travel_plan.next_path, paths[0])
+        self.assertIs(travel_plan.next_station, stations[1])
+        travel_plan.complete_leg()
+        self.assertIs(travel_plan.next_path, paths[1])
+        self.assertIs(travel_plan.next_station, stations[2])
+        travel_plan.complete_leg()
+        self.assertIsNone(travel_plan.next_path)
+        self.assertIsNone(travel_plan.next_station)
+
+
+if __name__ == "__main__":
+    unittest.main()
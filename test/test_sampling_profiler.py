@@ -0,0 +1,48 @@
+import sys
+import time
+import unittest
+
+from src.tools.sampling_profiler import SamplingProfiler, get_collapsed_stack
+
+
+def _busy_loop(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _leaf() -> str:
+    return get_collapsed_stack(sys._getframe())
+
+
+def _draw_something() -> str:
+    return _leaf()
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def test_samples_the_running_function(self) -> None:
+        profiler = SamplingProfiler(rate_hz=500)
+        profiler.start()
+        _busy_loop(0.2)
+        profiler.stop()
+        self.assertGreater(len(profiler.counts), 0)
+        top_stack = profiler.get_collapsed_lines()[0]
+        self.assertIn("test/test_sampling_profiler.py:_busy_loop()", top_stack)
+
+    def test_frames_under_excluded_functions_are_folded(self) -> None:
+        stack = _draw_something()
+        self.assertTrue(stack.endswith("_draw_something()"), stack)
+        self.assertNotIn("_leaf", stack)
+
+    def test_stack_goes_from_outermost_to_innermost(self) -> None:
+        labels = _leaf().split(";")
+        self.assertEqual(labels[-1], "test/test_sampling_profiler.py:_leaf()")
+        self.assertIn(
+            "test/test_sampling_profiler.py:"
+            "test_stack_goes_from_outermost_to_innermost()",
+            labels,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import Mock
+
+import pygame
+
+from src.gui.text_cache import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.font = Mock(spec=pygame.font.Font)
+        self.font.render.side_effect = lambda *args: Mock(spec=pygame.surface.Surface)
+
+    def test_same_text_is_rendered_once(self) -> None:
+        cache = TextCache(max_size=4)
+        first = cache.render(self.font, "Score: 1", (0, 0, 0))
+        second = cache.render(self.font, "Score: 1", (0, 0, 0))
+        self.assertIs(first, second)
+        self.font.render.assert_called_once_with("Score: 1", True, (0, 0, 0))
+
+    def test_color_is_part_of_the_key(self) -> None:
+        cache = TextCache(max_size=4)
+        cache.render(self.font, "Score: 1", (0, 0, 0))
+        cache.render(self.font, "Score: 1", (255, 255, 255))
+        self.assertEqual(self.font.render.call_count, 2)
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache = TextCache(max_size=2)
+        first = cache.render(self.font, "a", (0, 0, 0))
+        cache.render(self.font, "b", (0, 0, 0))
+        # "a" becomes the most recently used, so "b" is evicted
+        cache.render(self.font, "a", (0, 0, 0))
+        cache.render(self.font, "c", (0, 0, 0))
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.render(self.font, "a", (0, 0, 0)), first)
+        self.assertEqual(self.font.render.call_count, 3)
+        cache.render(self.font, "b", (0, 0, 0))
+        self.assertEqual(self.font.render.call_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()